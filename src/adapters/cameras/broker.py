@@ -0,0 +1,315 @@
+import time
+import weakref
+import threading
+from typing import Literal
+from collections import deque
+
+import numpy as np
+
+from src.core.ports import Camera, CameraProperties
+from src.exceptions import CameraReadError
+from src.core.logging import get_logger
+from src.core.affinity import pin_thread
+
+DropPolicy = Literal["oldest", "newest"]
+
+# Количество последних разосланных кадров, с которыми сравнивается память нового кадра
+RECENT_FRAMES = 32
+
+logger = get_logger("cameras.broker")
+
+
+class CameraSubscription:
+    """
+    Подписка на кадры :class:`CameraBroker`.
+
+    Реализует контракт :class:`Camera`, поэтому может передаваться любому
+    потребителю кадров (пайплайну, записи, визуализации) вместо камеры.
+    """
+
+    def __init__(
+        self,
+        broker: "CameraBroker",
+        queue_size: int = 2,
+        drop_policy: DropPolicy = "oldest",
+        read_timeout: float = 1.0,
+    ):
+        """
+        Инициализирует подписку.
+
+        :param broker: Брокер кадров.
+        :type broker: CameraBroker
+        :param queue_size: Максимальное количество кадров в очереди подписчика.
+        :type queue_size: int, optional
+        :param drop_policy: Политика при переполнении очереди:
+            ``oldest`` - вытесняется самый старый кадр очереди,
+            ``newest`` - отбрасывается поступивший кадр.
+        :type drop_policy: DropPolicy, optional
+        :param read_timeout: Время ожидания кадра в :meth:`read` (в секундах).
+        :type read_timeout: float, optional
+        """
+        self.broker = broker
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self.read_timeout = read_timeout
+
+        self._frames: deque[tuple[np.ndarray, float]] = deque()
+        self._condition = threading.Condition()
+        self._error: Exception | None = None
+        self._dropped: int = 0
+        self._frame_timestamp: float = time.monotonic()
+
+    @property
+    def dropped(self) -> int:
+        """
+        Количество кадров, отброшенных из-за переполнения очереди.
+
+        :return: Количество отброшенных кадров.
+        :rtype: int
+        """
+        return self._dropped
+
+    def open(self) -> None:
+        """Запускает чтение камеры брокером."""
+        self.broker.start()
+
+    def read(self) -> np.ndarray:
+        """
+        Возвращает очередной кадр из очереди подписчика.
+
+        Кадр разделяется между всеми подписчиками и доступен только для чтения.
+
+        :raises CameraReadError: Если брокер не смог прочитать кадр
+            или кадр не получен за :attr:`read_timeout`.
+        :return: Кадр в формате ``H x W x C``.
+        :rtype: numpy.ndarray
+        """
+        self.broker.start()
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._frames or self._error is not None,
+                timeout=self.read_timeout,
+            )
+            if self._frames:
+                frame, self._frame_timestamp = self._frames.popleft()
+                return frame
+            if self._error is not None:
+                raise CameraReadError("Camera broker failed to read frame") from self._error
+
+        raise CameraReadError(f"No frame from camera broker within {self.read_timeout}s")
+
+    def close(self) -> None:
+        """Отменяет подписку. Камера закрывается после отмены последней подписки."""
+        self.broker.unsubscribe(self)
+
+    def get_frame_timestamp(self) -> float:
+        """
+        Возвращает момент захвата последнего считанного подписчиком кадра камерой брокера.
+
+        :return: Момент захвата по часам :func:`time.monotonic` (в секундах).
+        :rtype: float
+        """
+        return self._frame_timestamp
+
+    def get_actual_properties(self) -> CameraProperties:
+        """
+        Возвращает параметры видеопотока камеры брокера.
+
+        :return: Ширина, высота и FPS.
+        :rtype: CameraProperties
+        """
+        return self.broker.camera.get_actual_properties()
+
+    def _put(self, frame: np.ndarray, captured_at: float) -> None:
+        """
+        Помещает кадр в очередь согласно политике :attr:`drop_policy`.
+
+        :param frame: Кадр.
+        :type frame: np.ndarray
+        :param captured_at: Момент захвата кадра по часам :func:`time.monotonic`.
+        :type captured_at: float
+        """
+        with self._condition:
+            self._error = None
+
+            if len(self._frames) >= self.queue_size:
+                self._dropped += 1
+                if self.drop_policy == "newest":
+                    return
+                self._frames.popleft()
+
+            self._frames.append((frame, captured_at))
+            self._condition.notify()
+
+    def _fail(self, error: Exception) -> None:
+        """
+        Сообщает подписчику об ошибке чтения камеры.
+
+        :param error: Ошибка чтения.
+        :type error: Exception
+        """
+        with self._condition:
+            self._error = error
+            self._condition.notify_all()
+
+
+class CameraBroker:
+    """
+    Брокер кадров камеры для нескольких потребителей.
+
+    Камера читается одним фоновым потоком, каждый кадр декодируется один раз
+    и раздается всем подписчикам без копирования. Кадры помечаются доступными
+    только для чтения. Каждый подписчик имеет собственную ограниченную очередь,
+    поэтому медленный подписчик теряет кадры, но не замедляет остальных.
+
+    Камера - источник кадров обязана возвращать каждый кадр в собственном массиве,
+    который она не изменяет после возврата (камеры проекта этому удовлетворяют,
+    в том числе :class:`FFmpegCamera`, читающая каждый кадр в новый массив). Брокер проверяет это: если новый кадр разделяет память с ранее
+    разосланным кадром, который еще используется, камера считается переиспользующей
+    буферы, и далее брокер раздает копии кадров.
+    """
+
+    def __init__(self, camera: Camera, retry_interval: float = 1.0):
+        """
+        Инициализирует брокер кадров.
+
+        :param camera: Камера - источник кадров.
+        :type camera: Camera
+        :param retry_interval: Пауза перед повторным чтением после ошибки камеры (в секундах).
+        :type retry_interval: float, optional
+        """
+        self.camera = camera
+        self.retry_interval = retry_interval
+
+        self._lock = threading.Lock()
+        self._subscriptions: list[CameraSubscription] = []
+        self._reader: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._recent: deque[weakref.ref[np.ndarray]] = deque(maxlen=RECENT_FRAMES)
+        self._copy_frames = False
+
+    def subscribe(
+        self,
+        queue_size: int = 2,
+        drop_policy: DropPolicy = "oldest",
+        read_timeout: float = 1.0,
+    ) -> CameraSubscription:
+        """
+        Создает подписку на кадры камеры.
+
+        :param queue_size: Максимальное количество кадров в очереди подписчика.
+        :type queue_size: int, optional
+        :param drop_policy: Политика при переполнении очереди.
+        :type drop_policy: DropPolicy, optional
+        :param read_timeout: Время ожидания кадра (в секундах).
+        :type read_timeout: float, optional
+        :return: Подписка, реализующая контракт :class:`Camera`.
+        :rtype: CameraSubscription
+        """
+        subscription = CameraSubscription(
+            broker=self,
+            queue_size=queue_size,
+            drop_policy=drop_policy,
+            read_timeout=read_timeout,
+        )
+
+        with self._lock:
+            self._subscriptions = [*self._subscriptions, subscription]
+
+        return subscription
+
+    def unsubscribe(self, subscription: CameraSubscription) -> None:
+        """
+        Отменяет подписку. После отмены последней подписки брокер останавливается.
+
+        :param subscription: Подписка.
+        :type subscription: CameraSubscription
+        """
+        with self._lock:
+            self._subscriptions = [sub for sub in self._subscriptions if sub is not subscription]
+            is_last = not self._subscriptions
+
+        if is_last:
+            self.close()
+
+    def start(self) -> None:
+        """Запускает фоновое чтение камеры, если оно еще не запущено."""
+        with self._lock:
+            if self._reader is not None:
+                return
+
+            self.camera.open()
+            self._stop_event.clear()
+            self._reader = threading.Thread(target=self._reader_loop, daemon=True)
+            self._reader.start()
+
+    def close(self) -> None:
+        """Останавливает фоновое чтение и закрывает камеру."""
+        with self._lock:
+            reader, self._reader = self._reader, None
+
+        if reader is None:
+            return
+
+        self._stop_event.set()
+        reader.join()
+        self.camera.close()
+
+    def _reader_loop(self) -> None:
+        """Читает кадры камеры и раздает их подписчикам."""
+        pin_thread("capture")
+
+        while not self._stop_event.is_set():
+            try:
+                frame = self.camera.read()
+            except Exception as error:
+                logger.warning("Camera read failed", extra={"error": str(error)})
+                for subscription in self._subscriptions:
+                    subscription._fail(error)
+                time.sleep(self.retry_interval)
+                continue
+
+            captured_at = self.camera.get_frame_timestamp()
+
+            # Кадр разделяется между подписчиками и не должен изменяться ими
+            frame = self._own(frame)
+            frame.flags.writeable = False
+
+            for subscription in self._subscriptions:
+                subscription._put(frame, captured_at)
+
+    def _own(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Возвращает кадр, память которого не будет изменена камерой.
+
+        Кадр копируется, если камера переиспользует буферы: новый кадр разделяет
+        память с ранее разосланным кадром, на который еще есть ссылки.
+        Повторный возврат того же массива допустим, если он по-прежнему доступен
+        только для чтения (например, кэшированный кадр).
+
+        :param frame: Кадр камеры.
+        :type frame: np.ndarray
+        :return: Кадр, который можно раздавать подписчикам.
+        :rtype: np.ndarray
+        """
+        if self._copy_frames:
+            return frame.copy()
+
+        for ref in self._recent:
+            previous = ref()
+            if previous is None:
+                continue
+            # Тот же массив допустим, только если после раздачи он остался доступным только для чтения
+            reused = frame.flags.writeable if previous is frame else np.may_share_memory(previous, frame)
+            if reused:
+                logger.error(
+                    "Camera reuses frame buffers, broker copies frames",
+                    extra={"camera": type(self.camera).__name__},
+                )
+                self._copy_frames = True
+                self._recent.clear()
+                return frame.copy()
+
+        self._recent.append(weakref.ref(frame))
+        return frame
@@ -0,0 +1,233 @@
+import time
+import select
+import contextlib
+import subprocess
+
+import numpy as np
+
+from src.core.ports import CameraProperties
+from src.exceptions import CameraOpenError, CameraReadError
+from src.core.logging import get_logger
+from src.core.metrics import MetricsRegistry
+from src.app.configs.cameras import FFmpegCameraConfig
+
+logger = get_logger("cameras.ffmpeg")
+
+
+class FFmpegCamera:
+    """
+    Адаптер камеры на базе процесса FFmpeg.
+
+    Декодирование (в том числе аппаратное), масштабирование и конвертация формата
+    пикселей выполняются процессом FFmpeg. Кадры в формате rawvideo читаются из канала
+    напрямую в массив кадра без промежуточных копий.
+
+    Каждый кадр читается в собственный новый массив и доступен только для чтения,
+    поэтому камера никогда не перезаписывает выданные кадры, и их можно передавать
+    в другие потоки (брокер, подписчики событий, запись) без копирования.
+    """
+
+    def __init__(self, config: FFmpegCameraConfig, metrics: MetricsRegistry | None = None):
+        """
+        Инициализирует камеру на базе FFmpeg.
+
+        :param config: Конфигурация камеры FFmpeg.
+        :type config: FFmpegCameraConfig
+        :param metrics: Реестр метрик для публикации длительности чтения кадра (``camera.read``),
+            количества кадров (``camera.frames``) и перезапусков процесса (``camera.restarts``).
+        :type metrics: MetricsRegistry | None, optional
+        """
+        self.source = config.source
+        self.width = config.width
+        self.height = config.height
+        self.fps = config.fps
+        self.convert_to_rgb = config.convert_to_rgb
+        self.hwaccel = config.hwaccel
+        self.input_format = config.input_format
+        self.rtsp_transport = config.rtsp_transport
+        self.stall_timeout = config.stall_timeout
+        self.max_restarts = config.max_restarts
+        self.ffmpeg_path = config.ffmpeg_path
+        self.metrics = metrics
+
+        self._frame_size = self.width * self.height * 3
+        self._frame_timestamp: float = time.monotonic()
+
+        self._process: subprocess.Popen | None = None
+        self._is_open: bool = False
+
+    def open(self) -> None:
+        """
+        Запускает процесс FFmpeg.
+
+        :raises CameraOpenError: Если процесс FFmpeg не удалось запустить.
+        """
+        if self._is_open:
+            return
+
+        self._start_process()
+        self._is_open = True
+
+    def close(self) -> None:
+        """Останавливает процесс FFmpeg."""
+        self._stop_process()
+        self._is_open = False
+
+    def read(self) -> np.ndarray:
+        """
+        Считывает кадр из канала FFmpeg.
+
+        Если данные не поступают дольше :attr:`stall_timeout` или процесс завершился,
+        то процесс перезапускается, а чтение повторяется.
+
+        :raises CameraReadError: Если кадр не получен после :attr:`max_restarts` перезапусков.
+        :return: Полученный кадр.
+        :rtype: numpy.ndarray
+        """
+        if not self._is_open:
+            self.open()
+
+        read_start = time.monotonic()
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+
+        for _ in range(self.max_restarts + 1):
+            if self._read_into(frame):
+                self._frame_timestamp = time.monotonic()
+                frame.flags.writeable = False
+
+                if self.metrics is not None:
+                    self.metrics.observe("camera.read", self._frame_timestamp - read_start)
+                    self.metrics.increment("camera.frames")
+
+                return frame
+
+            logger.warning("FFmpeg stalled, restarting", extra={"source": self.source})
+            if self.metrics is not None:
+                self.metrics.increment("camera.restarts")
+            self._stop_process()
+            self._start_process()
+
+        raise CameraReadError(f"Couldn't read frame from ffmpeg after {self.max_restarts} restarts")
+
+    def get_frame_timestamp(self) -> float:
+        """
+        Возвращает момент получения последнего считанного кадра из канала FFmpeg.
+
+        :return: Момент получения по часам :func:`time.monotonic` (в секундах).
+        :rtype: float
+        """
+        return self._frame_timestamp
+
+    def get_actual_properties(self) -> CameraProperties:
+        """
+        Возвращает параметры выходного видеопотока.
+
+        :return: Ширина, высота и FPS.
+        :rtype: CameraProperties
+        """
+        return CameraProperties(
+            width=self.width,
+            height=self.height,
+            fps=float(self.fps or 0.0),
+        )
+
+    def _read_into(self, buffer: np.ndarray) -> bool:
+        """
+        Заполняет буфер одним кадром из канала FFmpeg.
+
+        :param buffer: Буфер кадра.
+        :type buffer: np.ndarray
+        :return: ``True``, если кадр считан целиком; ``False`` - при остановке потока.
+        :rtype: bool
+        """
+        stdout = self._process.stdout
+        memory = memoryview(buffer.reshape(-1))
+
+        received = 0
+        while received < self._frame_size:
+            ready, _, _ = select.select([stdout], [], [], self.stall_timeout)
+            if not ready:
+                return False
+
+            size = stdout.readinto(memory[received:])
+            if not size:
+                return False
+
+            received += size
+
+        return True
+
+    def _build_command(self) -> list[str]:
+        """
+        Формирует аргументы командной строки FFmpeg.
+
+        :return: Аргументы командной строки.
+        :rtype: list[str]
+        """
+        command = [self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-nostdin"]
+
+        if self.hwaccel is not None:
+            command += ["-hwaccel", self.hwaccel]
+
+        if self.source.startswith("rtsp://"):
+            command += [
+                "-rtsp_transport", self.rtsp_transport,
+                "-fflags", "nobuffer",
+                "-flags", "low_delay",
+            ]
+        elif self.source.startswith("/dev/"):
+            command += ["-f", "v4l2"]
+            if self.input_format is not None:
+                command += ["-input_format", self.input_format]
+            if self.fps is not None:
+                command += ["-framerate", str(self.fps)]
+
+        filters = [f"scale={self.width}:{self.height}"]
+        if self.fps is not None:
+            filters.append(f"fps={self.fps}")
+
+        command += [
+            "-i", self.source,
+            "-an",
+            "-vf", ",".join(filters),
+            "-pix_fmt", "rgb24" if self.convert_to_rgb else "bgr24",
+            "-f", "rawvideo",
+            "pipe:1",
+        ]
+
+        return command
+
+    def _start_process(self) -> None:
+        """
+        Запускает процесс FFmpeg.
+
+        :raises CameraOpenError: Если процесс FFmpeg не удалось запустить.
+        """
+        try:
+            self._process = subprocess.Popen(
+                self._build_command(),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        except OSError as error:
+            raise CameraOpenError(f"Couldn't start ffmpeg for source: {self.source}") from error
+
+    def _stop_process(self) -> None:
+        """Останавливает процесс FFmpeg."""
+        if self._process is None:
+            return
+
+        with contextlib.suppress(Exception):
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+        with contextlib.suppress(Exception):
+            self._process.stdout.close()
+
+        self._process = None
@@ -5,9 +5,10 @@ import numpy as np
 from src.core.ports import CameraProperties
 from src.app.configs.cameras import MockCameraConfig
 from src.app.configs.cameras.mock import SourceConfig, VideoSourceConfig
-from src.app.configs.cameras.mock import DirectorySourceConfig
+from src.app.configs.cameras.mock import DirectorySourceConfig, SyntheticSourceConfig
 
-from .sources import FrameSource, VideoFrameSource, DirectoryFrameSource
+from .sources import FrameCache, FrameSource, VideoFrameSource, PrefetchFrameSource
+from .sources import DirectoryFrameSource, SyntheticFrameSource
 
 
 class MockCamera:
@@ -20,15 +21,25 @@ class MockCamera:
         :param config: Конфигцрация моковой камеры.
         :type config: MockCameraConfig
         """
+        cache = None
+        if config.cache_mb is not None:
+            cache = FrameCache(max_bytes=int(config.cache_mb * 1024 ** 2))
+
         self.source: FrameSource = self._create_source(
             source_config=config.source,
             width=config.width,
             height=config.height,
+            cache=cache,
         )
+        if config.prefetch > 0:
+            self.source = PrefetchFrameSource(self.source, depth=config.prefetch)
+
         self.fps = config.fps
+        self.throttle = config.throttle
 
         self._frame_interval = 1.0 / self.fps
         self._last_frame_time = None
+        self._frame_timestamp: float = time.monotonic()
 
     def open(self) -> None:
         """Инициализирует моковый источник видеопотока."""
@@ -37,14 +48,15 @@ class MockCamera:
     def read(self) -> np.ndarray:
         """
         Возвращает кадр из мокового источника кадров.
-        Выполняет задержку перед считыванием кадра для имитации указанного FPS.
+        Если включен :attr:`throttle`, то выполняет задержку перед считыванием кадра
+        для имитации указанного FPS.
 
         :raises RuntimeError: При ошибке считывания кадра.
         :return: Моковый видеокадр в формате ``H x W x C``.
         :rtype: numpy.ndarray
         """
         now = time.time()
-        if self._last_frame_time is not None:
+        if self.throttle and self._last_frame_time is not None:
             elapsed = now - self._last_frame_time
             if elapsed < self._frame_interval:
                 time.sleep(self._frame_interval - elapsed)
@@ -55,12 +67,23 @@ class MockCamera:
         if frame is None:
             raise RuntimeError("No frame available")
 
+        self._frame_timestamp = time.monotonic()
+
         return frame
 
     def close(self) -> None:
         """Освобождает ресурсы источника."""
         self.source.close()
 
+    def get_frame_timestamp(self) -> float:
+        """
+        Возвращает момент получения последнего кадра из мокового источника.
+
+        :return: Момент получения по часам :func:`time.monotonic` (в секундах).
+        :rtype: float
+        """
+        return self._frame_timestamp
+
     def get_actual_properties(self) -> CameraProperties:
         """
         Возвращает параметры мокового видеопотока.
@@ -80,6 +103,7 @@ class MockCamera:
         source_config: SourceConfig,
         width: int | None = None,
         height: int | None = None,
+        cache: FrameCache | None = None,
     ) -> FrameSource:
         """
         Создаёт объект :class:`FrameSource` на основе переданной конфигурации источника.
@@ -90,6 +114,8 @@ class MockCamera:
         :type width: int, optional
         :param height: Целевая высота кадров.
         :type height: int, optional
+        :param cache: Кэш декодированных кадров.
+        :type cache: FrameCache | None, optional
         :raises TypeError: При неверном типе конфигурации источника.
         :return: Инициализированный источник кадров.
         :rtype: FrameSource
@@ -100,12 +126,21 @@ class MockCamera:
                 width=width,
                 height=height,
                 extensions=source_config.extensions,
+                cache=cache,
             )
         elif isinstance(source_config, VideoSourceConfig):
             return VideoFrameSource(
                 video_path=source_config.path,
                 width=width,
                 height=height,
+                cache=cache,
+            )
+        elif isinstance(source_config, SyntheticSourceConfig):
+            return SyntheticFrameSource(
+                width=width,
+                height=height,
+                num_objects=source_config.num_objects,
+                seed=source_config.seed,
             )
         else:
             raise TypeError(f"Unknown source config type: {type(source_config)}")
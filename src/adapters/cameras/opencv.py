@@ -1,3 +1,6 @@
+import os
+import time
+import threading
 import contextlib
 
 import cv2
@@ -5,27 +8,58 @@ import numpy as np
 
 from src.core.ports import CameraProperties
 from src.exceptions import CameraOpenError, CameraReadError
+from src.core.metrics import LatencyWindow, MetricsRegistry
+from src.core.affinity import pin_thread
 from src.app.configs.cameras import OpenCVCameraConfig
 
+# Частота кадров, по которой оценивается интервал между кадрами, если источник ее не сообщает
+NOMINAL_FPS = 30.0
+
+# Максимальная задержка, при которой метка времени буфера V4L2 считается достоверной (в секундах)
+MAX_DRIVER_DELAY = 5.0
+
 
 class OpenCVCamera:
     """Адаптер камеры на базе OpenCV."""
 
-    def __init__(self, config: OpenCVCameraConfig):
+    def __init__(self, config: OpenCVCameraConfig, metrics: MetricsRegistry | None = None):
         """
         Инициализирует камеру на базе OpenCV.
 
         :param config: Конфигурация камеры OpenCV.
         :type config: OpenCVCameraConfig
+        :param metrics: Реестр метрик для публикации задержки захвата (``camera.capture``).
+        :type metrics: MetricsRegistry | None, optional
         """
         self.source = config.source
         self.width = config.width
         self.height = config.height
         self.fps = config.fps
         self.convert_to_rgb = config.convert_to_rgb
+        self.buffer_size = config.buffer_size
+        self.fourcc = config.fourcc
+        self.drain = config.drain
+        self.max_drain_grabs = config.max_drain_grabs
+        self.read_timeout = config.read_timeout
+        self.ffmpeg_options = config.ffmpeg_options
+        self.metrics = metrics
 
         self._cap: cv2.VideoCapture | None = None
         self._is_open: bool = False
+        self._frame_interval: float = 1.0 / NOMINAL_FPS
+        self._driver_timestamps: bool = False
+
+        self._capture_latencies = LatencyWindow(100)
+        self._frame_timestamp: float = time.monotonic()
+
+        # Состояние фонового чтения (режим ``thread``)
+        self._condition = threading.Condition()
+        self._reader: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._latest: tuple[np.ndarray, float] | None = None
+        self._latest_seq: int = 0
+        self._returned_seq: int = 0
+        self._reader_failed: bool = False
 
     def open(self) -> None:
         """
@@ -33,16 +67,27 @@ class OpenCVCamera:
         Если указаны параметры :attr:`width`, :attr:`height` или :attr:`fps`,
         то драйвер выбирает ближайшее поддерживаемое разрешение и FPS.
 
+        Формат пикселей :attr:`fourcc` устанавливается до разрешения, так как
+        драйверы V4L2 выбирают доступные разрешения и FPS исходя из формата.
+
         :raises CameraOpenError: При ошибке подключения к источнику видео.
         """
         if self._is_open:
             return
 
+        if self.ffmpeg_options:
+            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "|".join(
+                f"{key};{value}" for key, value in self.ffmpeg_options.items()
+            )
+
         cap = cv2.VideoCapture(self.source)
         if not cap.isOpened():
             cap.release()
             raise CameraOpenError(f"The video source could not be opened: {self.source}")
 
+        if self.fourcc is not None:
+            cap.set(cv2.CAP_PROP_FOURCC, float(cv2.VideoWriter_fourcc(*self.fourcc)))
+
         if self.width is not None:
             cap.set(cv2.CAP_PROP_FRAME_WIDTH, float(self.width))
 
@@ -52,11 +97,26 @@ class OpenCVCamera:
         if self.fps is not None:
             cap.set(cv2.CAP_PROP_FPS, float(self.fps))
 
+        if self.buffer_size is not None:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, float(self.buffer_size))
+
+        actual_fps = float(cap.get(cv2.CAP_PROP_FPS) or self.fps or NOMINAL_FPS)
+        self._frame_interval = 1.0 / (actual_fps if actual_fps > 0 else NOMINAL_FPS)
+
+        # V4L2 сообщает время заполнения буфера драйвером по часам CLOCK_MONOTONIC,
+        # FFmpeg и другие бэкенды - время кадра в потоке, не сопоставимое с часами процесса
+        self._driver_timestamps = cap.getBackendName() == "V4L2"
+
         self._cap = cap
         self._is_open = True
 
+        if self.drain == "thread":
+            self._start_reader()
+
     def close(self) -> None:
         """Выполняет отключение от источника видео."""
+        self._stop_reader()
+
         if self._cap is not None:
             with contextlib.suppress(Exception):
                 self._cap.release()
@@ -66,7 +126,7 @@ class OpenCVCamera:
 
     def read(self) -> np.ndarray:
         """
-        Считывает кадр с видеопотока.
+        Считывает кадр с видеопотока согласно стратегии :attr:`drain`.
 
         :raises CameraReadError: При ошибке считывания кадра.
         :return: Полученный кадр.
@@ -75,15 +135,57 @@ class OpenCVCamera:
         if not self._is_open:
             self.open()
 
-        ok, frame = self._cap.read()
-        if not ok:
-            raise CameraReadError("Couldn't read frame from source")
+        match self.drain:
+            case "thread":
+                frame, captured_at = self._read_latest()
+            case "grab":
+                frame, captured_at = self._read_drained()
+            case _:
+                frame, captured_at = self._read_next()
 
         if self.convert_to_rgb:
             frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
+        latency = time.monotonic() - captured_at
+        self._capture_latencies.add(latency)
+        self._frame_timestamp = captured_at
+
+        if self.metrics is not None:
+            self.metrics.observe("camera.capture", latency)
+
         return frame
 
+    def get_frame_timestamp(self) -> float:
+        """
+        Возвращает момент захвата последнего считанного кадра
+        (см. :meth:`get_capture_latency`).
+
+        :return: Момент захвата по часам :func:`time.monotonic` (в секундах).
+        :rtype: float
+        """
+        return self._frame_timestamp
+
+    def get_capture_latency(self, q: float = 50) -> float | None:
+        """
+        Возвращает перцентиль задержки захвата по последним кадрам.
+
+        Задержка захвата - время от момента захвата кадра до его возврата из :meth:`read`.
+        Для бэкенда V4L2 (USB-камеры) момент захвата - время заполнения буфера драйвером,
+        поэтому задержка включает время кадра в очереди драйвера. Для остальных бэкендов
+        (в том числе RTSP через FFmpeg) источник не сообщает время захвата по часам процесса,
+        и задержка отсчитывается от получения кадра процессом (завершения ``grab``):
+        она включает хранение кадра в ожидании чтения, декодирование в режимах ``none``
+        и ``grab`` и конвертацию цветового пространства, но не задержку сети и буфера источника.
+
+        Задержка также публикуется в реестре метрик как ``camera.capture``.
+
+        :param q: Перцентиль в диапазоне ``[0, 100]``.
+        :type q: float, optional
+        :return: Задержка захвата (в секундах) или ``None``, если кадры еще не считывались.
+        :rtype: float | None
+        """
+        return self._capture_latencies.percentile(q)
+
     def get_actual_properties(self) -> CameraProperties:
         """
         Возвращает текущие параметры источника видео.
@@ -103,3 +205,129 @@ class OpenCVCamera:
             height=height,
             fps=fps
         )
+
+    def _read_next(self) -> tuple[np.ndarray, float]:
+        """
+        Считывает очередной кадр из буфера источника.
+
+        :raises CameraReadError: При ошибке считывания кадра.
+        :return: Кадр и момент его получения.
+        :rtype: tuple[np.ndarray, float]
+        """
+        ok, frame = self._cap.read()
+        if not ok:
+            raise CameraReadError("Couldn't read frame from source")
+
+        return frame, self._captured_at(time.monotonic())
+
+    def _read_drained(self) -> tuple[np.ndarray, float]:
+        """
+        Пропускает накопленные в буфере кадры и считывает самый свежий.
+
+        Кадры из буфера захватываются практически мгновенно, поэтому захват,
+        длившийся не менее половины интервала между кадрами, означает,
+        что буфер опустошен и получен новый кадр. Если источник не сообщает FPS,
+        интервал оценивается по :data:`NOMINAL_FPS`.
+
+        :raises CameraReadError: При ошибке считывания кадра.
+        :return: Кадр и момент его получения.
+        :rtype: tuple[np.ndarray, float]
+        """
+        for _ in range(self.max_drain_grabs):
+            grab_start = time.monotonic()
+            if not self._cap.grab():
+                raise CameraReadError("Couldn't grab frame from source")
+
+            grabbed_at = time.monotonic()
+            if grabbed_at - grab_start >= self._frame_interval / 2:
+                break
+
+        captured_at = self._captured_at(grabbed_at)
+
+        ok, frame = self._cap.retrieve()
+        if not ok:
+            raise CameraReadError("Couldn't retrieve frame from source")
+
+        return frame, captured_at
+
+    def _read_latest(self) -> tuple[np.ndarray, float]:
+        """
+        Возвращает последний кадр фонового потока чтения, ожидая кадр,
+        который еще не был возвращен.
+
+        :raises CameraReadError: Если фоновое чтение завершилось ошибкой
+            или новый кадр не получен за :attr:`read_timeout`.
+        :return: Кадр и момент его получения.
+        :rtype: tuple[np.ndarray, float]
+        """
+        with self._condition:
+            has_frame = self._condition.wait_for(
+                lambda: self._latest_seq > self._returned_seq or self._reader_failed,
+                timeout=self.read_timeout,
+            )
+            if self._reader_failed:
+                raise CameraReadError("Couldn't read frame from source")
+            if not has_frame:
+                raise CameraReadError(f"No new frame from source within {self.read_timeout}s")
+
+            self._returned_seq = self._latest_seq
+            return self._latest
+
+    def _start_reader(self) -> None:
+        """Запускает фоновый поток чтения кадров."""
+        self._stop_event.clear()
+        self._reader_failed = False
+        self._latest = None
+        self._latest_seq = self._returned_seq = 0
+
+        self._reader = threading.Thread(target=self._reader_loop, daemon=True)
+        self._reader.start()
+
+    def _stop_reader(self) -> None:
+        """Останавливает фоновый поток чтения кадров."""
+        if self._reader is None:
+            return
+
+        self._stop_event.set()
+        self._reader.join(timeout=self.read_timeout)
+        self._reader = None
+
+    def _reader_loop(self) -> None:
+        """
+        Непрерывно считывает кадры, сохраняя только последний.
+        Декодирование выполняется для каждого кадра, чтобы буфер драйвера не переполнялся.
+        """
+        pin_thread("capture")
+
+        while not self._stop_event.is_set():
+            ok, frame = self._cap.read()
+            captured_at = self._captured_at(time.monotonic()) if ok else 0.0
+
+            with self._condition:
+                if not ok:
+                    self._reader_failed = True
+                    self._condition.notify_all()
+                    return
+
+                self._latest = (frame, captured_at)
+                self._latest_seq += 1
+                self._condition.notify_all()
+
+    def _captured_at(self, grabbed_at: float) -> float:
+        """
+        Возвращает момент захвата последнего полученного кадра.
+
+        :param grabbed_at: Момент получения кадра процессом (по часам :func:`time.monotonic`).
+        :type grabbed_at: float
+        :return: Время заполнения буфера драйвером V4L2, если оно доступно и достоверно,
+            иначе ``grabbed_at``.
+        :rtype: float
+        """
+        if not self._driver_timestamps:
+            return grabbed_at
+
+        driver_timestamp = self._cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if 0.0 <= grabbed_at - driver_timestamp <= MAX_DRIVER_DELAY:
+            return driver_timestamp
+
+        return grabbed_at
@@ -1,9 +1,15 @@
 from .base import FrameSource
+from .cache import FrameCache
 from .video import VideoFrameSource
+from .prefetch import PrefetchFrameSource
 from .directory import DirectoryFrameSource
+from .synthetic import SyntheticFrameSource
 
 __all__ = [
     "FrameSource",
     "DirectoryFrameSource",
     "VideoFrameSource",
+    "SyntheticFrameSource",
+    "PrefetchFrameSource",
+    "FrameCache",
 ]
@@ -0,0 +1,106 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+
+
+class FrameCache:
+    """
+    Потокобезопасный LRU-кэш декодированных кадров с ограничением по памяти.
+
+    Кадры хранятся и возвращаются без копирования, поэтому помечаются
+    доступными только для чтения. Для циклического воспроизведения набора кадров
+    лимит памяти должен покрывать весь набор, иначе LRU-вытеснение не даст попаданий.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Инициализирует кэш кадров.
+
+        :param max_bytes: Максимальный суммарный размер кадров в кэше (в байтах).
+        :type max_bytes: int
+        """
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._frames: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def size(self) -> int:
+        """
+        Текущий суммарный размер кадров в кэше.
+
+        :return: Размер (в байтах).
+        :rtype: int
+        """
+        return self._size
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Доля обращений к кэшу, завершившихся попаданием.
+
+        :return: Доля попаданий в диапазоне ``[0.0, 1.0]``.
+        :rtype: float
+        """
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        """
+        Возвращает кадр из кэша и отмечает его как недавно использованный.
+
+        :param key: Ключ кадра.
+        :type key: Hashable
+        :return: Кадр или ``None``, если кадра нет в кэше.
+        :rtype: np.ndarray | None
+        """
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._frames.move_to_end(key)
+            return frame
+
+    def put(self, key: Hashable, frame: np.ndarray) -> np.ndarray:
+        """
+        Помещает кадр в кэш, вытесняя давно не использованные кадры при превышении лимита.
+        Кадр, превышающий лимит целиком, не кэшируется.
+
+        :param key: Ключ кадра.
+        :type key: Hashable
+        :param frame: Кадр.
+        :type frame: np.ndarray
+        :return: Кадр, доступный только для чтения.
+        :rtype: np.ndarray
+        """
+        frame.flags.writeable = False
+        if frame.nbytes > self.max_bytes:
+            return frame
+
+        with self._lock:
+            previous = self._frames.pop(key, None)
+            if previous is not None:
+                self._size -= previous.nbytes
+
+            while self._frames and self._size + frame.nbytes > self.max_bytes:
+                _, evicted = self._frames.popitem(last=False)
+                self._size -= evicted.nbytes
+
+            self._frames[key] = frame
+            self._size += frame.nbytes
+
+        return frame
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        with self._lock:
+            self._frames.clear()
+            self._size = 0
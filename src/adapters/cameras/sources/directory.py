@@ -6,6 +6,8 @@ from natsort import natsorted
 
 from src.utils import IMAGE_EXTENSIONS, PathLike, normalize_extensions
 
+from .cache import FrameCache
+
 
 class DirectoryFrameSource:
     """Источник кадров моковой камеры на основе директории с кадрами."""
@@ -16,6 +18,7 @@ class DirectoryFrameSource:
         width: int,
         height: int,
         extensions: set[str] = IMAGE_EXTENSIONS,
+        cache: FrameCache | None = None,
     ):
         """
         Инициализирует источник кадров изображениями из директории.
@@ -28,11 +31,14 @@ class DirectoryFrameSource:
         :type height: int | None
         :param extensions: Список расширений моковых кадров.
         :type extensions: set[str], optional
+        :param cache: Кэш декодированных кадров. Если не указан, кадр декодируется при каждом чтении.
+        :type cache: FrameCache | None, optional
         """
         self.frames_dir = Path(frames_dir)
         self.width = width
         self.height = height
         self.extensions = normalize_extensions(extensions)
+        self.cache = cache
 
         self._frames: list[Path] = []
         self._idx = 0
@@ -57,6 +63,7 @@ class DirectoryFrameSource:
         """
         Возвращает кадр из моковой директории :attr:`frames_dir`.
         Каждый вызов этой функции возвращает следующий по порядку кадр.
+        Кадры из кэша :attr:`cache` возвращаются без копирования и доступны только для чтения.
 
         :raises ValueError: Если список кадров :attr:`frames` пустой.
         :return: Моковый видеокадр в формате ``H x W x C``.
@@ -68,11 +75,21 @@ class DirectoryFrameSource:
         if self._idx >= len(self._frames):
             self._idx = 0
 
-        frame = cv2.imread(str(self._frames[self._idx]))
+        frame_path = self._frames[self._idx]
+        self._idx += 1
+
+        if self.cache is not None:
+            frame = self.cache.get(frame_path)
+            if frame is not None:
+                return frame
+
+        frame = cv2.imread(str(frame_path))
         frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         frame = cv2.resize(frame, (self.width, self.height))
 
-        self._idx += 1
+        if self.cache is not None:
+            frame = self.cache.put(frame_path, frame)
+
         return frame
 
     def close(self) -> None:
@@ -80,6 +97,9 @@ class DirectoryFrameSource:
         self._frames.clear()
         self._idx = 0
 
+        if self.cache is not None:
+            self.cache.clear()
+
     def get_resolution(self) -> tuple[int, int]:
         """
         Возвращает разрешение мокового видеопотока.
@@ -0,0 +1,110 @@
+import queue
+import threading
+
+import numpy as np
+
+from src.core.affinity import pin_thread
+
+from .base import FrameSource
+
+
+class PrefetchFrameSource:
+    """
+    Источник кадров с упреждающим чтением.
+
+    Кадры вложенного источника читаются и декодируются фоновым потоком
+    в ограниченную очередь, поэтому :meth:`read` не выполняет декодирование.
+    """
+
+    def __init__(self, source: FrameSource, depth: int = 4, read_timeout: float = 5.0):
+        """
+        Инициализирует источник с упреждающим чтением.
+
+        :param source: Вложенный источник кадров.
+        :type source: FrameSource
+        :param depth: Максимальное количество заранее прочитанных кадров.
+        :type depth: int, optional
+        :param read_timeout: Время ожидания кадра из очереди (в секундах).
+        :type read_timeout: float, optional
+        """
+        self.source = source
+        self.depth = depth
+        self.read_timeout = read_timeout
+
+        self._queue: queue.Queue[np.ndarray | Exception] = queue.Queue(maxsize=depth)
+        self._stop_event = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    def open(self) -> None:
+        """Открывает вложенный источник и запускает фоновое чтение."""
+        if self._worker is not None:
+            return
+
+        self.source.open()
+
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._prefetch_loop, daemon=True)
+        self._worker.start()
+
+    def read(self) -> np.ndarray:
+        """
+        Возвращает следующий заранее прочитанный кадр.
+
+        :raises RuntimeError: Если кадр не получен за :attr:`read_timeout`.
+        :return: Моковый видеокадр в формате ``H x W x C``.
+        :rtype: numpy.ndarray
+        """
+        try:
+            item = self._queue.get(timeout=self.read_timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No prefetched frame within {self.read_timeout}s") from None
+
+        if isinstance(item, Exception):
+            raise item
+
+        return item
+
+    def close(self) -> None:
+        """Останавливает фоновое чтение и освобождает ресурсы вложенного источника."""
+        if self._worker is not None:
+            self._stop_event.set()
+
+            # Освобождение места в очереди для завершения заблокированного потока
+            while self._worker.is_alive():
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    self._worker.join(timeout=0.1)
+
+            self._worker = None
+
+        self.source.close()
+
+    def get_resolution(self) -> tuple[int, int]:
+        """
+        Возвращает разрешение вложенного источника.
+
+        :return: Ширина и высота.
+        :rtype: tuple[int, int]
+        """
+        return self.source.get_resolution()
+
+    def _prefetch_loop(self) -> None:
+        """Читает кадры вложенного источника в очередь."""
+        pin_thread("capture")
+
+        while not self._stop_event.is_set():
+            try:
+                item = self.source.read()
+            except Exception as error:
+                item = error
+
+            while not self._stop_event.is_set():
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+            if isinstance(item, Exception):
+                return
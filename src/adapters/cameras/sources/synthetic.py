@@ -0,0 +1,97 @@
+import cv2
+import numpy as np
+
+
+class SyntheticFrameSource:
+    """
+    Процедурный источник кадров моковой камеры.
+
+    Кадры генерируются в памяти без обращения к диску: на предвычисленный
+    градиентный фон наносятся движущиеся цветные объекты.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        num_objects: int = 3,
+        seed: int = 0,
+    ):
+        """
+        Инициализирует процедурный источник кадров.
+
+        :param width: Ширина кадра.
+        :type width: int
+        :param height: Высота кадра.
+        :type height: int
+        :param num_objects: Количество движущихся объектов на кадре.
+        :type num_objects: int, optional
+        :param seed: Зерно генератора случайных чисел.
+        :type seed: int, optional
+        """
+        self.width = width
+        self.height = height
+        self.num_objects = num_objects
+        self.seed = seed
+
+        self._background: np.ndarray | None = None
+        self._positions: np.ndarray | None = None
+        self._velocities: np.ndarray | None = None
+        self._sizes: np.ndarray | None = None
+        self._colors: list[tuple[int, int, int]] = []
+
+    def open(self) -> None:
+        """Генерирует фон и начальное состояние объектов."""
+        rng = np.random.default_rng(self.seed)
+
+        gradient = np.linspace(40, 200, self.width, dtype=np.uint8)
+        self._background = np.repeat(
+            np.broadcast_to(gradient, (self.height, self.width))[..., None], 3, axis=2
+        ).copy()
+
+        size = np.array([self.width, self.height], dtype=np.float64)
+        self._sizes = rng.uniform(0.1, 0.25, (self.num_objects, 1)) * size.min()
+        self._positions = rng.uniform(0.0, 1.0, (self.num_objects, 2)) * (size - self._sizes)
+        self._velocities = rng.uniform(-0.02, 0.02, (self.num_objects, 2)) * size
+        self._colors = [
+            tuple(int(channel) for channel in rng.integers(0, 256, 3))
+            for _ in range(self.num_objects)
+        ]
+
+    def read(self) -> np.ndarray:
+        """
+        Генерирует следующий кадр.
+
+        :raises ValueError: Если источник не инициализирован.
+        :return: Моковый видеокадр в формате ``H x W x C``.
+        :rtype: numpy.ndarray
+        """
+        if self._background is None:
+            raise ValueError("Synthetic source is not initialized. Call open() first.")
+
+        frame = self._background.copy()
+
+        # Движение объектов с отражением от границ кадра
+        bounds = np.array([self.width, self.height], dtype=np.float64) - self._sizes
+        self._positions += self._velocities
+        out_of_bounds = (self._positions < 0) | (self._positions > bounds)
+        self._velocities[out_of_bounds] *= -1
+        np.clip(self._positions, 0, bounds, out=self._positions)
+
+        for (x, y), (size,), color in zip(self._positions, self._sizes, self._colors):
+            cv2.rectangle(frame, (int(x), int(y)), (int(x + size), int(y + size)), color, -1)
+
+        return frame
+
+    def close(self) -> None:
+        """Освобождает ресурсы источника."""
+        self._background = None
+
+    def get_resolution(self) -> tuple[int, int]:
+        """
+        Возвращает разрешение мокового видеопотока.
+
+        :return: Ширина и высота.
+        :rtype: tuple[int, int]
+        """
+        return self.width, self.height
@@ -3,6 +3,8 @@ import numpy as np
 
 from src.utils import PathLike
 
+from .cache import FrameCache
+
 
 class VideoFrameSource:
     """Источник кадров моковой камеры на основе видеофайла."""
@@ -12,6 +14,7 @@ class VideoFrameSource:
         video_path: PathLike,
         width: int | None = None,
         height: int | None = None,
+        cache: FrameCache | None = None,
     ):
         """
         Инициализирует источник кадров видеофайлом.
@@ -22,12 +25,19 @@ class VideoFrameSource:
         :type width: int, optional
         :param height: Целевая высота кадра.
         :type height: int, optional
+        :param cache: Кэш декодированных кадров по их номеру в видео.
+            Если не указан, кадр декодируется при каждом чтении.
+        :type cache: FrameCache | None, optional
         """
         self.video_path = str(video_path)
         self.width = width
         self.height = height
+        self.cache = cache
 
         self._cap = None
+        self._frame_idx = 0
+        self._cap_idx = 0
+        self._frame_count = 0
 
     def open(self) -> None:
         """
@@ -39,9 +49,14 @@ class VideoFrameSource:
         if not self._cap.isOpened():
             raise ValueError(f"Failed to open video file: {self.video_path}")
 
+        self._frame_idx = self._cap_idx = 0
+        self._frame_count = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+
     def read(self) -> np.ndarray:
         """
         Возвращает кадр из мокового видеофайла.
+        Если кадр есть в кэше :attr:`cache`, то он возвращается без декодирования
+        и доступен только для чтения.
 
         :raises ValueError: Если объект захвата кадров :class:`cv2.VideoCapture` не инициализирован.
         :return: Моковый видеокадр в формате ``H x W x C``.
@@ -50,11 +65,30 @@ class VideoFrameSource:
         if self._cap is None:
             raise ValueError("Video is not initialized. Call open() first.")
 
+        if self._frame_count and self._frame_idx >= self._frame_count:
+            self._frame_idx = 0
+
+        frame_idx = self._frame_idx
+        self._frame_idx += 1
+
+        if self.cache is not None:
+            frame = self.cache.get(frame_idx)
+            if frame is not None:
+                return frame
+
+            # После попаданий в кэш позиция видео отстает от номера кадра
+            if self._cap_idx != frame_idx:
+                self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+
         ret, frame = self._cap.read()
         if not ret:
             self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self._frame_idx = 1
+            frame_idx = 0
             ret, frame = self._cap.read()
 
+        self._cap_idx = frame_idx + 1
+
         frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
         orig_h, orig_w = frame.shape[:2]
@@ -64,12 +98,18 @@ class VideoFrameSource:
 
         frame = cv2.resize(frame, (target_w, target_h))
 
+        if self.cache is not None:
+            frame = self.cache.put(frame_idx, frame)
+
         return frame
 
     def close(self) -> None:
         """Освобождает ресурсы источника."""
         self._cap.release()
 
+        if self.cache is not None:
+            self.cache.clear()
+
     def get_resolution(self) -> tuple[int, int]:
         """
         Возвращает разрешение мокового видеопотока.
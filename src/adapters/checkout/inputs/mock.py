@@ -13,3 +13,7 @@ class MockCheckoutInput:
             return CheckoutRequest(**request)
         except StopIteration:
             raise RuntimeError("No more checkout requests")
+
+    def poll_request(self) -> CheckoutRequest | None:
+        # Моковые запросы выдаются по одному через get_request
+        return None
@@ -1,4 +1,4 @@
-from queue import Queue
+from queue import Empty, Queue
 
 from src.core.dto import CheckoutRequest
 from src.app.configs.checkout import UICheckoutInputConfig
@@ -14,3 +14,9 @@ class UICheckoutInput:
 
     def get_request(self) -> CheckoutRequest:
         return self._queue.get()
+
+    def poll_request(self) -> CheckoutRequest | None:
+        try:
+            return self._queue.get_nowait()
+        except Empty:
+            return None
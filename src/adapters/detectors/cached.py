@@ -0,0 +1,165 @@
+import time
+
+import cv2
+import numpy as np
+
+from src.core.dto import Detection
+from src.core.ports import Detector
+from src.core.metrics import MetricsRegistry
+
+
+class CachedDetector:
+    """
+    Детектор с повторным использованием детекций для статичной сцены.
+
+    Для каждого кадра вычисляется отпечаток - средние значения блоков кадра,
+    уменьшенного до :attr:`hash_size` x :attr:`hash_size`. Если отпечаток отличается
+    от отпечатка кадра последней детекции не более чем на :attr:`tolerance` в каждом блоке,
+    детекции этого кадра возвращаются без запуска модели. Детекции используются повторно
+    не дольше :attr:`max_age` секунд, после чего модель запускается заново.
+
+    Попадания и промахи публикуются как ``detector.cache.hits`` и ``detector.cache.misses``,
+    доля попаданий - как ``detector.cache.hit_rate``.
+    """
+
+    def __init__(
+        self,
+        detector: Detector,
+        hash_size: int = 16,
+        tolerance: float = 8.0,
+        max_age: float = 1.0,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Инициализирует детектор с кэшем.
+
+        :param detector: Детектор, результаты которого кэшируются.
+        :type detector: Detector
+        :param hash_size: Сторона уменьшенного кадра для отпечатка (в блоках).
+        :type hash_size: int, optional
+        :param tolerance: Допустимое отличие среднего значения блока ``[0, 255]``.
+        :type tolerance: float, optional
+        :param max_age: Максимальное время повторного использования детекций (в секундах).
+        :type max_age: float, optional
+        :param metrics: Реестр метрик для учета попаданий в кэш.
+        :type metrics: MetricsRegistry | None, optional
+        """
+        self.detector = detector
+        self.hash_size = hash_size
+        self.tolerance = tolerance
+        self.max_age = max_age
+        self.metrics = metrics
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._fingerprint: np.ndarray | None = None
+        self._detections: list[Detection] = []
+        self._detected_at: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Доля кадров, для которых детекции взяты из кэша.
+
+        :return: Доля попаданий ``[0, 1]``.
+        :rtype: float
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def detect(self, frame: np.ndarray) -> list[Detection]:
+        """
+        Возвращает детекции предыдущего кадра, если сцена не изменилась,
+        иначе выполняет детекцию.
+
+        :param frame: Видеокадр.
+        :type frame: np.ndarray
+        :return: Список детекций на видеокадре.
+        :rtype: list[Detection]
+        """
+        fingerprint = self._fingerprint_of(frame)
+        now = time.monotonic()
+
+        if self._is_hit(fingerprint, now):
+            self.hits += 1
+            self._count("hits")
+            return self._detections
+
+        detections = self.detector.detect(frame)
+
+        self._fingerprint = fingerprint
+        self._detections = detections
+        self._detected_at = now
+
+        self.misses += 1
+        self._count("misses")
+
+        return detections
+
+    def get_classes(self) -> dict[int, str]:
+        """
+        Возвращает словарь классов с их названиями.
+
+        :return: Словарь вида``{class_id: label}``.
+        :rtype: dict[int, str]
+        """
+        return self.detector.get_classes()
+
+    def get_input_size(self) -> int:
+        """
+        Возвращает текущий размер входа модели.
+
+        :return: Сторона входного изображения модели (в пикселях).
+        :rtype: int
+        """
+        return self.detector.get_input_size()
+
+    def set_input_size(self, size: int) -> None:
+        """
+        Устанавливает размер входа модели и сбрасывает кэш.
+
+        :param size: Сторона входного изображения модели (в пикселях).
+        :type size: int
+        """
+        self.detector.set_input_size(size)
+        self._fingerprint = None
+
+    def _fingerprint_of(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Вычисляет отпечаток кадра.
+
+        :param frame: Видеокадр.
+        :type frame: np.ndarray
+        :return: Средние значения блоков кадра.
+        :rtype: np.ndarray
+        """
+        blocks = cv2.resize(frame, (self.hash_size, self.hash_size), interpolation=cv2.INTER_AREA)
+        return blocks.astype(np.int16)
+
+    def _is_hit(self, fingerprint: np.ndarray, now: float) -> bool:
+        """
+        Проверяет, можно ли использовать детекции кадра последней детекции.
+
+        :param fingerprint: Отпечаток текущего кадра.
+        :type fingerprint: np.ndarray
+        :param now: Текущее время (monotonic, в секундах).
+        :type now: float
+        :return: ``True``, если сцена не изменилась и детекции не устарели.
+        :rtype: bool
+        """
+        if self._fingerprint is None or now - self._detected_at > self.max_age:
+            return False
+
+        return int(np.abs(fingerprint - self._fingerprint).max()) <= self.tolerance
+
+    def _count(self, counter: str) -> None:
+        """
+        Увеличивает счетчик кэша и обновляет долю попаданий в реестре метрик.
+
+        :param counter: Название счетчика.
+        :type counter: str
+        """
+        if self.metrics is not None:
+            self.metrics.increment(f"detector.cache.{counter}")
+            self.metrics.set_gauge("detector.cache.hit_rate", self.hit_rate)
@@ -17,8 +17,10 @@ class MockDetector:
         :type config: MockDetectorConfig
         """
         self.classes = config.classes
+        self._class_ids = list(self.classes.keys())
         self.confidence_range = config.confidence_range
         self.detections_num_range = config.detections_num_range
+        self.input_size = 640
 
     def detect(self, frame: np.ndarray) -> list[Detection]:
         """
@@ -34,13 +36,24 @@ class MockDetector:
 
         return [
             Detection(
-                class_id=random.choice(list(self.classes.keys())),
+                class_id=random.choice(self._class_ids),
                 confidence=random.uniform(*self.confidence_range),
                 bbox=self._random_bbox(w, h),
             )
             for _ in range(detections_num)
         ]
 
+    def detect_batch(self, frames: list[np.ndarray]) -> list[list[Detection]]:
+        """
+        Возвращает фиктивные детекции для каждого изображения пакета.
+
+        :param frames: Изображения.
+        :type frames: list[np.ndarray]
+        :return: Списки фиктивных детекций в порядке ``frames``.
+        :rtype: list[list[Detection]]
+        """
+        return [self.detect(frame) for frame in frames]
+
     def get_classes(self) -> dict[int, str]:
         """
         Возвращает словарь классов с их названиями.
@@ -50,6 +63,24 @@ class MockDetector:
         """
         return self.classes
 
+    def get_input_size(self) -> int:
+        """
+        Возвращает размер входа модели. Не влияет на моковые детекции.
+
+        :return: Сторона входного изображения модели (в пикселях).
+        :rtype: int
+        """
+        return self.input_size
+
+    def set_input_size(self, size: int) -> None:
+        """
+        Устанавливает размер входа модели. Не влияет на моковые детекции.
+
+        :param size: Сторона входного изображения модели (в пикселях).
+        :type size: int
+        """
+        self.input_size = size
+
     @staticmethod
     def _random_bbox(width: int, height: int) -> tuple[int, int, int, int]:
         """
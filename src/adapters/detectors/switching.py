@@ -0,0 +1,154 @@
+import time
+import threading
+
+import numpy as np
+
+from src.core.dto import Detection
+from src.core.ports import Detector
+from src.core.metrics import LatencyWindow
+
+
+class SwitchingDetector:
+    """
+    Детектор с автоматическим переключением между основной
+    и облегченной резервной моделью по задержке инференса.
+
+    Переключение на резервную модель выполняется, когда p95 задержки основной модели
+    превышает :attr:`latency_threshold`. Возврат к основной модели выполняется, когда
+    p95 задержки резервной модели опускается ниже :attr:`recover_threshold`.
+    После каждого переключения действующая модель не меняется минимум :attr:`min_dwell` секунд.
+    """
+
+    def __init__(
+        self,
+        primary: Detector,
+        fallback: Detector,
+        latency_threshold: float,
+        recover_threshold: float,
+        window: int = 30,
+        min_dwell: float = 10.0,
+    ):
+        """
+        Инициализирует детектор с переключением.
+
+        :param primary: Основной детектор.
+        :type primary: Detector
+        :param fallback: Облегченный резервный детектор.
+        :type fallback: Detector
+        :param latency_threshold: Порог p95 задержки основного детектора (в секундах).
+        :type latency_threshold: float
+        :param recover_threshold: Порог p95 задержки резервного детектора (в секундах).
+        :type recover_threshold: float
+        :param window: Количество кадров для оценки p95 задержки.
+        :type window: int, optional
+        :param min_dwell: Минимальное время работы после переключения (в секундах).
+        :type min_dwell: float, optional
+        :raises ValueError: Если классы основного и резервного детекторов не совпадают.
+        """
+        if primary.get_classes() != fallback.get_classes():
+            raise ValueError("Primary and fallback detectors must share the same classes")
+
+        self.primary = primary
+        self.fallback = fallback
+        self.latency_threshold = latency_threshold
+        self.recover_threshold = recover_threshold
+        self.window = window
+        self.min_dwell = min_dwell
+
+        self._lock = threading.Lock()
+        self._latencies = LatencyWindow(window)
+        self._active: Detector = primary
+        self._switched_at = time.monotonic()
+
+    @property
+    def is_fallback_active(self) -> bool:
+        """
+        Используется ли в данный момент резервный детектор.
+
+        :return: ``True``, если активен резервный детектор; ``False`` - иначе.
+        :rtype: bool
+        """
+        return self._active is self.fallback
+
+    def detect(self, frame: np.ndarray) -> list[Detection]:
+        """
+        Выполняет детекцию активной моделью и учитывает ее задержку.
+
+        :param frame: Видеокадр.
+        :type frame: np.ndarray
+        :return: Список детекций на видеокадре.
+        :rtype: list[Detection]
+        """
+        detector = self._active
+
+        start = time.perf_counter()
+        detections = detector.detect(frame)
+        self._observe(detector, time.perf_counter() - start)
+
+        return detections
+
+    def get_classes(self) -> dict[int, str]:
+        """
+        Возвращает словарь классов с их названиями.
+
+        :return: Словарь вида``{class_id: label}``.
+        :rtype: dict[int, str]
+        """
+        return self.primary.get_classes()
+
+    def get_input_size(self) -> int:
+        """
+        Возвращает текущий размер входа активной модели.
+
+        :return: Сторона входного изображения модели (в пикселях).
+        :rtype: int
+        """
+        return self._active.get_input_size()
+
+    def set_input_size(self, size: int) -> None:
+        """
+        Устанавливает размер входа обеих моделей.
+
+        :param size: Сторона входного изображения модели (в пикселях).
+        :type size: int
+        """
+        self.primary.set_input_size(size)
+        self.fallback.set_input_size(size)
+
+    def _observe(self, detector: Detector, latency: float) -> None:
+        """
+        Учитывает задержку инференса и при необходимости переключает активную модель.
+
+        :param detector: Детектор, выполнивший инференс.
+        :type detector: Detector
+        :param latency: Задержка инференса (в секундах).
+        :type latency: float
+        """
+        with self._lock:
+            # Измерение относится к модели, которая уже была заменена
+            if detector is not self._active:
+                return
+
+            self._latencies.add(latency)
+            if len(self._latencies) < self.window:
+                return
+
+            if time.monotonic() - self._switched_at < self.min_dwell:
+                return
+
+            latency_p95 = self._latencies.percentile(95)
+            if self._active is self.primary and latency_p95 > self.latency_threshold:
+                self._switch(self.fallback)
+            elif self._active is self.fallback and latency_p95 < self.recover_threshold:
+                self._switch(self.primary)
+
+    def _switch(self, detector: Detector) -> None:
+        """
+        Делает указанный детектор активным и сбрасывает окно задержек.
+
+        :param detector: Новый активный детектор.
+        :type detector: Detector
+        """
+        self._active = detector
+        self._switched_at = time.monotonic()
+        self._latencies.clear()
@@ -1,9 +1,16 @@
+import os
+import time
+import threading
+
 import numpy as np
 from ultralytics import YOLO
 
 from src.core.dto import Detection
+from src.core.logging import get_logger
 from src.app.configs.detectors import YOLODetectorConfig
 
+logger = get_logger("detectors.yolo")
+
 
 class YOLODetector:
     """Детектор объектов на базе YOLO."""
@@ -15,11 +22,19 @@ class YOLODetector:
         :param config: Конфигурация детектора YOLO.
         :type config: YOLODetectorConfig
         """
-        self.model = YOLO(config.weights_path)
+        self.weights_path = config.weights_path
         self.classes = config.classes
         self.conf_threshold = config.confidence_threshold
         self.iou_threshold = config.iou_threshold
         self.device = config.device
+        self.imgsz = config.imgsz
+        self.reload_interval = config.reload_interval
+
+        self.model = YOLO(self.weights_path)
+
+        self._weights_mtime = self._get_weights_mtime()
+        self._last_reload_check = time.monotonic()
+        self._reload_thread: threading.Thread | None = None
 
     def detect(self, frame: np.ndarray) -> list[Detection]:
         """
@@ -30,35 +45,42 @@ class YOLODetector:
         :return: Список детекций на видеокадре.
         :rtype: list[Detection]
         """
+        self._check_weights_update()
+
         results = self.model.predict(
             source=frame,
             conf=self.conf_threshold,
             iou=self.iou_threshold,
+            imgsz=self.imgsz,
             device=self.device,
             verbose=False,
         )
 
-        detections: list[Detection] = []
-        for result in results:
-            boxes = result.boxes
-            if boxes is None:
-                continue
+        return [detection for result in results for detection in self._to_detections(result)]
 
-            for box in boxes:
-                class_id = int(box.cls.item())
-                confidence = float(box.conf.item())
+    def detect_batch(self, frames: list[np.ndarray]) -> list[list[Detection]]:
+        """
+        Выполняет детекцию объектов на пакете изображений за один инференс.
 
-                x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
+        :param frames: Изображения.
+        :type frames: list[np.ndarray]
+        :return: Списки детекций для каждого изображения в порядке ``frames``.
+        :rtype: list[list[Detection]]
+        """
+        if not frames:
+            return []
 
-                detections.append(
-                    Detection(
-                        class_id=class_id,
-                        confidence=confidence,
-                        bbox=(x1, y1, x2, y2),
-                    )
-                )
+        results = self.model.predict(
+            source=frames,
+            conf=self.conf_threshold,
+            iou=self.iou_threshold,
+            imgsz=self.imgsz,
+            device=self.device,
+            batch=len(frames),
+            verbose=False,
+        )
 
-        return detections
+        return [self._to_detections(result) for result in results]
 
     def get_classes(self) -> dict[int, str]:
         """
@@ -68,3 +90,125 @@ class YOLODetector:
         :rtype: dict[int, str]
         """
         return self.classes
+
+    def get_input_size(self) -> int:
+        """
+        Возвращает текущий размер входа модели.
+
+        :return: Сторона входного изображения модели (в пикселях).
+        :rtype: int
+        """
+        return self.imgsz
+
+    def set_input_size(self, size: int) -> None:
+        """
+        Устанавливает размер входа модели для последующих вызовов :meth:`detect`.
+
+        :param size: Сторона входного изображения модели (в пикселях).
+        :type size: int
+        """
+        self.imgsz = size
+
+    def reload(self, weights_path: str | None = None) -> None:
+        """
+        Загружает веса модели с диска и атомарно заменяет ими текущую модель.
+
+        Новая модель загружается и прогревается до замены, поэтому выполняющийся
+        инференс и активная сессия проверки не прерываются. Чтобы не прочитать
+        частично записанный файл, новые веса следует записывать во временный файл
+        и переименовывать в :attr:`weights_path` (``os.replace``).
+
+        :param weights_path: Путь к новым весам. Если не указан, перечитывается :attr:`weights_path`.
+        :type weights_path: str | None, optional
+        """
+        weights_path = weights_path or self.weights_path
+        mtime = self._get_weights_mtime(weights_path)
+
+        model = YOLO(weights_path)
+        model.predict(
+            source=np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8),
+            imgsz=self.imgsz,
+            device=self.device,
+            verbose=False,
+        )
+
+        self.model = model
+        self.weights_path = weights_path
+        self._weights_mtime = mtime
+
+    @staticmethod
+    def _to_detections(result) -> list[Detection]:
+        """
+        Преобразует результат инференса одного изображения в детекции.
+
+        :param result: Результат инференса YOLO.
+        :type result: ultralytics.engine.results.Results
+        :return: Список детекций на изображении.
+        :rtype: list[Detection]
+        """
+        boxes = result.boxes
+        if boxes is None:
+            return []
+
+        # Тензоры переносятся в списки целиком, без создания объектов на каждый bbox
+        return [
+            Detection(
+                class_id=int(class_id),
+                confidence=confidence,
+                bbox=(int(x1), int(y1), int(x2), int(y2)),
+            )
+            for class_id, confidence, (x1, y1, x2, y2) in zip(
+                boxes.cls.tolist(),
+                boxes.conf.tolist(),
+                boxes.xyxy.tolist(),
+            )
+        ]
+
+    def _check_weights_update(self) -> None:
+        """
+        Не чаще раза в :attr:`reload_interval` секунд проверяет время изменения файла весов
+        и при его изменении запускает фоновую перезагрузку модели.
+        """
+        if self.reload_interval is None:
+            return
+
+        now = time.monotonic()
+        if now - self._last_reload_check < self.reload_interval:
+            return
+        self._last_reload_check = now
+
+        if self._reload_thread is not None and self._reload_thread.is_alive():
+            return
+
+        mtime = self._get_weights_mtime()
+        if mtime is None or mtime == self._weights_mtime:
+            return
+
+        self._reload_thread = threading.Thread(target=self._reload_in_background, daemon=True)
+        self._reload_thread.start()
+
+    def _reload_in_background(self) -> None:
+        """
+        Перезагружает модель в фоновом потоке.
+        При ошибке загрузки продолжает работу текущая модель.
+        """
+        try:
+            self.reload()
+        except Exception:
+            logger.exception("Failed to reload weights", extra={"weights_path": self.weights_path})
+        else:
+            logger.info("Weights reloaded", extra={"weights_path": self.weights_path})
+
+    def _get_weights_mtime(self, weights_path: str | None = None) -> float | None:
+        """
+        Возвращает время изменения файла весов.
+
+        :param weights_path: Путь к весам. Если не указан, используется :attr:`weights_path`.
+        :type weights_path: str | None, optional
+        :return: Время изменения файла или ``None``, если файл недоступен.
+        :rtype: float | None
+        """
+        try:
+            return os.stat(weights_path or self.weights_path).st_mtime
+        except OSError:
+            return None
@@ -0,0 +1,7 @@
+from .index import PrototypeIndex
+from .embedder import CropEmbedder
+
+__all__ = [
+    "CropEmbedder",
+    "PrototypeIndex",
+]
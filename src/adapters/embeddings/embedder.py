@@ -0,0 +1,167 @@
+import hashlib
+from collections.abc import Sequence
+
+import cv2
+import numpy as np
+import torch
+from torch import nn
+from torchvision.models import get_model, get_model_weights
+
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+
+class CropEmbedder:
+    """Извлекает эмбеддинги из вырезанных областей кадра с помощью CNN-бэкбона."""
+
+    def __init__(
+        self,
+        backbone: str = "mobilenet_v3_small",
+        input_size: int = 160,
+        weights_path: str | None = None,
+        device: str = "cpu",
+    ):
+        """
+        Инициализирует экстрактор эмбеддингов.
+
+        Классификационная голова бэкбона заменяется на :class:`torch.nn.Identity`,
+        поэтому выходом модели является вектор признаков после глобального пулинга.
+
+        :param backbone: Название модели из :mod:`torchvision.models`.
+        :type backbone: str, optional
+        :param input_size: Сторона квадратного входа модели (в пикселях).
+        :type input_size: int, optional
+        :param weights_path: Путь до ``state_dict`` бэкбона. Если не указан,
+            используются предобученные веса ``torchvision`` по умолчанию.
+        :type weights_path: str | None, optional
+        :param device: Целевое устройство для инференса.
+        :type device: str, optional
+        """
+        self.backbone = backbone
+        self.input_size = input_size
+        self.weights_path = weights_path
+        self.weights_checksum = self._checksum(backbone, weights_path)
+        self.device = torch.device(device)
+
+        self.model = self._load_model(backbone, weights_path)
+        self.model.to(self.device).eval()
+
+    @torch.inference_mode()
+    def embed(self, crops: Sequence[np.ndarray]) -> np.ndarray:
+        """
+        Возвращает L2-нормированные эмбеддинги для набора RGB-изображений.
+
+        :param crops: RGB-изображения в формате ``H x W x C``.
+        :type crops: Sequence[numpy.ndarray]
+        :return: Матрица эмбеддингов ``N x D`` (``float32``).
+        :rtype: numpy.ndarray
+        """
+        if not crops:
+            return np.empty((0, self.dim), dtype=np.float32)
+
+        batch = np.stack([
+            cv2.resize(crop, (self.input_size, self.input_size), interpolation=cv2.INTER_AREA)
+            for crop in crops
+        ])
+        batch = (batch.astype(np.float32) / 255.0 - IMAGENET_MEAN) / IMAGENET_STD
+
+        tensor = torch.from_numpy(batch).permute(0, 3, 1, 2).to(self.device)
+        features = self.model(tensor).flatten(1)
+        features = nn.functional.normalize(features, dim=1)
+
+        return features.cpu().numpy()
+
+    def embed_regions(
+        self,
+        frame: np.ndarray,
+        bboxes: Sequence[tuple[int, int, int, int]],
+    ) -> np.ndarray:
+        """
+        Вырезает области ``(x1, y1, x2, y2)`` из кадра и возвращает их эмбеддинги.
+
+        Координаты обрезаются по границам кадра; вырожденные области
+        расширяются до одного пикселя.
+
+        :param frame: RGB-кадр в формате ``H x W x C``.
+        :type frame: numpy.ndarray
+        :param bboxes: Bbox'ы в координатах кадра.
+        :type bboxes: Sequence[tuple[int, int, int, int]]
+        :return: Матрица эмбеддингов ``N x D`` (``float32``).
+        :rtype: numpy.ndarray
+        """
+        h, w = frame.shape[:2]
+
+        crops: list[np.ndarray] = []
+        for x1, y1, x2, y2 in bboxes:
+            x1 = min(max(x1, 0), w - 1)
+            y1 = min(max(y1, 0), h - 1)
+            x2 = min(max(x2, x1 + 1), w)
+            y2 = min(max(y2, y1 + 1), h)
+            crops.append(frame[y1:y2, x1:x2])
+
+        return self.embed(crops)
+
+    @property
+    def dim(self) -> int:
+        """
+        Размерность эмбеддинга.
+
+        :return: Длина вектора признаков.
+        :rtype: int
+        """
+        if not hasattr(self, "_dim"):
+            with torch.inference_mode():
+                dummy = torch.zeros(1, 3, self.input_size, self.input_size, device=self.device)
+                self._dim = int(self.model(dummy).flatten(1).shape[1])
+
+        return self._dim
+
+    @staticmethod
+    def _checksum(backbone: str, weights_path: str | None) -> str:
+        """
+        Возвращает идентификатор весов бэкбона для проверки совместимости с индексом.
+
+        :param backbone: Название модели из :mod:`torchvision.models`.
+        :type backbone: str
+        :param weights_path: Путь до ``state_dict`` бэкбона.
+        :type weights_path: str | None
+        :return: ``sha256:<hex>`` файла весов или ``torchvision:<веса>`` для весов по умолчанию.
+        :rtype: str
+        """
+        if weights_path is None:
+            return f"torchvision:{get_model_weights(backbone).DEFAULT}"
+
+        digest = hashlib.sha256()
+        with open(weights_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 ** 2), b""):
+                digest.update(chunk)
+
+        return f"sha256:{digest.hexdigest()}"
+
+    @staticmethod
+    def _load_model(backbone: str, weights_path: str | None) -> nn.Module:
+        """
+        Загружает бэкбон и удаляет его классификационную голову.
+
+        :param backbone: Название модели из :mod:`torchvision.models`.
+        :type backbone: str
+        :param weights_path: Путь до ``state_dict`` бэкбона.
+        :type weights_path: str | None
+        :raises ValueError: Если у модели не найдена классификационная голова.
+        :return: Модель, возвращающая вектор признаков.
+        :rtype: torch.nn.Module
+        """
+        if weights_path is None:
+            model = get_model(backbone, weights="DEFAULT")
+        else:
+            model = get_model(backbone, weights=None)
+            model.load_state_dict(torch.load(weights_path, map_location="cpu"))
+
+        if hasattr(model, "classifier"):
+            model.classifier = nn.Identity()
+        elif hasattr(model, "fc"):
+            model.fc = nn.Identity()
+        else:
+            raise ValueError(f"Unsupported embedding backbone: {backbone}")
+
+        return model
@@ -0,0 +1,128 @@
+from typing import Any
+from pathlib import Path
+from dataclasses import dataclass
+
+import yaml
+import numpy as np
+
+from src.utils import PathLike
+
+PROTOTYPES_FILE = "prototypes.npy"
+METADATA_FILE = "index.yaml"
+
+
+@dataclass(frozen=True)
+class PrototypeIndex:
+    """
+    Индекс прототипов товаров для верификации по эмбеддингам.
+
+    :var prototypes: L2-нормированная матрица прототипов ``C x D``.
+    :vartype prototypes: numpy.ndarray
+    :var labels: Названия товаров; ``labels[i]`` соответствует строке ``prototypes[i]``.
+    :vartype labels: list[str]
+    :var backbone: Бэкбон, которым были получены эмбеддинги.
+    :vartype backbone: str
+    :var input_size: Сторона квадратного входа бэкбона.
+    :vartype input_size: int
+    :var weights_path: Путь до весов бэкбона. ``None`` - предобученные веса ``torchvision``.
+    :vartype weights_path: str | None
+    :var weights_checksum: Идентификатор весов бэкбона (:attr:`CropEmbedder.weights_checksum`).
+        ``None`` для индексов, построенных до его появления.
+    :vartype weights_checksum: str | None
+    """
+    prototypes: np.ndarray
+    labels: list[str]
+    backbone: str
+    input_size: int
+    weights_path: str | None = None
+    weights_checksum: str | None = None
+
+    def __post_init__(self):
+        if self.prototypes.ndim != 2 or self.prototypes.shape[0] != len(self.labels):
+            raise ValueError(
+                f"Prototype matrix shape {self.prototypes.shape} "
+                f"does not match {len(self.labels)} labels"
+            )
+
+    @classmethod
+    def load(cls, index_dir: PathLike, mmap: bool = True) -> 'PrototypeIndex':
+        """
+        Загружает индекс из директории.
+
+        :param index_dir: Директория индекса.
+        :type index_dir: PathLike
+        :param mmap: Отображать ли матрицу прототипов в память вместо полного чтения.
+        :type mmap: bool, optional
+        :return: Загруженный индекс.
+        :rtype: PrototypeIndex
+        """
+        index_dir = Path(index_dir)
+
+        with (index_dir / METADATA_FILE).open("r", encoding="utf-8") as file:
+            metadata: dict[str, Any] = yaml.safe_load(file)
+
+        prototypes = np.load(index_dir / PROTOTYPES_FILE, mmap_mode="r" if mmap else None)
+
+        return cls(
+            prototypes=prototypes,
+            labels=list(metadata["labels"]),
+            backbone=metadata["backbone"],
+            input_size=int(metadata["input_size"]),
+            weights_path=metadata.get("weights_path"),
+            weights_checksum=metadata.get("weights_checksum"),
+        )
+
+    def save(self, index_dir: PathLike) -> str:
+        """
+        Сохраняет индекс в директорию.
+
+        :param index_dir: Директория индекса.
+        :type index_dir: PathLike
+        :return: Путь до директории индекса.
+        :rtype: str
+        """
+        index_dir = Path(index_dir)
+        index_dir.mkdir(parents=True, exist_ok=True)
+
+        np.save(index_dir / PROTOTYPES_FILE, np.ascontiguousarray(self.prototypes, dtype=np.float32))
+
+        metadata = {
+            "backbone": self.backbone,
+            "input_size": self.input_size,
+            "weights_path": self.weights_path,
+            "weights_checksum": self.weights_checksum,
+            "dim": int(self.prototypes.shape[1]),
+            "labels": list(self.labels),
+        }
+        with (index_dir / METADATA_FILE).open("w", encoding="utf-8") as file:
+            yaml.dump(metadata, file, sort_keys=False, allow_unicode=True)
+
+        return str(index_dir)
+
+    def search(self, embeddings: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Находит ближайший прототип для каждого эмбеддинга по косинусной близости.
+
+        Эмбеддинги и прототипы L2-нормированы, поэтому поиск сводится
+        к одному матричному умножению ``N x D @ D x C``.
+
+        :param embeddings: L2-нормированные эмбеддинги ``N x D``.
+        :type embeddings: numpy.ndarray
+        :return: Индексы ближайших прототипов и значения косинусной близости (длины ``N``).
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        similarities = embeddings @ self.prototypes.T
+
+        ids = similarities.argmax(axis=1)
+        scores = similarities[np.arange(len(ids)), ids]
+
+        return ids, scores
+
+    def get_classes(self) -> dict[int, str]:
+        """
+        Возвращает словарь классов индекса.
+
+        :return: Словарь вида ``{class_id: label}``.
+        :rtype: dict[int, str]
+        """
+        return dict(enumerate(self.labels))
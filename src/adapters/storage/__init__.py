@@ -0,0 +1,8 @@
+from .outcomes import Outcome, MismatchRate, OutcomeStore, LatencyBucket
+
+__all__ = [
+    "Outcome",
+    "OutcomeStore",
+    "MismatchRate",
+    "LatencyBucket",
+]
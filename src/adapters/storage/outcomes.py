@@ -0,0 +1,383 @@
+import time
+import sqlite3
+import threading
+import contextlib
+from pathlib import Path
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.utils import PathLike
+from src.core.events import EventBus, DecisionMade
+from src.core.logging import get_logger
+from src.core.affinity import pin_thread
+
+logger = get_logger("storage.outcomes")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcomes (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    requested_label TEXT NOT NULL,
+    detected_label TEXT,
+    confidence REAL,
+    status TEXT NOT NULL,
+    requested_at REAL NOT NULL,
+    decided_at REAL NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outcomes_decided_at ON outcomes (decided_at);
+"""
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """
+    Итог сессии проверки.
+
+    :var session_id: Идентификатор сессии.
+    :vartype session_id: str
+    :var requested_label: Товар из запроса кассы.
+    :vartype requested_label: str
+    :var detected_label: Распознанный товар.
+    :vartype detected_label: str | None
+    :var confidence: Уверенность распознавания.
+    :vartype confidence: float | None
+    :var status: Финальный статус проверки.
+    :vartype status: str
+    :var requested_at: Время запроса кассы (Unix time, в секундах).
+    :vartype requested_at: float
+    :var decided_at: Время принятия решения (Unix time, в секундах).
+    :vartype decided_at: float
+    :var duration: Время от запроса до решения (в секундах).
+    :vartype duration: float
+    """
+    session_id: str
+    requested_label: str
+    detected_label: str | None
+    confidence: float | None
+    status: str
+    requested_at: float
+    decided_at: float
+    duration: float
+
+
+@dataclass(frozen=True)
+class MismatchRate:
+    """
+    Доля несоответствий по товару.
+
+    :var label: Товар из запроса кассы.
+    :vartype label: str
+    :var total: Количество сессий.
+    :vartype total: int
+    :var mismatches: Количество сессий со статусом ``mismatch``.
+    :vartype mismatches: int
+    :var rate: Доля несоответствий ``[0, 1]``.
+    :vartype rate: float
+    """
+    label: str
+    total: int
+    mismatches: int
+    rate: float
+
+
+@dataclass(frozen=True)
+class LatencyBucket:
+    """
+    Перцентили времени до решения за интервал времени.
+
+    :var start: Начало интервала (Unix time, в секундах).
+    :vartype start: float
+    :var count: Количество сессий.
+    :vartype count: int
+    :var p50: Медиана времени до решения (в секундах).
+    :vartype p50: float
+    :var p95: 95-й перцентиль времени до решения (в секундах).
+    :vartype p95: float
+    """
+    start: float
+    count: int
+    p50: float
+    p95: float
+
+
+class OutcomeStore:
+    """
+    Хранилище итогов сессий проверки в SQLite.
+
+    Итоги принимаются без ожидания и записываются фоновым потоком пакетами
+    в одной транзакции. База работает в режиме WAL, поэтому чтение отчетов
+    не блокирует запись. Итоги старше :attr:`retention_days` периодически удаляются.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        retention_days: float | None = 30.0,
+        compact_interval: float = 3600.0,
+        max_pending: int = 10_000,
+    ):
+        """
+        Инициализирует хранилище и запускает поток записи.
+
+        :param path: Путь к файлу базы данных.
+        :type path: PathLike
+        :param batch_size: Количество итогов, при накоплении которого выполняется запись.
+        :type batch_size: int, optional
+        :param flush_interval: Максимальное время ожидания записи итога (в секундах).
+        :type flush_interval: float, optional
+        :param retention_days: Срок хранения итогов (в днях). ``None`` - без ограничения.
+        :type retention_days: float | None, optional
+        :param compact_interval: Период удаления устаревших итогов (в секундах).
+        :type compact_interval: float, optional
+        :param max_pending: Максимальное количество итогов, ожидающих записи.
+            При переполнении новые итоги отбрасываются.
+        :type max_pending: int, optional
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention_days = retention_days
+        self.compact_interval = compact_interval
+        self.max_pending = max_pending
+
+        self._pending: deque[Outcome] = deque()
+        self._condition = threading.Condition()
+        self._dropped: int = 0
+        self._closed = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as connection:
+            connection.executescript(SCHEMA)
+
+        self._writer = threading.Thread(target=self._writer_loop, name="outcome-store", daemon=True)
+        self._writer.start()
+
+    @property
+    def dropped(self) -> int:
+        """
+        Количество итогов, отброшенных из-за переполнения очереди записи.
+
+        :return: Количество отброшенных итогов.
+        :rtype: int
+        """
+        return self._dropped
+
+    def attach(self, events: EventBus, queue_size: int = 1024) -> None:
+        """
+        Подписывает хранилище на решения пайплайна.
+
+        :param events: Шина событий пайплайна.
+        :type events: EventBus
+        :param queue_size: Максимальное количество решений, ожидающих передачи в хранилище.
+        :type queue_size: int, optional
+        """
+        events.subscribe(DecisionMade, self.on_decision, name="outcomes", queue_size=queue_size)
+
+    def on_decision(self, event: DecisionMade) -> None:
+        """
+        Добавляет итог сессии по событию принятия решения.
+
+        :param event: Событие принятия решения.
+        :type event: DecisionMade
+        """
+        self.add(
+            Outcome(
+                session_id=event.request.session_id,
+                requested_label=event.request.label,
+                detected_label=event.result.detected_label,
+                confidence=event.result.confidence,
+                status=event.result.status.value,
+                requested_at=event.request.timestamp,
+                decided_at=event.timestamp,
+                duration=event.session_duration,
+            )
+        )
+
+    def add(self, outcome: Outcome) -> None:
+        """
+        Помещает итог в очередь записи без ожидания.
+
+        :param outcome: Итог сессии.
+        :type outcome: Outcome
+        """
+        with self._condition:
+            if len(self._pending) >= self.max_pending:
+                self._dropped += 1
+                return
+
+            self._pending.append(outcome)
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    def close(self) -> None:
+        """Записывает оставшиеся итоги и останавливает поток записи."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        self._writer.join()
+
+    def mismatch_rates(self, since: float | None = None) -> list[MismatchRate]:
+        """
+        Возвращает доли несоответствий по товарам из запросов кассы.
+
+        :param since: Начало периода (Unix time, в секундах). ``None`` - за все время.
+        :type since: float | None, optional
+        :return: Доли несоответствий в порядке убывания.
+        :rtype: list[MismatchRate]
+        """
+        with contextlib.closing(self._connect()) as connection:
+            rows = connection.execute(
+                """
+                SELECT requested_label, COUNT(*), SUM(status = 'mismatch')
+                FROM outcomes
+                WHERE decided_at >= ?
+                GROUP BY requested_label
+                """,
+                (since or 0.0,),
+            ).fetchall()
+
+        rates = [
+            MismatchRate(label=label, total=total, mismatches=mismatches, rate=mismatches / total)
+            for label, total, mismatches in rows
+        ]
+        return sorted(rates, key=lambda rate: (rate.rate, rate.total), reverse=True)
+
+    def latency_buckets(self, bucket: float = 3600.0, since: float | None = None) -> list[LatencyBucket]:
+        """
+        Возвращает перцентили времени до решения по интервалам времени.
+
+        :param bucket: Длительность интервала (в секундах).
+        :type bucket: float, optional
+        :param since: Начало периода (Unix time, в секундах). ``None`` - за все время.
+        :type since: float | None, optional
+        :return: Перцентили по интервалам в хронологическом порядке.
+        :rtype: list[LatencyBucket]
+        """
+        with contextlib.closing(self._connect()) as connection:
+            rows = connection.execute(
+                """
+                SELECT CAST(decided_at / ? AS INTEGER), duration
+                FROM outcomes
+                WHERE decided_at >= ?
+                ORDER BY decided_at
+                """,
+                (bucket, since or 0.0),
+            ).fetchall()
+
+        durations: dict[int, list[float]] = {}
+        for idx, duration in rows:
+            durations.setdefault(idx, []).append(duration)
+
+        buckets = []
+        for idx, values in durations.items():
+            p50, p95 = np.percentile(values, [50, 95])
+            buckets.append(
+                LatencyBucket(start=idx * bucket, count=len(values), p50=float(p50), p95=float(p95))
+            )
+
+        return buckets
+
+    def compact(self) -> int:
+        """
+        Удаляет итоги старше :attr:`retention_days` и сокращает журнал WAL.
+
+        :return: Количество удаленных итогов.
+        :rtype: int
+        """
+        if self.retention_days is None:
+            return 0
+
+        cutoff = time.time() - self.retention_days * 86400
+        with contextlib.closing(self._connect()) as connection:
+            deleted = connection.execute("DELETE FROM outcomes WHERE decided_at < ?", (cutoff,)).rowcount
+            connection.commit()
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        return deleted
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Открывает соединение с базой в режиме WAL.
+
+        :return: Соединение с базой данных.
+        :rtype: sqlite3.Connection
+        """
+        connection = sqlite3.connect(self.path, timeout=10.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _writer_loop(self) -> None:
+        """Записывает накопленные итоги пакетами и периодически удаляет устаревшие."""
+        pin_thread("io")
+
+        connection = self._connect()
+        last_compact = 0.0
+
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: self._closed or len(self._pending) >= self.batch_size,
+                        timeout=self.flush_interval,
+                    )
+                    batch, self._pending = self._pending, deque()
+                    closed = self._closed
+
+                if batch:
+                    self._write(connection, batch)
+
+                if time.monotonic() - last_compact >= self.compact_interval:
+                    last_compact = time.monotonic()
+                    try:
+                        self.compact()
+                    except sqlite3.Error:
+                        logger.exception("Failed to compact outcome store")
+
+                if closed:
+                    return
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _write(connection: sqlite3.Connection, batch: deque[Outcome]) -> None:
+        """
+        Записывает пакет итогов в одной транзакции.
+
+        :param connection: Соединение с базой данных.
+        :type connection: sqlite3.Connection
+        :param batch: Пакет итогов.
+        :type batch: deque[Outcome]
+        """
+        try:
+            with connection:
+                connection.executemany(
+                    """
+                    INSERT INTO outcomes (
+                        session_id, requested_label, detected_label, confidence,
+                        status, requested_at, decided_at, duration
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            outcome.session_id,
+                            outcome.requested_label,
+                            outcome.detected_label,
+                            outcome.confidence,
+                            outcome.status,
+                            outcome.requested_at,
+                            outcome.decided_at,
+                            outcome.duration,
+                        )
+                        for outcome in batch
+                    ],
+                )
+        except sqlite3.Error:
+            logger.exception("Failed to write outcomes", extra={"count": len(batch)})
@@ -0,0 +1,133 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.core.dto import Detection, CheckoutRequest, VisualCheckResult
+from src.core.logging import get_logger
+from src.adapters.embeddings import CropEmbedder, PrototypeIndex
+from src.app.configs.verifiers import EmbeddingVerifierConfig
+
+from .windowed import WindowedVisualVerifier
+
+logger = get_logger("verifiers.embedding")
+
+
+class EmbeddingVisualVerifier(WindowedVisualVerifier):
+    """
+    Визуальный верификатор с временным окном, определяющий товар
+    по близости эмбеддингов детекций к прототипам товаров.
+
+    Детектор используется только для локализации объектов: класс каждой детекции
+    переопределяется ближайшим прототипом из индекса. Поэтому добавление товара
+    требует только пересборки индекса, а не переобучения детектора.
+    """
+
+    def __init__(self, config: EmbeddingVerifierConfig):
+        """
+        Инициализирует верификатор по эмбеддингам.
+
+        Матрица прототипов отображается в память, бэкбон выбирается
+        согласно метаданным индекса. Веса бэкбона должны совпадать с весами,
+        которыми был построен индекс, иначе близость к прототипам не имеет смысла.
+
+        :param config: Конфигурация верификатора по эмбеддингам.
+        :type config: EmbeddingVerifierConfig
+        :raises ValueError: Если индекс построен с другими весами бэкбона.
+        """
+        self.index = PrototypeIndex.load(config.index_path, mmap=True)
+        self.embedder = CropEmbedder(
+            backbone=self.index.backbone,
+            input_size=self.index.input_size,
+            weights_path=config.weights_path,
+            device=config.device,
+        )
+        self._check_weights()
+        self.similarity_threshold = config.similarity
+
+        # Номер кадра и его переопределенные детекции
+        self._relabeled: tuple[int | None, list[Detection]] | None = None
+
+        super().__init__(config, classes=self.index.get_classes())
+
+    def verify(
+        self,
+        detections: Sequence[Detection],
+        request: CheckoutRequest,
+        frame: np.ndarray | None = None,
+        frame_id: int | None = None,
+    ) -> VisualCheckResult:
+        """
+        Переопределяет классы детекций по индексу прототипов и выполняет
+        визуальную проверку с учетом временного окна.
+
+        Уверенностью переопределенной детекции считается косинусная близость
+        к прототипу. Детекции с близостью ниже :attr:`similarity_threshold`
+        отбрасываются как неизвестные товары. Детекции кадра переопределяются
+        один раз для всех сессий с одним номером кадра.
+
+        :param detections: Объекты, обнаруженные детектором на текущем видеокадре.
+        :type detections: Sequence[Detection]
+        :param request: Запрос от кассы с информацией об ожидаемом товаре.
+        :type request: CheckoutRequest
+        :param frame: Видеокадр, на котором получены детекции.
+        :type frame: numpy.ndarray | None, optional
+        :param frame_id: Порядковый номер кадра. ``None`` - каждый вызов относится к новому кадру.
+        :type frame_id: int | None, optional
+        :raises ValueError: Если кадр не передан.
+        :return: Результат визуальной проверки товара.
+        :rtype: VisualCheckResult
+        """
+        if frame is None:
+            raise ValueError("EmbeddingVisualVerifier requires the frame of the detections")
+
+        if frame_id is None or self._relabeled is None or self._relabeled[0] != frame_id:
+            self._relabeled = (frame_id, self._relabel(frame, detections))
+
+        return super().verify(self._relabeled[1], request, frame, frame_id=frame_id)
+
+    def _check_weights(self) -> None:
+        """
+        Проверяет, что индекс построен с весами бэкбона верификатора.
+
+        :raises ValueError: Если идентификаторы весов индекса и бэкбона различаются.
+        """
+        if self.index.weights_checksum is None:
+            logger.warning(
+                "Prototype index has no embedder weights checksum, rebuild it to enable the check",
+                extra={"backbone": self.index.backbone},
+            )
+            return
+
+        if self.index.weights_checksum != self.embedder.weights_checksum:
+            raise ValueError(
+                f"Prototype index was built with embedder weights {self.index.weights_path or 'default'} "
+                f"({self.index.weights_checksum}), "
+                f"got {self.embedder.weights_path or 'default'} ({self.embedder.weights_checksum})."
+            )
+
+    def _relabel(self, frame: np.ndarray, detections: Sequence[Detection]) -> list[Detection]:
+        """
+        Назначает детекциям классы ближайших прототипов.
+
+        :param frame: Видеокадр, на котором получены детекции.
+        :type frame: numpy.ndarray
+        :param detections: Детекции на кадре.
+        :type detections: Sequence[Detection]
+        :return: Детекции с классами из индекса прототипов.
+        :rtype: list[Detection]
+        """
+        if not detections:
+            return []
+
+        embeddings = self.embedder.embed_regions(frame, [det.bbox for det in detections])
+        ids, scores = self.index.search(embeddings)
+
+        return [
+            Detection(
+                class_id=int(class_id),
+                confidence=float(score),
+                bbox=det.bbox,
+            )
+            for det, class_id, score in zip(detections, ids, scores)
+            if score >= self.similarity_threshold
+        ]
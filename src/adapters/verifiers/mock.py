@@ -1,8 +1,9 @@
 from collections import deque
 from collections.abc import Sequence
 
-from src.core.dto import Detection, CheckoutRequest, VisualCheckResult
-from src.core.dto import VisualCheckStatus
+import numpy as np
+
+from src.core.dto import PENDING_RESULT, Detection, CheckoutRequest, VisualCheckResult
 from src.core.mappers import visual_result_from_mapping
 from src.core.services import VisualVerifier
 from src.app.configs.verifiers import MockVerifierConfig
@@ -29,6 +30,8 @@ class MockVisualVerifier(VisualVerifier):
         self,
         detections: Sequence[Detection],
         request: CheckoutRequest,
+        frame: np.ndarray | None = None,
+        frame_id: int | None = None,
     ) -> VisualCheckResult:
         """
         Возвращает моковые результаты визуальной проверки.
@@ -40,10 +43,14 @@ class MockVisualVerifier(VisualVerifier):
         :type detections: Sequence[Detection]
         :param request: Запрос от кассы с информацией об ожидаемом товаре.
         :type request: CheckoutRequest
+        :param frame: Видеокадр, на котором получены детекции (не используется).
+        :type frame: numpy.ndarray | None, optional
+        :param frame_id: Порядковый номер кадра (не используется).
+        :type frame_id: int | None, optional
         :return: Моковый результат визуальной проверки товара.
         :rtype: VisualCheckResult
         """
         if self.results:
             return self.results.popleft()
 
-        return VisualCheckResult(status=VisualCheckStatus.PENDING)
+        return PENDING_RESULT
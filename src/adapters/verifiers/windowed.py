@@ -3,13 +3,15 @@ from collections import deque, defaultdict
 from dataclasses import dataclass
 from collections.abc import Sequence
 
-from src.core.dto import Detection, CheckoutRequest, VisualCheckResult
+import numpy as np
+
+from src.core.dto import PENDING_RESULT, Detection, CheckoutRequest, VisualCheckResult
 from src.core.dto import VisualCheckStatus
 from src.core.services import VisualVerifier
 from src.app.configs.verifiers import WindowedVerifierConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class TimedDetections:
     """
     Список детекций товаров в определенный временной шаг.
@@ -23,7 +25,7 @@ class TimedDetections:
     detections: list[Detection]
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassStats:
     """
     Статистика детекций по определенному классу.
@@ -40,6 +42,10 @@ class ClassStats:
 class WindowedVisualVerifier(VisualVerifier):
     """
     Визуальный верификатор с временным окном после сканирования товара.
+
+    Поддерживает несколько одновременно открытых сессий проверки: детекции
+    кадра хранятся в общем буфере, а каждая сессия учитывает детекции, полученные
+    после ее открытия, и завершается по истечении собственного временного окна.
     """
 
     def __init__(self, config: WindowedVerifierConfig, classes: dict[int, str]):
@@ -57,18 +63,25 @@ class WindowedVisualVerifier(VisualVerifier):
         self.classes = classes
 
         self._buffer: deque[TimedDetections] = deque()
-        self._active_request: CheckoutRequest | None = None
+        self._sessions: dict[CheckoutRequest, float] = {}
+        # Номер и время последнего кадра, детекции которого добавлены в буфер
+        self._last_frame_id: int | None = None
+        self._last_frame_time: float = 0.0
 
     def verify(
         self,
         detections: Sequence[Detection],
         request: CheckoutRequest,
+        frame: np.ndarray | None = None,
+        frame_id: int | None = None,
     ) -> VisualCheckResult:
         """
         Выполняет визуальную проверку соответствия товара с учетом временного окна.
 
         Наполняет буфер детекциями с кадров в течение указанного временного промежутка.
         Если заданное временное окно не было пройдено, то возвращает статус ``pending``.
+        Детекции одного кадра, переданные для нескольких открытых сессий,
+        добавляются в буфер один раз.
 
         Оценка соответствия отсканированного товара происходит на основе класса, который
         в течение заданного временного окна появлялся большее количество раз и у которого
@@ -78,32 +91,40 @@ class WindowedVisualVerifier(VisualVerifier):
         :type detections: Sequence[Detection]
         :param request: Запрос от кассы с информацией об ожидаемом товаре.
         :type request: CheckoutRequest
+        :param frame: Видеокадр, на котором получены детекции (не используется).
+        :type frame: numpy.ndarray | None, optional
+        :param frame_id: Порядковый номер кадра. ``None`` - каждый вызов относится к новому кадру.
+        :type frame_id: int | None, optional
         :return: Результат визуальной проверки товара.
         :rtype: VisualCheckResult
         """
         now = time.time()
 
-        # Начать новую сессию при новом запросе от кассы
-        if self._is_new_request(request):
-            self._start_new_session(request)
-
-        # Добавить детекции текущего кадра
-        self._buffer.append(
-            TimedDetections(
-                timestamp=now,
-                detections=list(detections),
+        # Добавить детекции текущего кадра (один раз для всех сессий)
+        if frame_id is None or frame_id != self._last_frame_id:
+            self._last_frame_id = frame_id
+            self._last_frame_time = now
+            self._buffer.append(
+                TimedDetections(
+                    timestamp=now,
+                    detections=list(detections),
+                )
             )
-        )
+
+        # Начать новую сессию при новом запросе от кассы с текущего кадра
+        if request not in self._sessions:
+            self._sessions[request] = self._last_frame_time
 
         # Очистка истекших детекций
         self._drop_expired(now)
 
         # Проверка на прохождение заданного временного окна
-        if not self._window_elapsed(now):
-            return VisualCheckResult(status=VisualCheckStatus.PENDING)
+        if not self._window_elapsed(request, now):
+            return PENDING_RESULT
 
-        # Агрегация детекций во временном окне
-        stats = self._aggregate()
+        # Агрегация детекций во временном окне сессии
+        since = max(self._sessions.pop(request), now - self.window_size)
+        stats = self._aggregate(since)
         if not stats:
             return VisualCheckResult(status=VisualCheckStatus.MISMATCH)
 
@@ -121,65 +142,61 @@ class WindowedVisualVerifier(VisualVerifier):
             detected_label=detected_label,
         )
 
-    def _is_new_request(self, request: CheckoutRequest) -> bool:
+    def get_deadline(self, request: CheckoutRequest) -> float:
         """
-        Проверяет, является ли запрос от кассы новым.
+        Возвращает момент окончания временного окна запроса.
 
-        :param request: Запрос для проверки.
+        :param request: Запрос от кассы.
         :type request: CheckoutRequest
-        :return: ``True``, если запрос новый; ``False`` - иначе.
-        :rtype: bool
+        :return: Срок принятия решения (Unix time, в секундах).
+        :rtype: float
         """
-        if self._active_request is None:
-            return True
-
-        return self._active_request.timestamp != request.timestamp
+        return request.timestamp + self.window_size
 
-    def _start_new_session(self, request: CheckoutRequest) -> None:
-        """
-        Инициализирует новую сесиию при новом запросе.
-        Очищает буфер детекций от прошлых запросов.
-
-        :param request: Новый запрос.
-        :type request: CheckoutRequest
-        """
-        self._active_request = request
-        self._buffer.clear()
-
-    def _window_elapsed(self, now: float) -> bool:
+    def _window_elapsed(self, request: CheckoutRequest, now: float) -> bool:
         """
         Проверяет, прошло ли временное окно запроса.
 
+        :param request: Запрос сессии проверки.
+        :type request: CheckoutRequest
         :param now: Текущий временной шаг.
         :type now: float
-        :raises ValueError: Если не задано начальное время запроса :attr:`_request_start_ts`.
         :return: ``True``, если прошло времени больше, чем :attr:`window_size`; ``False`` - иначе.
         :rtype: bool
         """
-        return (now - self._active_request.timestamp) >= self.window_size
+        return (now - request.timestamp) >= self.window_size
 
     def _drop_expired(self, now: float) -> None:
         """
-        Удаляет из буфера детекции, находящиеся за пределом временного окна.
+        Удаляет из буфера детекции, находящиеся за пределом временного окна
+        или полученные до открытия самой ранней сессии.
 
         :param now: Текущий временной шаг.
         :type now: float
         """
+        oldest = now - self.window_size
+        if self._sessions:
+            oldest = max(oldest, min(self._sessions.values()))
+
         while self._buffer:
-            if now - self._buffer[0].timestamp > self.window_size:
+            if self._buffer[0].timestamp < oldest:
                 self._buffer.popleft()
             else:
                 break
 
-    def _aggregate(self) -> dict[int, ClassStats]:
+    def _aggregate(self, since: float) -> dict[int, ClassStats]:
         """
         Агрегирует информация по всем детекциям во временном окне.
 
+        :param since: Начало временного окна.
+        :type since: float
         :return: Словарь вида ``{class_id: ClassStats}``.
         :rtype: dict[int, ClassStats]
         """
         confidences: dict[int, list[float]] = defaultdict(list)
         for frame in self._buffer:
+            if frame.timestamp < since:
+                continue
             for det in frame.detections:
                 if det.confidence >= self.conf_threshold:
                     confidences[det.class_id].append(det.confidence)
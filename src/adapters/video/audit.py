@@ -0,0 +1,331 @@
+import json
+import time
+import threading
+from pathlib import Path
+from collections import deque
+from dataclasses import asdict, dataclass
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+from src.utils import PathLike
+from src.core.dto import Detection, CheckoutRequest, VisualCheckStatus
+from src.core.events import EventBus, DecisionMade, DetectionsReady
+from src.core.affinity import pin_thread
+
+
+@dataclass(frozen=True)
+class AuditFrame:
+    """
+    Сжатый кадр кольцевого буфера.
+
+    :var timestamp: Время получения детекций (Unix time, в секундах).
+    :vartype timestamp: float
+    :var jpeg: Кадр, сжатый в JPEG.
+    :vartype jpeg: bytes
+    :var detections: Детекции на кадре.
+    :vartype detections: list[Detection]
+    """
+    timestamp: float
+    jpeg: bytes
+    detections: list[Detection]
+
+
+@dataclass
+class _PendingDump:
+    """Сохранение окна кадров, ожидающее окончания пост-интервала."""
+    request: CheckoutRequest
+    status: VisualCheckStatus
+    deadline: float
+    frames: list[AuditFrame]
+
+
+class AuditRecorder:
+    """
+    Кольцевой буфер сжатых кадров для разбора спорных решений.
+
+    Хранит JPEG-кадры с детекциями за последние :attr:`pre_seconds` секунд.
+    При решении со статусом из :attr:`triggers` сохраняет на диск буферизованное
+    окно и кадры следующих :attr:`post_seconds` секунд. Окно сохраняется по истечении
+    пост-интервала, даже если новые кадры не поступают (например, сессий больше нет).
+
+    Лимит :attr:`max_bytes` общий для буфера и всех окон, ожидающих сохранения:
+    при его исчерпании вытесняются старые кадры буфера, а если память занята
+    окнами, новый кадр отбрасывается и окна сохраняются досрочно.
+
+    Кадры поступают из шины событий пайплайна, поэтому сжатие выполняется
+    в потоке подписки, а запись на диск - в отдельном потоке.
+    """
+
+    def __init__(
+        self,
+        output_dir: PathLike,
+        pre_seconds: float = 10.0,
+        post_seconds: float = 3.0,
+        max_bytes: int = 64 * 1024 ** 2,
+        jpeg_quality: int = 80,
+        triggers: Iterable[VisualCheckStatus] = (VisualCheckStatus.MISMATCH,),
+    ):
+        """
+        Инициализирует кольцевой буфер.
+
+        :param output_dir: Директория для сохранения окон кадров.
+        :type output_dir: PathLike
+        :param pre_seconds: Длительность окна до решения (в секундах).
+        :type pre_seconds: float, optional
+        :param post_seconds: Длительность окна после решения (в секундах).
+        :type post_seconds: float, optional
+        :param max_bytes: Общий лимит памяти буфера и ожидающих сохранения окон (в байтах).
+        :type max_bytes: int, optional
+        :param jpeg_quality: Качество JPEG-сжатия ``[0, 100]``.
+        :type jpeg_quality: int, optional
+        :param triggers: Статусы решения, при которых сохраняется окно кадров.
+        :type triggers: Iterable[VisualCheckStatus], optional
+        """
+        self.output_dir = Path(output_dir)
+        self.pre_seconds = pre_seconds
+        self.post_seconds = post_seconds
+        self.max_bytes = max_bytes
+        self.jpeg_quality = jpeg_quality
+        self.triggers = frozenset(triggers)
+
+        self._lock = threading.RLock()
+        self._frames: deque[AuditFrame] = deque()
+        # Кадры разделяются буфером и окнами, поэтому память считается по уникальным кадрам
+        self._refs: dict[int, int] = {}
+        self._size = 0
+        self._pending: list[_PendingDump] = []
+        self._timers: list[threading.Timer] = []
+        self._closed = False
+
+        self._writer = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="audit-writer",
+            initializer=pin_thread,
+            initargs=("io",),
+        )
+
+    def attach(self, events: EventBus, queue_size: int = 8) -> None:
+        """
+        Подписывает буфер на события пайплайна.
+
+        :param events: Шина событий пайплайна.
+        :type events: EventBus
+        :param queue_size: Максимальное количество кадров, ожидающих сжатия.
+        :type queue_size: int, optional
+        """
+        events.subscribe(DetectionsReady, self.on_detections, name="audit", queue_size=queue_size)
+        events.subscribe(DecisionMade, self.on_decision, name="audit_decisions")
+
+    def on_detections(self, event: DetectionsReady) -> None:
+        """
+        Сжимает кадр и добавляет его в буфер и в ожидающие сохранения окна.
+
+        :param event: Событие получения детекций.
+        :type event: DetectionsReady
+        """
+        ok, encoded = cv2.imencode(
+            ".jpg",
+            cv2.cvtColor(event.frame, cv2.COLOR_RGB2BGR),
+            [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality],
+        )
+        if not ok:
+            return
+
+        frame = AuditFrame(
+            timestamp=event.timestamp,
+            jpeg=encoded.tobytes(),
+            detections=event.detections,
+        )
+
+        with self._lock:
+            if self._closed:
+                return
+
+            if self._append(frame):
+                ready = self._collect_pending(frame)
+            else:
+                # Память занята окнами, которые уже не могут пополняться
+                ready, self._pending = self._pending, []
+            self._submit(ready)
+
+    def on_decision(self, event: DecisionMade) -> None:
+        """
+        Начинает сохранение окна кадров, если статус решения входит в :attr:`triggers`.
+
+        :param event: Событие принятия решения.
+        :type event: DecisionMade
+        """
+        if event.result.status not in self.triggers:
+            return
+
+        with self._lock:
+            if self._closed:
+                return
+
+            dump = _PendingDump(
+                request=event.request,
+                status=event.result.status,
+                deadline=event.timestamp + self.post_seconds,
+                frames=list(self._frames),
+            )
+            for frame in dump.frames:
+                self._hold(frame)
+            self._pending.append(dump)
+
+            # Окно сохраняется по таймеру, если кадры после решения перестали поступать
+            timer = threading.Timer(max(0.0, dump.deadline - time.time()), self._expire)
+            timer.daemon = True
+            self._timers = [*(t for t in self._timers if t.is_alive()), timer]
+            timer.start()
+
+    def flush(self) -> None:
+        """Сохраняет все ожидающие окна, не дожидаясь окончания пост-интервала."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._submit(pending)
+
+    def close(self) -> None:
+        """Сохраняет ожидающие окна и дожидается окончания записи."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._submit(pending)
+            self._closed = True
+            timers, self._timers = self._timers, []
+
+        for timer in timers:
+            timer.cancel()
+        self._writer.shutdown(wait=True)
+
+    def _expire(self) -> None:
+        """Сохраняет окна, пост-интервал которых истек."""
+        now = time.time()
+        with self._lock:
+            ready = [dump for dump in self._pending if dump.deadline <= now]
+            self._pending = [dump for dump in self._pending if dump.deadline > now]
+            self._submit(ready)
+
+    def _append(self, frame: AuditFrame) -> bool:
+        """
+        Добавляет кадр в буфер, вытесняя кадры старше :attr:`pre_seconds`
+        и старые кадры сверх :attr:`max_bytes`.
+
+        :param frame: Сжатый кадр.
+        :type frame: AuditFrame
+        :return: ``False``, если память занята ожидающими сохранения окнами и кадр отброшен.
+        :rtype: bool
+        """
+        oldest = frame.timestamp - self.pre_seconds
+        while self._frames and (
+            self._frames[0].timestamp < oldest or self._size + len(frame.jpeg) > self.max_bytes
+        ):
+            self._release(self._frames.popleft())
+
+        if self._size + len(frame.jpeg) > self.max_bytes:
+            return False
+
+        self._frames.append(frame)
+        self._hold(frame)
+        return True
+
+    def _collect_pending(self, frame: AuditFrame) -> list[_PendingDump]:
+        """
+        Добавляет кадр в ожидающие окна и возвращает окна, готовые к сохранению.
+
+        :param frame: Сжатый кадр.
+        :type frame: AuditFrame
+        :return: Окна, пост-интервал которых завершен.
+        :rtype: list[_PendingDump]
+        """
+        ready, pending = [], []
+        for dump in self._pending:
+            if frame.timestamp <= dump.deadline:
+                dump.frames.append(frame)
+                self._hold(frame)
+
+            if frame.timestamp >= dump.deadline:
+                ready.append(dump)
+            else:
+                pending.append(dump)
+
+        self._pending = pending
+        return ready
+
+    def _submit(self, dumps: list[_PendingDump]) -> None:
+        """
+        Передает окна потоку записи. Память окна освобождается после записи.
+
+        :param dumps: Окна кадров.
+        :type dumps: list[_PendingDump]
+        """
+        for dump in dumps:
+            future = self._writer.submit(self._write, dump)
+            future.add_done_callback(lambda _, dump=dump: self._release_dump(dump))
+
+    def _release_dump(self, dump: _PendingDump) -> None:
+        """
+        Освобождает память сохраненного окна.
+
+        :param dump: Окно кадров.
+        :type dump: _PendingDump
+        """
+        with self._lock:
+            for frame in dump.frames:
+                self._release(frame)
+
+    def _hold(self, frame: AuditFrame) -> None:
+        """
+        Учитывает ссылку на кадр из буфера или окна.
+
+        :param frame: Сжатый кадр.
+        :type frame: AuditFrame
+        """
+        key = id(frame)
+        count = self._refs.get(key, 0)
+        if count == 0:
+            self._size += len(frame.jpeg)
+        self._refs[key] = count + 1
+
+    def _release(self, frame: AuditFrame) -> None:
+        """
+        Снимает ссылку на кадр. Память кадра освобождается после снятия последней ссылки.
+
+        :param frame: Сжатый кадр.
+        :type frame: AuditFrame
+        """
+        key = id(frame)
+        count = self._refs.pop(key) - 1
+        if count == 0:
+            self._size -= len(frame.jpeg)
+        else:
+            self._refs[key] = count
+
+    def _write(self, dump: _PendingDump) -> None:
+        """
+        Сохраняет окно кадров в директорию ``<output_dir>/<time>_<label>_<status>``.
+
+        :param dump: Окно кадров.
+        :type dump: _PendingDump
+        """
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(dump.request.timestamp))
+        dump_dir = self.output_dir / f"{timestamp}_{dump.request.label}_{dump.status.value}"
+        dump_dir.mkdir(parents=True, exist_ok=True)
+
+        frames_meta = []
+        for idx, frame in enumerate(dump.frames):
+            filename = f"{idx:06d}.jpg"
+            (dump_dir / filename).write_bytes(frame.jpeg)
+            frames_meta.append({
+                "file": filename,
+                "timestamp": frame.timestamp,
+                "detections": [asdict(detection) for detection in frame.detections],
+            })
+
+        meta = {
+            "request": asdict(dump.request),
+            "status": dump.status.value,
+            "frames": frames_meta,
+        }
+        with (dump_dir / "audit.json").open("w", encoding="utf-8") as file:
+            json.dump(meta, file, ensure_ascii=False, indent=2)
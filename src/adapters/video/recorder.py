@@ -1,28 +1,72 @@
 import time
+import threading
+from typing import Literal
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import cv2
 import numpy as np
 
 from src.utils import PathLike
 from src.exceptions import FrameSaveError
+from src.core.affinity import pin_thread
 from src.core.ports.camera import Camera
 
+ImageFormat = Literal["jpg", "png"]
+SegmentFormat = Literal["mp4", "mjpeg"]
+
+# Контейнер и FOURCC кодека для каждого формата сегментов
+SEGMENT_CODECS: dict[str, tuple[str, str]] = {
+    "mp4": (".mp4", "mp4v"),
+    "mjpeg": (".avi", "MJPG"),
+}
+
 
 class FrameRecorder:
-    """Утилита для сохранения кадров из видеопотока камеры."""
+    """
+    Утилита для сохранения кадров из видеопотока камеры.
+
+    Кодирование и запись выполняются вне потока чтения камеры: изображения
+    кодируются пулом потоков, видеосегменты записываются отдельным потоком.
+    Количество ожидающих записи кадров ограничено :attr:`queue_size`.
+    Кадры ставятся в очередь без копирования: камеры проекта возвращают каждый кадр
+    в собственном массиве и не изменяют его после возврата (см. :class:`~src.adapters.cameras.broker.CameraBroker`).
+    """
 
-    def __init__(self, camera: Camera):
+    def __init__(
+        self,
+        camera: Camera,
+        workers: int = 2,
+        queue_size: int = 8,
+        image_format: ImageFormat = "jpg",
+        jpeg_quality: int = 95,
+    ):
         """
         Инициализирует утилиту сохранения кадров.
 
         :param camera: Экземпляр камеры для сохранения кадров с её видеопотока.
         :type camera: Camera
+        :param workers: Количество потоков кодирования изображений.
+        :type workers: int, optional
+        :param queue_size: Максимальное количество кадров, ожидающих записи.
+        :type queue_size: int, optional
+        :param image_format: Формат сохраняемых изображений.
+        :type image_format: ImageFormat, optional
+        :param jpeg_quality: Качество JPEG-сжатия ``[0, 100]``.
+        :type jpeg_quality: int, optional
         """
         self.camera = camera
+        self.workers = workers
+        self.queue_size = queue_size
+        self.image_format = image_format
+        self.jpeg_quality = jpeg_quality
 
     @staticmethod
-    def save_frame(frame: np.ndarray, frame_path: PathLike) -> str:
+    def save_frame(
+        frame: np.ndarray,
+        frame_path: PathLike,
+        params: list[int] | None = None,
+    ) -> str:
         """
         Сохраняет кадр по указанному пути.
 
@@ -30,6 +74,8 @@ class FrameRecorder:
         :type frame: numpy.ndarray
         :param frame_path: Путь к файлу для сохранения.
         :type frame_path: PathLike
+        :param params: Параметры кодирования ``cv2.imwrite``.
+        :type params: list[int] | None, optional
         :raises FrameSaveError: При ошибке сохранения кадра.
         :return: Абсолютный путь к сохраненному кадру.
         :rtype: str
@@ -37,11 +83,11 @@ class FrameRecorder:
         frame_path = Path(frame_path).resolve()
         frame_path.parent.mkdir(parents=True, exist_ok=True)
 
-        frame_to_save = frame.copy()
-        frame_to_save = cv2.cvtColor(frame_to_save, cv2.COLOR_BGR2RGB)
+        # Конвертация создает новый массив, поэтому исходный кадр не изменяется
+        frame_to_save = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
         frame_path = str(frame_path)
 
-        success = cv2.imwrite(frame_path, frame_to_save)
+        success = cv2.imwrite(frame_path, frame_to_save, params or [])
         if not success:
             raise FrameSaveError(f"Failed to save frame on path: {frame_path}")
 
@@ -51,11 +97,19 @@ class FrameRecorder:
         self,
         save_path: PathLike,
         interval: float = 0.0,
-        filename_prefix: str = "frame"
-    ) -> list[str]:
+        filename_prefix: str = "frame",
+        duration: float | None = None,
+        max_frames: int | None = None,
+        segment_seconds: float | None = None,
+        segment_format: SegmentFormat = "mp4",
+    ) -> int:
         """
         Сохраняет кадры из видеопотока с указанным интервалом времени в формате
-        ``filename_prefix_000001.jpg``.
+        ``filename_prefix_000001.jpg`` или, если задан :attr:`segment_seconds`,
+        в видеосегменты ``filename_prefix_000001.mp4``.
+
+        Запись останавливается по ``KeyboardInterrupt``, по истечении ``duration``
+        или после сохранения ``max_frames`` кадров.
 
         :param save_path: Путь к директории для сохранения кадров.
         :type save_path: PathLike
@@ -63,34 +117,308 @@ class FrameRecorder:
         :type interval: float, optional
         :param filename_prefix: Префикс для имен файлов с сохраненными кадрами.
         :type filename_prefix: str, optional
+        :param duration: Длительность записи (в секундах).
+        :type duration: float | None, optional
+        :param max_frames: Максимальное количество сохраняемых кадров.
+        :type max_frames: int | None, optional
+        :param segment_seconds: Длительность видеосегмента (в секундах).
+            Если не указана, каждый кадр сохраняется отдельным изображением.
+        :type segment_seconds: float | None, optional
+        :param segment_format: Формат видеосегментов.
+        :type segment_format: SegmentFormat, optional
         :raises FrameSaveError: При ошибке сохранения кадра.
-        :return: Абсолютные пути до сохраненных кадров.
-        :rtype: list[str]
+        :return: Количество сохраненных кадров.
+        :rtype: int
         """
         save_path = Path(save_path)
         save_path.mkdir(parents=True, exist_ok=True)
 
-        last_save_time = 0.0
+        if segment_seconds is not None:
+            fps = 1.0 / interval if interval > 0 else self.camera.get_actual_properties().fps or 30.0
+            writer = _SegmentWriter(
+                save_path=save_path,
+                filename_prefix=filename_prefix,
+                fps=fps,
+                frames_per_segment=max(1, round(segment_seconds * fps)),
+                segment_format=segment_format,
+                queue_size=self.queue_size,
+            )
+        else:
+            writer = _ImageWriter(
+                save_path=save_path,
+                filename_prefix=filename_prefix,
+                image_format=self.image_format,
+                params=self._encode_params(),
+                workers=self.workers,
+                queue_size=self.queue_size,
+            )
+
+        start_time = time.monotonic()
+        next_save_time = start_time
         frame_count = 0
 
-        saved_frames: list[str] = []
-        while True:
-            try:
-                current_time = time.time()
+        try:
+            while max_frames is None or frame_count < max_frames:
+                if duration is not None and time.monotonic() - start_time >= duration:
+                    break
+
+                # Ожидание момента следующего сохранения без активного опроса
+                delay = next_save_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+                frame = self.camera.read()
+                writer.submit(frame)
+
+                frame_count += 1
+
+                # Без накопления пропущенных сохранений при медленной камере
+                next_save_time = max(next_save_time + interval, time.monotonic())
 
-                # Проверка, прошло ли достаточно времени с последнего сохранения
-                if current_time - last_save_time >= interval:
-                    frame = self.camera.read()
+        except KeyboardInterrupt:
+            pass
 
-                    filename = f"{filename_prefix}_{frame_count:06d}.jpg"
-                    frame_path = self.save_frame(frame, save_path / filename)
-                    saved_frames.append(frame_path)
+        finally:
+            writer.close()
+            self.camera.close()
 
-                    last_save_time = current_time
-                    frame_count += 1
+        return frame_count
+
+    def _encode_params(self) -> list[int]:
+        """
+        Возвращает параметры кодирования изображений.
+
+        :return: Параметры ``cv2.imwrite``.
+        :rtype: list[int]
+        """
+        if self.image_format == "jpg":
+            return [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+
+        return []
 
-            except KeyboardInterrupt:
-                break
 
-        self.camera.close()
-        return saved_frames
+class _ImageWriter:
+    """Запись кадров отдельными изображениями пулом потоков."""
+
+    def __init__(
+        self,
+        save_path: Path,
+        filename_prefix: str,
+        image_format: ImageFormat,
+        params: list[int],
+        workers: int,
+        queue_size: int,
+    ):
+        """
+        Инициализирует запись изображений.
+
+        :param save_path: Директория для сохранения кадров.
+        :type save_path: Path
+        :param filename_prefix: Префикс имен файлов.
+        :type filename_prefix: str
+        :param image_format: Формат изображений.
+        :type image_format: ImageFormat
+        :param params: Параметры кодирования ``cv2.imwrite``.
+        :type params: list[int]
+        :param workers: Количество потоков кодирования.
+        :type workers: int
+        :param queue_size: Максимальное количество кадров, ожидающих записи.
+        :type queue_size: int
+        """
+        self.save_path = save_path
+        self.filename_prefix = filename_prefix
+        self.image_format = image_format
+        self.params = params
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="frame-recorder",
+            initializer=pin_thread,
+            initargs=("io",),
+        )
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._errors: list[BaseException] = []
+        self._frame_idx = 0
+
+    def submit(self, frame: np.ndarray) -> None:
+        """
+        Ставит кадр в очередь на запись, ожидая свободного места в очереди.
+
+        :param frame: RGB-кадр.
+        :type frame: np.ndarray
+        :raises FrameSaveError: Если запись одного из предыдущих кадров завершилась ошибкой.
+        """
+        self._raise_error()
+        self._slots.acquire()
+
+        frame_path = self.save_path / f"{self.filename_prefix}_{self._frame_idx:06d}.{self.image_format}"
+        self._frame_idx += 1
+
+        future = self._executor.submit(FrameRecorder.save_frame, frame, frame_path, self.params)
+        future.add_done_callback(self._on_done)
+
+    def close(self) -> None:
+        """
+        Дожидается записи всех кадров из очереди.
+
+        :raises FrameSaveError: Если запись одного из кадров завершилась ошибкой.
+        """
+        self._executor.shutdown(wait=True)
+        self._raise_error()
+
+    def _on_done(self, future: Future) -> None:
+        """
+        Освобождает место в очереди и сохраняет ошибку записи.
+
+        :param future: Задача записи кадра.
+        :type future: Future
+        """
+        self._slots.release()
+        if future.exception() is not None:
+            self._errors.append(future.exception())
+
+    def _raise_error(self) -> None:
+        """
+        Пробрасывает первую ошибку записи кадров.
+
+        :raises FrameSaveError: Если запись одного из кадров завершилась ошибкой.
+        """
+        if self._errors:
+            raise FrameSaveError("Failed to save frame") from self._errors[0]
+
+
+class _SegmentWriter:
+    """Запись кадров видеосегментами отдельным потоком."""
+
+    def __init__(
+        self,
+        save_path: Path,
+        filename_prefix: str,
+        fps: float,
+        frames_per_segment: int,
+        segment_format: SegmentFormat,
+        queue_size: int,
+    ):
+        """
+        Инициализирует запись видеосегментов.
+
+        :param save_path: Директория для сохранения сегментов.
+        :type save_path: Path
+        :param filename_prefix: Префикс имен файлов.
+        :type filename_prefix: str
+        :param fps: Частота кадров сегментов.
+        :type fps: float
+        :param frames_per_segment: Количество кадров в одном сегменте.
+        :type frames_per_segment: int
+        :param segment_format: Формат сегментов.
+        :type segment_format: SegmentFormat
+        :param queue_size: Максимальное количество кадров, ожидающих записи.
+        :type queue_size: int
+        """
+        self.save_path = save_path
+        self.filename_prefix = filename_prefix
+        self.fps = fps
+        self.frames_per_segment = frames_per_segment
+        self.extension, self.fourcc = SEGMENT_CODECS[segment_format]
+
+        # Видеосегменты записываются последовательно одним потоком
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="segment-recorder",
+            initializer=pin_thread,
+            initargs=("io",),
+        )
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._errors: list[BaseException] = []
+
+        self._writer: cv2.VideoWriter | None = None
+        self._segment_idx = 0
+        self._segment_frames = 0
+
+    def submit(self, frame: np.ndarray) -> None:
+        """
+        Ставит кадр в очередь на запись, ожидая свободного места в очереди.
+
+        :param frame: RGB-кадр.
+        :type frame: np.ndarray
+        :raises FrameSaveError: Если запись одного из предыдущих кадров завершилась ошибкой.
+        """
+        self._raise_error()
+
+        self._slots.acquire()
+        future = self._executor.submit(self._write, frame)
+        future.add_done_callback(self._on_done)
+
+    def close(self) -> None:
+        """
+        Дожидается записи всех кадров и закрывает текущий сегмент.
+
+        :raises FrameSaveError: Если запись одного из кадров завершилась ошибкой.
+        """
+        self._executor.submit(self._release).result()
+        self._executor.shutdown(wait=True)
+        self._raise_error()
+
+    def _write(self, frame: np.ndarray) -> None:
+        """
+        Записывает кадр в текущий сегмент, открывая новый при его заполнении.
+
+        :param frame: RGB-кадр.
+        :type frame: np.ndarray
+        """
+        if self._writer is None or self._segment_frames >= self.frames_per_segment:
+            self._release()
+            self._open_segment(frame)
+
+        self._writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+        self._segment_frames += 1
+
+    def _open_segment(self, frame: np.ndarray) -> None:
+        """
+        Открывает новый видеосегмент с размером кадра.
+
+        :param frame: Первый кадр сегмента.
+        :type frame: np.ndarray
+        :raises FrameSaveError: Если сегмент не удалось открыть.
+        """
+        height, width = frame.shape[:2]
+        segment_path = self.save_path / f"{self.filename_prefix}_{self._segment_idx:06d}{self.extension}"
+
+        writer = cv2.VideoWriter(
+            str(segment_path),
+            cv2.VideoWriter_fourcc(*self.fourcc),
+            self.fps,
+            (width, height),
+        )
+        if not writer.isOpened():
+            raise FrameSaveError(f"Failed to open video segment: {segment_path}")
+
+        self._writer = writer
+        self._segment_idx += 1
+        self._segment_frames = 0
+
+    def _release(self) -> None:
+        """Закрывает текущий видеосегмент."""
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+    def _on_done(self, future: Future) -> None:
+        """
+        Освобождает место в очереди и сохраняет ошибку записи.
+
+        :param future: Задача записи кадра.
+        :type future: Future
+        """
+        self._slots.release()
+        if future.exception() is not None:
+            self._errors.append(future.exception())
+
+    def _raise_error(self) -> None:
+        """
+        Пробрасывает первую ошибку записи кадров.
+
+        :raises FrameSaveError: Если запись одного из кадров завершилась ошибкой.
+        """
+        if self._errors:
+            raise FrameSaveError("Failed to write video segment") from self._errors[0]
@@ -0,0 +1,358 @@
+import time
+import shutil
+from pathlib import Path
+from dataclasses import replace, dataclass
+
+import cv2
+import yaml
+import numpy as np
+
+from src.utils import IMAGE_EXTENSIONS
+from src.core.ports import Detector
+from src.app.factories import build_detector
+from src.app.configs.autotune import AutotuneConfig
+from src.app.configs.detectors import YOLODetectorConfig
+
+# Формат экспорта ultralytics для каждого бэкенда (``None`` - исходные веса PyTorch)
+BACKEND_FORMATS: dict[str, str | None] = {
+    "pytorch": None,
+    "onnx": "onnx",
+    "openvino": "openvino",
+}
+
+# Бэкенды, число потоков которых задается torch.set_num_threads. ONNX Runtime и OpenVINO
+# используют собственные пулы потоков, которые ultralytics не позволяет настроить,
+# поэтому для них замеряется только конфигурация по умолчанию
+THREADED_BACKENDS = frozenset({"pytorch"})
+
+
+@dataclass(frozen=True)
+class AutotuneResult:
+    """
+    Результат замера одной конфигурации детектора.
+
+    :var backend: Бэкенд инференса.
+    :vartype backend: str
+    :var weights_path: Путь к весам модели для бэкенда.
+    :vartype weights_path: str
+    :var input_size: Размер входа детектора.
+    :vartype input_size: int
+    :var threads: Количество потоков внутриоператорного параллелизма PyTorch
+        (``None`` - пул потоков бэкенда по умолчанию).
+    :vartype threads: int | None
+    :var accuracy: Top-1 точность на валидационной выборке.
+    :vartype accuracy: float
+    :var latency_p50: Медиана задержки детекции (в секундах).
+    :vartype latency_p50: float
+    :var latency_p95: p95 задержки детекции (в секундах).
+    :vartype latency_p95: float
+    """
+    backend: str
+    weights_path: str
+    input_size: int
+    threads: int | None
+    accuracy: float
+    latency_p50: float
+    latency_p95: float
+
+
+class Autotuner:
+    """
+    Автонастройка YOLO-детектора под аппаратную платформу.
+
+    Перебирает бэкенды инференса, размеры входа и количество потоков PyTorch
+    (для бэкенда ``pytorch``), замеряет задержку детекции на наборе кадров
+    и выбирает самую быструю по p95
+    конфигурацию, top-1 точность которой на валидационной выборке не ниже
+    :attr:`AutotuneConfig.min_accuracy`.
+    """
+
+    def __init__(self, detector_config: YOLODetectorConfig, config: AutotuneConfig):
+        """
+        Инициализирует автонастройку.
+
+        :param detector_config: Исходная конфигурация YOLO-детектора.
+        :type detector_config: YOLODetectorConfig
+        :param config: Конфигурация автонастройки.
+        :type config: AutotuneConfig
+        :raises ValueError: Если указан неподдерживаемый бэкенд.
+        """
+        unknown = set(config.backends) - BACKEND_FORMATS.keys()
+        if unknown:
+            raise ValueError(
+                f"Unknown autotune backends: {sorted(unknown)}. "
+                f"Allowed: {', '.join(BACKEND_FORMATS)}."
+            )
+
+        self.detector_config = detector_config
+        self.config = config
+
+    def run(self) -> list[AutotuneResult]:
+        """
+        Выполняет замеры всех конфигураций.
+
+        Бэкенды, экспорт в которые недоступен на текущей платформе, пропускаются.
+
+        :raises FileNotFoundError: Если валидационная выборка не найдена.
+        :return: Результаты замеров.
+        :rtype: list[AutotuneResult]
+        """
+        import torch
+
+        samples = self._load_validation()
+        if not samples:
+            raise FileNotFoundError(
+                f"No validation images found in {self.config.images_dir}. "
+                "Mount the autotune frame set (see README) before running autotune"
+            )
+        frames = self._load_frames() or [image for image, _ in samples]
+
+        default_threads = torch.get_num_threads()
+        results: list[AutotuneResult] = []
+
+        for backend in self.config.backends:
+            weights_path = self._export(backend)
+            if weights_path is None:
+                continue
+
+            for input_size in self.config.input_sizes:
+                detector = build_detector(
+                    replace(self.detector_config, weights_path=weights_path, imgsz=input_size)
+                )
+
+                torch.set_num_threads(default_threads)
+                accuracy = self._evaluate(detector, samples)
+
+                thread_counts = self.config.threads if backend in THREADED_BACKENDS else [None]
+                for threads in thread_counts:
+                    torch.set_num_threads(threads or default_threads)
+                    latency_p50, latency_p95 = self._benchmark(detector, frames)
+
+                    result = AutotuneResult(
+                        backend=backend,
+                        weights_path=weights_path,
+                        input_size=input_size,
+                        threads=threads,
+                        accuracy=accuracy,
+                        latency_p50=latency_p50,
+                        latency_p95=latency_p95,
+                    )
+                    results.append(result)
+                    print(
+                        f"{backend:>9} | imgsz={input_size:<4} | threads={threads or 'auto':<4} | "
+                        f"acc={accuracy:.3f} | p50={latency_p50 * 1000:.1f}ms | "
+                        f"p95={latency_p95 * 1000:.1f}ms"
+                    )
+
+        torch.set_num_threads(default_threads)
+        return results
+
+    def select(self, results: list[AutotuneResult]) -> AutotuneResult | None:
+        """
+        Выбирает самую быструю по p95 задержки конфигурацию с допустимой точностью.
+
+        :param results: Результаты замеров.
+        :type results: list[AutotuneResult]
+        :return: Лучшая конфигурация или ``None``, если ни одна не удовлетворяет порогу точности.
+        :rtype: AutotuneResult | None
+        """
+        accepted = [
+            result for result in results
+            if result.accuracy >= self.config.min_accuracy
+        ]
+        if not accepted:
+            return None
+
+        return min(accepted, key=lambda result: result.latency_p95)
+
+    def write_overlay(self, result: AutotuneResult) -> Path:
+        """
+        Записывает выбранную конфигурацию в оверлей конфигурации.
+
+        :param result: Выбранная конфигурация.
+        :type result: AutotuneResult
+        :return: Путь к записанному оверлею.
+        :rtype: Path
+        """
+        overlay = {
+            "detector": {
+                "weights_path": result.weights_path,
+                "imgsz": result.input_size,
+            },
+        }
+        if result.threads is not None:
+            overlay["pipeline"] = {"threads": {"enabled": True, "torch": result.threads}}
+
+        output_path = Path(self.config.output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with output_path.open("w", encoding="utf-8") as file:
+            file.write(
+                f"# Сгенерировано автонастройкой: backend={result.backend}, "
+                f"accuracy={result.accuracy:.3f}, p95={result.latency_p95 * 1000:.1f}ms\n"
+            )
+            yaml.safe_dump(overlay, file, sort_keys=False, allow_unicode=True)
+
+        return output_path
+
+    def _export(self, backend: str) -> str | None:
+        """
+        Экспортирует исходные веса в формат бэкенда.
+
+        Экспорт выполняется с динамическим размером входа, чтобы регулятор рабочей
+        точки мог менять размер входа детектора. Экспортированные веса кэшируются
+        в :attr:`AutotuneConfig.export_dir`.
+
+        :param backend: Бэкенд инференса.
+        :type backend: str
+        :return: Путь к весам для бэкенда или ``None``, если экспорт недоступен.
+        :rtype: str | None
+        """
+        export_format = BACKEND_FORMATS[backend]
+        if export_format is None:
+            return self.detector_config.weights_path
+
+        from ultralytics import YOLO
+
+        weights_path = Path(self.detector_config.weights_path)
+        exported_path = Path(self.config.export_dir) / f"{weights_path.stem}_{backend}"
+        if export_format == "openvino":
+            exported_path = exported_path.with_name(f"{exported_path.name}_openvino_model")
+        else:
+            exported_path = exported_path.with_suffix(f".{export_format}")
+
+        if exported_path.exists():
+            return str(exported_path)
+
+        try:
+            exported = YOLO(str(weights_path)).export(
+                format=export_format,
+                dynamic=True,
+                device=self.detector_config.device,
+                verbose=False,
+            )
+        except Exception as error:
+            print(f"Skipping backend '{backend}': export failed ({error})")
+            return None
+
+        exported_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(exported), exported_path)
+
+        return str(exported_path)
+
+    def _benchmark(self, detector: Detector, frames: list[np.ndarray]) -> tuple[float, float]:
+        """
+        Замеряет задержку детекции на наборе кадров.
+
+        :param detector: Детектор.
+        :type detector: Detector
+        :param frames: Кадры для замера.
+        :type frames: list[np.ndarray]
+        :return: Медиана и p95 задержки детекции (в секундах).
+        :rtype: tuple[float, float]
+        """
+        for idx in range(self.config.warmup):
+            detector.detect(frames[idx % len(frames)])
+
+        latencies = []
+        for idx in range(self.config.repeats):
+            start = time.perf_counter()
+            detector.detect(frames[idx % len(frames)])
+            latencies.append(time.perf_counter() - start)
+
+        return float(np.percentile(latencies, 50)), float(np.percentile(latencies, 95))
+
+    @staticmethod
+    def _evaluate(detector: Detector, samples: list[tuple[np.ndarray, set[int]]]) -> float:
+        """
+        Вычисляет top-1 точность детектора на валидационной выборке.
+
+        Предсказание верно, если класс самой уверенной детекции присутствует в разметке
+        изображения, или если на изображении без разметки нет детекций.
+
+        :param detector: Детектор.
+        :type detector: Detector
+        :param samples: Пары вида ``(image, class_ids)``.
+        :type samples: list[tuple[np.ndarray, set[int]]]
+        :return: Доля верных предсказаний или ``0.0`` для пустой выборки.
+        :rtype: float
+        """
+        if not samples:
+            return 0.0
+
+        correct = 0
+        for image, class_ids in samples:
+            detections = detector.detect(image)
+            if not detections:
+                correct += not class_ids
+                continue
+
+            best = max(detections, key=lambda detection: detection.confidence)
+            correct += best.class_id in class_ids
+
+        return correct / len(samples)
+
+    def _load_frames(self) -> list[np.ndarray]:
+        """
+        Загружает кадры для замера задержки.
+
+        :return: Список RGB-кадров.
+        :rtype: list[np.ndarray]
+        """
+        frames_dir = Path(self.config.frames_dir)
+        if not frames_dir.is_dir():
+            return []
+
+        frames = []
+        for path in sorted(frames_dir.iterdir()):
+            if path.suffix.lower() in IMAGE_EXTENSIONS:
+                frame = self._read_image(path)
+                if frame is not None:
+                    frames.append(frame)
+
+        return frames
+
+    def _load_validation(self) -> list[tuple[np.ndarray, set[int]]]:
+        """
+        Загружает валидационную выборку в формате YOLO.
+
+        :return: Пары вида ``(image, class_ids)`` с RGB-изображениями.
+        :rtype: list[tuple[np.ndarray, set[int]]]
+        """
+        images_dir = Path(self.config.images_dir)
+        labels_dir = Path(self.config.labels_dir)
+        if not images_dir.is_dir():
+            return []
+
+        samples = []
+        for image_path in sorted(images_dir.iterdir()):
+            if image_path.suffix.lower() not in IMAGE_EXTENSIONS:
+                continue
+
+            label_path = labels_dir / f"{image_path.stem}.txt"
+            class_ids = set()
+            if label_path.exists():
+                with label_path.open("r", encoding="utf-8") as file:
+                    class_ids = {int(line.split()[0]) for line in file if line.strip()}
+
+            image = self._read_image(image_path)
+            if image is not None:
+                samples.append((image, class_ids))
+
+        return samples
+
+    @staticmethod
+    def _read_image(path: Path) -> np.ndarray | None:
+        """
+        Считывает изображение в формате RGB, в котором детектор получает кадры камеры.
+
+        :param path: Путь до изображения.
+        :type path: Path
+        :return: RGB-изображение или ``None``, если изображение не удалось прочитать.
+        :rtype: np.ndarray | None
+        """
+        image = cv2.imread(str(path))
+        if image is None:
+            return None
+
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
@@ -0,0 +1,218 @@
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.dto import CheckoutRequest, VisualCheckResult
+from src.core.pipeline import VisualVerificationPipeline
+
+
+@dataclass(frozen=True)
+class AllocationReport:
+    """
+    Прирост памяти пайплайна в установившемся режиме.
+
+    :var frames: Количество измеренных кадров.
+    :vartype frames: int
+    :var bytes_per_frame: Прирост занятой памяти на кадр (в байтах).
+    :vartype bytes_per_frame: float
+    :var blocks_per_frame: Прирост количества выделенных блоков памяти на кадр.
+    :vartype blocks_per_frame: float
+    :var top: Места в коде с наибольшим приростом памяти.
+    :vartype top: list[str]
+    """
+    frames: int
+    bytes_per_frame: float
+    blocks_per_frame: float
+    top: list[str]
+
+
+@dataclass(frozen=True)
+class LatencyReport:
+    """
+    Задержка шага пайплайна в установившемся режиме.
+
+    :var frames: Количество измеренных кадров.
+    :vartype frames: int
+    :var p50: Медиана задержки шага (в секундах).
+    :vartype p50: float
+    :var p95: 95-й перцентиль задержки шага (в секундах).
+    :vartype p95: float
+    :var p99: 99-й перцентиль задержки шага (в секундах).
+    :vartype p99: float
+    :var max: Максимальная задержка шага (в секундах).
+    :vartype max: float
+    """
+    frames: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class _RepeatingCheckoutInput:
+    """Источник запросов, открывающий новую сессию по каждому запросу пайплайна."""
+
+    def __init__(self, label: str):
+        self.label = label
+
+    def get_request(self) -> CheckoutRequest:
+        return CheckoutRequest(label=self.label, timestamp=time.time())
+
+    def poll_request(self) -> CheckoutRequest | None:
+        return None
+
+
+class _NullCheckoutOutput:
+    """Приемник результатов, отбрасывающий результаты проверки."""
+
+    def send_result(self, result: VisualCheckResult) -> None:
+        pass
+
+
+def _replace_checkout(pipeline: VisualVerificationPipeline, label: str) -> None:
+    """
+    Заменяет кассу пайплайна источником, непрерывно открывающим сессии проверки,
+    и приемником, отбрасывающим результаты.
+
+    :param pipeline: Экземпляр пайплайна визуальной проверки.
+    :type pipeline: VisualVerificationPipeline
+    :param label: Метка товара в запросах кассы.
+    :type label: str
+    """
+    pipeline.checkout_input = _RepeatingCheckoutInput(label)
+    pipeline.checkout_output = _NullCheckoutOutput()
+
+
+def _finish_sessions(pipeline: VisualVerificationPipeline) -> int:
+    """
+    Обрабатывает кадры, пока не будут закрыты все открытые сессии проверки.
+
+    :param pipeline: Экземпляр пайплайна визуальной проверки.
+    :type pipeline: VisualVerificationPipeline
+    :return: Количество обработанных кадров.
+    :rtype: int
+    """
+    steps = 0
+    while pipeline.active_requests:
+        pipeline.run_once()
+        steps += 1
+
+    return steps
+
+
+def measure_latency(
+    pipeline: VisualVerificationPipeline,
+    frames: int = 500,
+    warmup: int = 100,
+    label: str = "benchmark",
+) -> LatencyReport:
+    """
+    Измеряет задержку шага пайплайна (захват, детекция, верификация и отправка результата).
+
+    Касса заменяется так же, как в :func:`measure_allocations`. Адаптивный контроллер
+    на время измерения отключается, чтобы пропуск кадров сверх его целевой частоты
+    не входил в задержку шага. Сравнение отчетов, полученных с разными настройками секции
+    ``threads``, показывает влияние пулов потоков и привязки стадий к ядрам
+    на хвост распределения задержки.
+
+    :param pipeline: Экземпляр пайплайна визуальной проверки.
+    :type pipeline: VisualVerificationPipeline
+    :param frames: Количество измеряемых кадров.
+    :type frames: int, optional
+    :param warmup: Количество кадров прогрева.
+    :type warmup: int, optional
+    :param label: Метка товара в запросах кассы.
+    :type label: str, optional
+    :return: Отчет о задержке шага.
+    :rtype: LatencyReport
+    """
+    _replace_checkout(pipeline, label)
+
+    controller, pipeline.controller = pipeline.controller, None
+    try:
+        for _ in range(warmup):
+            pipeline.run_once()
+
+        latencies = np.empty(frames)
+        for idx in range(frames):
+            start = time.perf_counter()
+            pipeline.run_once()
+            latencies[idx] = time.perf_counter() - start
+    finally:
+        pipeline.controller = controller
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return LatencyReport(
+        frames=frames,
+        p50=float(p50),
+        p95=float(p95),
+        p99=float(p99),
+        max=float(latencies.max()),
+    )
+
+
+def measure_allocations(
+    pipeline: VisualVerificationPipeline,
+    frames: int = 500,
+    warmup: int = 100,
+    label: str = "benchmark",
+    top: int = 5,
+) -> AllocationReport:
+    """
+    Измеряет прирост памяти на кадр при работе пайплайна с помощью :mod:`tracemalloc`.
+
+    Касса заменяется источником, непрерывно открывающим сессии проверки, и приемником,
+    отбрасывающим результаты. После прогрева сравниваются снимки памяти до и после
+    обработки не менее ``frames`` кадров, поэтому временные объекты шага не учитываются,
+    а прирост указывает на накопление объектов между кадрами.
+
+    Снимки делаются на границах сессий (после закрытия всех сессий), поэтому
+    детекции, накопленные во временном окне верификатора незавершенной сессии,
+    не принимаются за утечку.
+
+    :param pipeline: Экземпляр пайплайна визуальной проверки.
+    :type pipeline: VisualVerificationPipeline
+    :param frames: Количество измеряемых кадров.
+    :type frames: int, optional
+    :param warmup: Количество кадров прогрева.
+    :type warmup: int, optional
+    :param label: Метка товара в запросах кассы.
+    :type label: str, optional
+    :param top: Количество мест в коде с наибольшим приростом памяти в отчете.
+    :type top: int, optional
+    :return: Отчет о приросте памяти (``frames`` - фактическое число измеренных кадров).
+    :rtype: AllocationReport
+    """
+    _replace_checkout(pipeline, label)
+
+    # Трассировка включается до прогрева: объекты, созданные до ее включения, не отслеживаются,
+    # и их замена новыми объектами (например, в окне верификатора) выглядела бы как прирост
+    tracemalloc.start()
+    try:
+        for _ in range(warmup):
+            pipeline.run_once()
+        _finish_sessions(pipeline)
+
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        for _ in range(frames):
+            pipeline.run_once()
+        frames += _finish_sessions(pipeline)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Исключение аллокаций самого tracemalloc
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+
+    return AllocationReport(
+        frames=frames,
+        bytes_per_frame=sum(stat.size_diff for stat in stats) / frames,
+        blocks_per_frame=sum(stat.count_diff for stat in stats) / frames,
+        top=[str(stat) for stat in stats[:top]],
+    )
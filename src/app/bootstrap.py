@@ -1,16 +1,43 @@
 from typing import Any
 from pathlib import Path
+from dataclasses import replace
 
 import yaml
 
-from src.utils import PathLike
-from src.app.parsers import parse_camera, parse_detector, parse_verifier
-from src.app.parsers import parse_checkout_input, parse_checkout_output
-from src.app.factories import build_camera, build_detector, build_verifier
+from src.utils import PathLike, deep_merge
+from src.app.logs import configure_logging
+from src.app.memory import configure_gc
+from src.core.ports import Camera
+from src.app.parsers import parse_camera, parse_detector, parse_pipeline
+from src.app.parsers import parse_verifier, parse_checkout_input, parse_checkout_output
+from src.app.startup import ComponentBuilder, parse_configs
+from src.app.threads import configure_threads
+from src.core.events import EventBus
+from src.app.shutdown import EVENTS_TIMEOUT, on_shutdown
+from src.core.metrics import MetricsRegistry
+from src.app.factories import build_camera, build_tracer, build_detector
+from src.app.factories import build_profiler, build_verifier, build_scheduler
+from src.app.factories import build_controller, build_camera_broker
+from src.app.factories import build_outcome_store, build_audit_recorder
 from src.app.factories import build_checkout_input, build_checkout_output
+from src.app.factories import build_metrics_reporter
+from src.core.affinity import pin_thread
 from src.core.pipeline import VisualVerificationPipeline
+from src.app.configs.pipeline import BrokerConfig, StartupConfig, PipelineConfig
+from src.app.factories.camera import CameraConfig
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CONFIGS_PATH = PROJECT_ROOT / "configs"
+OVERLAYS_PATH = CONFIGS_PATH / "overlays"
+
+CONFIG_PARSERS = {
+    "camera": parse_camera,
+    "detector": parse_detector,
+    "verifier": parse_verifier,
+    "checkout_input": parse_checkout_input,
+    "checkout_output": parse_checkout_output,
+    "pipeline": parse_pipeline,
+}
 
 
 def load_yaml(path: PathLike) -> dict[str, Any]:
@@ -22,36 +49,167 @@ def load_yaml(path: PathLike) -> dict[str, Any]:
     :return: Словарь, содержищий данные из yaml-файла.
     :rtype: dict[str, Any]
     """
-    with path.open("r", encoding="utf-8") as file:
+    with Path(path).open("r", encoding="utf-8") as file:
         return yaml.safe_load(file)
 
 
-def bootstrap() -> VisualVerificationPipeline:
+def load_config(name: str, overlays: bool = True) -> dict[str, Any]:
+    """
+    Считывает конфигурацию компонента из ``configs/<name>.yaml`` и применяет
+    к ней секции ``<name>`` из оверлеев ``configs/overlays/*.yaml``.
+
+    Оверлеи применяются в алфавитном порядке имен файлов и генерируются
+    автоматически (например, командой автонастройки), поэтому исходные
+    конфигурации остаются неизменными.
+
+    :param name: Название конфигурации без расширения.
+    :type name: str
+    :param overlays: Применять ли оверлеи конфигурации.
+    :type overlays: bool, optional
+    :return: Словарь с параметрами компонента.
+    :rtype: dict[str, Any]
+    """
+    raw = load_yaml(CONFIGS_PATH / f"{name}.yaml") or {}
+    if not overlays:
+        return raw
+
+    for overlay_path in sorted(OVERLAYS_PATH.glob("*.yaml")):
+        overlay = load_yaml(overlay_path) or {}
+        if overlay.get(name):
+            raw = deep_merge(raw, overlay[name])
+
+    return raw
+
+
+def bootstrap(record: bool = True) -> VisualVerificationPipeline:
+    """
+    Создает пайплайн визуальной проверки по конфигурациям из :data:`CONFIGS_PATH`.
+
+    Все конфигурации проверяются до создания компонентов. Камера, детектор, верификатор
+    и адаптеры кассы создаются параллельно (последовательно, если секция ``startup``
+    отключена), готовность каждого компонента записывается в лог и публикуется
+    в метриках как ``startup.<component>``.
+
+    :param record: Подключать ли хранилище итогов (``outcomes``), буфер аудита (``audit``)
+        и выгрузку метрик в лог (``metrics``). Отключается для замеров пайплайна,
+        результаты которых не должны попадать в рабочие данные.
+    :type record: bool, optional
+    :raises ConfigValidationError: Если хотя бы одна конфигурация некорректна.
+    :raises ComponentStartError: Если хотя бы один компонент не создан
+        или не готов в отведенное время.
+    :return: Экземпляр пайплайна визуальной проверки.
+    :rtype: VisualVerificationPipeline
+    """
+    configs = parse_configs(CONFIG_PARSERS, load_config)
+    pipeline_config: PipelineConfig = configs["pipeline"]
+    if not record:
+        pipeline_config = replace(pipeline_config, audit=None, outcomes=None, metrics=None)
+
+    configure_threads(pipeline_config.threads)
+
+    # Поток записи логов наследует ядра стадии ввода-вывода, а остальные потоки,
+    # создаваемые далее (в том числе пулы потоков моделей), - ядра цикла пайплайна
+    pin_thread("io")
+    configure_logging(pipeline_config.logging)
+    pin_thread("inference")
+
+    build_profiler(pipeline_config.profiler)
 
-    CONFIGS_PATH = PROJECT_ROOT / "configs"
+    metrics = MetricsRegistry()
+    events = EventBus(metrics)
 
-    camera_raw = load_yaml(CONFIGS_PATH / "camera.yaml")
-    detector_raw = load_yaml(CONFIGS_PATH / "detector.yaml")
-    verifier_raw = load_yaml(CONFIGS_PATH / "verifier.yaml")
-    checkout_input_raw = load_yaml(CONFIGS_PATH / "checkout_input.yaml")
-    checkout_output_raw = load_yaml(CONFIGS_PATH / "checkout_output.yaml")
+    startup_config = pipeline_config.startup or StartupConfig(timeout=None)
+    builder = ComponentBuilder(
+        startup_config.timeout,
+        startup_config.timeouts,
+        parallel=pipeline_config.startup is not None,
+    )
+    builder.submit("camera", lambda: _open_camera(configs["camera"], pipeline_config.broker, metrics))
+    builder.submit("detector", lambda: build_detector(configs["detector"], metrics))
+    builder.submit(
+        "verifier",
+        lambda detector: build_verifier(configs["verifier"], classes=detector.get_classes()),
+        "detector",
+    )
+    builder.submit("checkout_input", lambda: build_checkout_input(configs["checkout_input"]))
+    builder.submit("checkout_output", lambda: build_checkout_output(configs["checkout_output"]))
+
+    components, statuses = builder.wait()
+    for status in statuses:
+        metrics.set_gauge(f"startup.{status.name}", status.duration)
+
+    recorder = build_audit_recorder(pipeline_config.audit, events)
+    if recorder is not None:
+        on_shutdown("audit", recorder.close)
+
+    store = build_outcome_store(pipeline_config.outcomes, events)
+    if store is not None:
+        on_shutdown("outcomes", store.close)
 
-    camera_config = parse_camera(camera_raw)
-    detector_config = parse_detector(detector_raw)
-    verifier_config = parse_verifier(verifier_raw)
-    checkout_input_config = parse_checkout_input(checkout_input_raw)
-    checkout_output_config = parse_checkout_output(checkout_output_raw)
+    reporter = build_metrics_reporter(pipeline_config.metrics, metrics)
+    if reporter is not None:
+        on_shutdown("metrics", reporter.close)
 
-    camera = build_camera(camera_config)
-    detector = build_detector(detector_config)
-    verifier = build_verifier(verifier_config, classes=detector.get_classes())
-    checkout_input = build_checkout_input(checkout_input_config)
-    checkout_output = build_checkout_output(checkout_output_config)
+    tracer = build_tracer(pipeline_config.tracing)
+    if tracer is not None:
+        on_shutdown("tracer", tracer.close)
 
-    return VisualVerificationPipeline(
-        camera=camera,
-        detector=detector,
-        verifier=verifier,
-        checkout_input=checkout_input,
-        checkout_output=checkout_output,
+    controller = build_controller(pipeline_config.controller, components["detector"], metrics)
+
+    pipeline = VisualVerificationPipeline(
+        camera=components["camera"],
+        detector=components["detector"],
+        verifier=components["verifier"],
+        checkout_input=components["checkout_input"],
+        checkout_output=components["checkout_output"],
+        controller=controller,
+        scheduler=build_scheduler(pipeline_config.scheduler),
+        metrics=metrics,
+        events=events,
+        collect_between_sessions=(
+            pipeline_config.gc is not None and pipeline_config.gc.collect_between_sessions
+        ),
+        tracer=tracer,
     )
+
+    # Действия завершения выполняются в обратном порядке: сначала подписчики шины
+    # обрабатывают уже поставленные события, затем закрываются буфер и хранилище итогов
+    on_shutdown("events", lambda: events.close(EVENTS_TIMEOUT))
+
+    configure_gc(pipeline_config.gc)
+
+    return pipeline
+
+
+def _open_camera(
+    config: CameraConfig,
+    broker_config: BrokerConfig | None,
+    metrics: MetricsRegistry | None = None,
+) -> Camera:
+    """
+    Создает камеру и подключается к источнику видео, чтобы ошибка подключения
+    обнаруживалась при запуске, а не при чтении первого кадра.
+
+    :param config: Конфигурация камеры.
+    :type config: CameraConfig
+    :param broker_config: Конфигурация брокера кадров. ``None``, если брокер отключен.
+    :type broker_config: BrokerConfig | None
+    :param metrics: Реестр метрик для публикации задержки захвата.
+    :type metrics: MetricsRegistry | None, optional
+    :return: Камера или подписка на брокер кадров.
+    :rtype: Camera
+    """
+    camera = build_camera(config, metrics)
+
+    # Пайплайн читает камеру через брокер, к которому могут подключаться другие потребители
+    broker = build_camera_broker(broker_config, camera)
+    if broker is not None:
+        camera = broker.subscribe(
+            queue_size=broker_config.queue_size,
+            drop_policy=broker_config.drop_policy,
+            read_timeout=broker_config.read_timeout,
+        )
+
+    camera.open()
+
+    return camera
@@ -0,0 +1,71 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AutotuneConfig:
+    """
+    Параметры автонастройки детектора под аппаратную платформу.
+
+    :var frames_dir: Директория с кадрами для замера задержки.
+        Если директория отсутствует или пуста, используются изображения валидационной выборки.
+    :vartype frames_dir: str
+    :var images_dir: Директория с изображениями валидационной выборки.
+    :vartype images_dir: str
+    :var labels_dir: Директория с YOLO-разметкой валидационной выборки.
+    :vartype labels_dir: str
+    :var output_path: Путь к генерируемому оверлею конфигурации.
+    :vartype output_path: str
+    :var export_dir: Директория для экспортированных весов модели.
+    :vartype export_dir: str
+    :var backends: Проверяемые бэкенды инференса.
+    :vartype backends: tuple[str, ...]
+    :var input_sizes: Проверяемые размеры входа детектора.
+    :vartype input_sizes: tuple[int, ...]
+    :var threads: Проверяемые количества потоков внутриоператорного параллелизма.
+    :vartype threads: tuple[int, ...]
+    :var min_accuracy: Минимальная top-1 точность на валидационной выборке.
+    :vartype min_accuracy: float
+    :var warmup: Количество прогревочных запусков перед замером.
+    :vartype warmup: int, optional
+    :var repeats: Количество замеров задержки для каждой конфигурации.
+    :vartype repeats: int, optional
+    """
+    frames_dir: str
+    images_dir: str
+    labels_dir: str
+    output_path: str
+    export_dir: str
+    backends: tuple[str, ...]
+    input_sizes: tuple[int, ...]
+    threads: tuple[int, ...]
+    min_accuracy: float
+    warmup: int = 5
+    repeats: int = 30
+
+
+def parse(raw: dict[str, Any]) -> AutotuneConfig:
+    """
+    Создает экземпляр конфигурации автонастройки :class:`AutotuneConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: AutotuneConfig
+    """
+    validation = raw["validation"]
+    benchmark = raw.get("benchmark", {})
+    return AutotuneConfig(
+        frames_dir=raw["frames_dir"],
+        images_dir=validation["images_dir"],
+        labels_dir=validation["labels_dir"],
+        output_path=raw["output_path"],
+        export_dir=raw["export_dir"],
+        backends=tuple(raw["backends"]),
+        input_sizes=tuple(raw["input_sizes"]),
+        threads=tuple(raw["threads"]),
+        min_accuracy=validation["min_accuracy"],
+        warmup=benchmark.get("warmup", 5),
+        repeats=benchmark.get("repeats", 30),
+    )
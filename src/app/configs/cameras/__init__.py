@@ -1,7 +1,9 @@
 from .mock import MockCameraConfig
+from .ffmpeg import FFmpegCameraConfig
 from .opencv import OpenCVCameraConfig
 
 __all__ = [
     "OpenCVCameraConfig",
     "MockCameraConfig",
+    "FFmpegCameraConfig",
 ]
@@ -0,0 +1,69 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FFmpegCameraConfig:
+    """
+    Параметры инициализации камеры на базе процесса FFmpeg.
+
+    :var source: RTSP-адрес, путь к V4L2-устройству или видеофайлу.
+    :vartype source: str
+    :var width: Ширина выходного кадра после масштабирования.
+    :vartype width: int
+    :var height: Высота выходного кадра после масштабирования.
+    :vartype height: int
+    :var fps: Частота выходных кадров. ``None`` сохраняет частоту источника.
+    :vartype fps: int | None, optional
+    :var convert_to_rgb: Выдавать ли кадры в RGB (иначе - в BGR).
+    :vartype convert_to_rgb: bool, optional
+    :var hwaccel: Метод аппаратного декодирования FFmpeg (например, ``auto``, ``vaapi``, ``cuda``).
+    :vartype hwaccel: str | None, optional
+    :var input_format: Формат пикселей V4L2-устройства (например, ``mjpeg``).
+    :vartype input_format: str | None, optional
+    :var rtsp_transport: Транспорт RTSP (``tcp`` или ``udp``).
+    :vartype rtsp_transport: str, optional
+    :var stall_timeout: Время без данных от FFmpeg, после которого процесс перезапускается (в секундах).
+    :vartype stall_timeout: float, optional
+    :var max_restarts: Количество перезапусков процесса подряд до ошибки чтения.
+    :vartype max_restarts: int, optional
+    :var ffmpeg_path: Путь к исполняемому файлу FFmpeg.
+    :vartype ffmpeg_path: str, optional
+    """
+    source: str
+    width: int
+    height: int
+    fps: int | None = None
+    convert_to_rgb: bool = True
+    hwaccel: str | None = None
+    input_format: str | None = None
+    rtsp_transport: str = "tcp"
+    stall_timeout: float = 5.0
+    max_restarts: int = 3
+    ffmpeg_path: str = "ffmpeg"
+
+
+def parse(raw: dict[str, Any]) -> FFmpegCameraConfig:
+    """
+    Создает экземпляр конфигурации камеры :class:`FFmpegCameraConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: FFmpegCameraConfig
+    """
+    resolution = raw["resolution"]
+    return FFmpegCameraConfig(
+        source=str(raw["source"]),
+        width=resolution["width"],
+        height=resolution["height"],
+        fps=raw.get("fps"),
+        convert_to_rgb=raw.get("convert_to_rgb", True),
+        hwaccel=raw.get("hwaccel"),
+        input_format=raw.get("input_format"),
+        rtsp_transport=raw.get("rtsp_transport", "tcp"),
+        stall_timeout=raw.get("stall_timeout", 5.0),
+        max_restarts=raw.get("max_restarts", 3),
+        ffmpeg_path=raw.get("ffmpeg_path", "ffmpeg"),
+    )
@@ -30,7 +30,21 @@ class VideoSourceConfig:
     type: Literal["video"] = field(init=False, default="video")
 
 
-SourceConfig: TypeAlias = DirectorySourceConfig | VideoSourceConfig
+@dataclass(frozen=True)
+class SyntheticSourceConfig:
+    """Процедурный источник кадров без обращения к диску.
+
+    :var num_objects: Количество движущихся объектов на кадре.
+    :vartype num_objects: int, optional
+    :var seed: Зерно генератора случайных чисел.
+    :vartype seed: int, optional
+    """
+    num_objects: int = 3
+    seed: int = 0
+    type: Literal["synthetic"] = field(init=False, default="synthetic")
+
+
+SourceConfig: TypeAlias = DirectorySourceConfig | VideoSourceConfig | SyntheticSourceConfig
 
 
 @dataclass(frozen=True)
@@ -46,11 +60,23 @@ class MockCameraConfig:
     :vartype height: int
     :var fps: Частота кадров.
     :vartype fps: int
+    :var throttle: Выдерживать ли паузу между кадрами согласно :attr:`fps`.
+        Отключается для нагрузочного тестирования детектора и верификатора.
+    :vartype throttle: bool, optional
+    :var cache_mb: Лимит памяти LRU-кэша декодированных кадров (в мегабайтах).
+        ``None`` отключает кэширование.
+    :vartype cache_mb: float | None, optional
+    :var prefetch: Количество кадров, заранее читаемых фоновым потоком.
+        ``0`` отключает упреждающее чтение.
+    :vartype prefetch: int, optional
     """
     source: SourceConfig
     width: int
     height: int
     fps: int
+    throttle: bool = True
+    cache_mb: float | None = None
+    prefetch: int = 0
 
 
 def parse(raw: dict[str, Any]) -> MockCameraConfig:
@@ -78,6 +104,12 @@ def parse(raw: dict[str, Any]) -> MockCameraConfig:
                 path=source_raw.get("path"),
             )
 
+        case "synthetic":
+            source = SyntheticSourceConfig(
+                num_objects=source_raw.get("num_objects", 3),
+                seed=source_raw.get("seed", 0),
+            )
+
         case _:
             raise ValueError(f"Unknown mock camera source type: {source_type}")
 
@@ -87,4 +119,7 @@ def parse(raw: dict[str, Any]) -> MockCameraConfig:
         width=resolution.get("width"),
         height=resolution.get("height"),
         fps=raw.get("fps"),
+        throttle=raw.get("throttle", True),
+        cache_mb=raw.get("cache_mb"),
+        prefetch=raw.get("prefetch", 0),
     )
@@ -1,6 +1,8 @@
-from typing import Any
+from typing import Any, Literal, get_args
 from dataclasses import dataclass
 
+DrainMode = Literal["none", "grab", "thread"]
+
 
 @dataclass(frozen=True)
 class OpenCVCameraConfig:
@@ -17,12 +19,34 @@ class OpenCVCameraConfig:
     :vartype fps: int | None, optional
     :var convert_to_rgb: Конвертировать ли BGR в RGB.
     :vartype convert_to_rgb: bool, optional
+    :var buffer_size: Размер внутреннего буфера кадров (``CAP_PROP_BUFFERSIZE``).
+    :vartype buffer_size: int | None, optional
+    :var fourcc: Код формата пикселей камеры (например, ``MJPG``).
+    :vartype fourcc: str | None, optional
+    :var drain: Стратегия получения самого свежего кадра:
+        ``none`` - чтение очередного кадра из буфера,
+        ``grab`` - пропуск накопленных в буфере кадров перед чтением,
+        ``thread`` - непрерывное чтение в фоновом потоке с хранением только последнего кадра.
+    :vartype drain: DrainMode, optional
+    :var max_drain_grabs: Максимальное количество пропускаемых кадров в режиме ``grab``.
+    :vartype max_drain_grabs: int, optional
+    :var read_timeout: Время ожидания нового кадра в режиме ``thread`` (в секундах).
+    :vartype read_timeout: float, optional
+    :var ffmpeg_options: Параметры захвата FFmpeg-бэкенда OpenCV
+        (например, ``{"rtsp_transport": "tcp", "fflags": "nobuffer"}``).
+    :vartype ffmpeg_options: dict[str, str] | None, optional
     """
     source: int | str = 0
     width: int | None = None
     height: int | None = None
     fps: int | None = None
     convert_to_rgb: bool = True
+    buffer_size: int | None = None
+    fourcc: str | None = None
+    drain: DrainMode = "none"
+    max_drain_grabs: int = 5
+    read_timeout: float = 1.0
+    ffmpeg_options: dict[str, str] | None = None
 
 
 def parse(raw: dict[str, Any]) -> OpenCVCameraConfig:
@@ -32,14 +56,34 @@ def parse(raw: dict[str, Any]) -> OpenCVCameraConfig:
 
     :param raw: Словарь с параметрами для конфигурации.
     :type raw: dict[str, Any]
+    :raises ValueError: Если указана неизвестная стратегия получения кадра.
     :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
     :rtype: OpenCVCameraConfig
     """
     resolution = raw.get("resolution", {})
+
+    drain = raw.get("drain", "none")
+    if drain not in get_args(DrainMode):
+        raise ValueError(
+            f"Invalid drain mode: {drain}. "
+            f"Allowed: {', '.join(get_args(DrainMode))}."
+        )
+
+    fourcc = raw.get("fourcc")
+    if fourcc is not None and len(fourcc) != 4:
+        raise ValueError(f"FOURCC code must contain 4 characters, got: {fourcc}")
+
+    ffmpeg_options = raw.get("ffmpeg_options")
     return OpenCVCameraConfig(
         source=raw.get("source", 0),
         width=resolution.get("width"),
         height=resolution.get("height"),
         fps=raw.get("fps"),
         convert_to_rgb=raw.get("convert_to_rgb", True),
+        buffer_size=raw.get("buffer_size"),
+        fourcc=fourcc,
+        drain=drain,
+        max_drain_grabs=raw.get("max_drain_grabs", 5),
+        read_timeout=raw.get("read_timeout", 1.0),
+        ffmpeg_options={k: str(v) for k, v in ffmpeg_options.items()} if ffmpeg_options else None,
     )
@@ -1,7 +1,11 @@
 from .mock import MockDetectorConfig
 from .yolo import YOLODetectorConfig
+from .cached import CachedDetectorConfig
+from .switching import SwitchingDetectorConfig
 
 __all__ = [
     "YOLODetectorConfig",
     "MockDetectorConfig",
+    "CachedDetectorConfig",
+    "SwitchingDetectorConfig",
 ]
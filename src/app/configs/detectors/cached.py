@@ -0,0 +1,44 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CachedDetectorConfig:
+    """
+    Параметры инициализации детектора с повторным использованием детекций для статичной сцены.
+
+    :var detector: Конфигурация детектора, результаты которого кэшируются.
+    :vartype detector: DetectorConfig
+    :var hash_size: Сторона уменьшенного кадра для отпечатка (в блоках).
+    :vartype hash_size: int, optional
+    :var tolerance: Допустимое отличие среднего значения блока ``[0, 255]``,
+        при котором сцена считается неизменной.
+    :vartype tolerance: float, optional
+    :var max_age: Максимальное время повторного использования детекций (в секундах).
+    :vartype max_age: float, optional
+    """
+    detector: Any
+    hash_size: int = 16
+    tolerance: float = 8.0
+    max_age: float = 1.0
+
+
+def parse(raw: dict[str, Any]) -> CachedDetectorConfig:
+    """
+    Создает экземпляр конфигурации детектора с кэшем :class:`CachedDetectorConfig`
+    на основе переданного словаря. Вложенная конфигурация детектора разбирается
+    по ее ключу ``"type"``.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: CachedDetectorConfig
+    """
+    from src.app.parsers.detector import parse_detector
+
+    return CachedDetectorConfig(
+        detector=parse_detector(raw["detector"]),
+        hash_size=raw.get("hash_size", 16),
+        tolerance=raw.get("tolerance", 8.0),
+        max_age=raw.get("max_age", 1.0),
+    )
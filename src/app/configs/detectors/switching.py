@@ -0,0 +1,54 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SwitchingDetectorConfig:
+    """
+    Параметры инициализации детектора с переключением на резервную модель.
+
+    :var primary: Конфигурация основного детектора.
+    :vartype primary: DetectorConfig
+    :var fallback: Конфигурация облегченного резервного детектора.
+    :vartype fallback: DetectorConfig
+    :var latency_threshold: Порог p95 задержки основного детектора (в секундах),
+        при превышении которого выполняется переключение на резервный.
+    :vartype latency_threshold: float
+    :var recover_threshold: Порог p95 задержки резервного детектора (в секундах),
+        ниже которого выполняется возврат к основному.
+    :vartype recover_threshold: float
+    :var window: Количество кадров для оценки p95 задержки.
+    :vartype window: int, optional
+    :var min_dwell: Минимальное время работы после переключения (в секундах).
+    :vartype min_dwell: float, optional
+    """
+    primary: Any
+    fallback: Any
+    latency_threshold: float
+    recover_threshold: float
+    window: int = 30
+    min_dwell: float = 10.0
+
+
+def parse(raw: dict[str, Any]) -> SwitchingDetectorConfig:
+    """
+    Создает экземпляр конфигурации детектора с переключением :class:`SwitchingDetectorConfig`
+    на основе переданного словаря. Вложенные конфигурации детекторов разбираются
+    по их ключу ``"type"``.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: SwitchingDetectorConfig
+    """
+    from src.app.parsers.detector import parse_detector
+
+    thresholds = raw.get("thresholds", {})
+    return SwitchingDetectorConfig(
+        primary=parse_detector(raw["primary"]),
+        fallback=parse_detector(raw["fallback"]),
+        latency_threshold=thresholds["latency_p95"],
+        recover_threshold=thresholds["recover_p95"],
+        window=raw.get("window", 30),
+        min_dwell=raw.get("min_dwell", 10.0),
+    )
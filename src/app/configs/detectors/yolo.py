@@ -19,12 +19,20 @@ class YOLODetectorConfig:
     :vartype iou_threshold: float, optional
     :var device: Целевое устройство для инференса.
     :vartype device: str, optional
+    :var imgsz: Сторона входного изображения модели (в пикселях).
+    :vartype imgsz: int, optional
+    :var reload_interval: Период проверки обновления файла весов (в секундах).
+        При изменении файла модель перезагружается без остановки процесса.
+        ``None`` отключает проверку.
+    :vartype reload_interval: float | None, optional
     """
     weights_path: str
     classes: dict[int, str]
     confidence_threshold: float = 0.25
     iou_threshold: float = 0.7
     device: str = "cpu"
+    imgsz: int = 640
+    reload_interval: float | None = None
 
 
 def parse(raw: dict[str, Any]) -> YOLODetectorConfig:
@@ -44,4 +52,6 @@ def parse(raw: dict[str, Any]) -> YOLODetectorConfig:
         confidence_threshold=thresholds.get("confidence", 0.25),
         iou_threshold=thresholds.get("iou", 0.7),
         device=raw.get("device", "cpu"),
+        imgsz=raw.get("imgsz", 640),
+        reload_interval=raw.get("reload_interval"),
     )
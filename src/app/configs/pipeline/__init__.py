@@ -0,0 +1,29 @@
+from .gc import GCConfig
+from .audit import AuditConfig
+from .broker import BrokerConfig
+from .logging import LoggingConfig
+from .metrics import MetricsConfig
+from .startup import StartupConfig
+from .threads import ThreadsConfig
+from .tracing import TracingConfig
+from .outcomes import OutcomesConfig
+from .pipeline import PipelineConfig
+from .profiler import ProfilerConfig
+from .scheduler import SchedulerConfig
+from .controller import ControllerConfig
+
+__all__ = [
+    "PipelineConfig",
+    "ControllerConfig",
+    "ThreadsConfig",
+    "BrokerConfig",
+    "AuditConfig",
+    "SchedulerConfig",
+    "GCConfig",
+    "TracingConfig",
+    "ProfilerConfig",
+    "LoggingConfig",
+    "OutcomesConfig",
+    "StartupConfig",
+    "MetricsConfig",
+]
@@ -0,0 +1,67 @@
+from typing import Any
+from dataclasses import dataclass
+
+from src.core.dto import VisualCheckStatus
+
+
+@dataclass(frozen=True)
+class AuditConfig:
+    """
+    Параметры кольцевого буфера кадров для разбора спорных решений.
+
+    :var output_dir: Директория для сохранения окон кадров.
+    :vartype output_dir: str
+    :var pre_seconds: Длительность окна до решения (в секундах).
+    :vartype pre_seconds: float, optional
+    :var post_seconds: Длительность окна после решения (в секундах).
+    :vartype post_seconds: float, optional
+    :var max_mb: Лимит памяти буфера (в мегабайтах).
+    :vartype max_mb: float, optional
+    :var jpeg_quality: Качество JPEG-сжатия ``[0, 100]``.
+    :vartype jpeg_quality: int, optional
+    :var triggers: Статусы решения, при которых сохраняется окно кадров.
+    :vartype triggers: tuple[VisualCheckStatus, ...], optional
+    :var queue_size: Максимальное количество кадров, ожидающих сжатия.
+    :vartype queue_size: int, optional
+    """
+    output_dir: str
+    pre_seconds: float = 10.0
+    post_seconds: float = 3.0
+    max_mb: float = 64.0
+    jpeg_quality: int = 80
+    triggers: tuple[VisualCheckStatus, ...] = (VisualCheckStatus.MISMATCH,)
+    queue_size: int = 8
+
+
+def parse(raw: dict[str, Any]) -> AuditConfig:
+    """
+    Создает экземпляр конфигурации кольцевого буфера :class:`AuditConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если указан неизвестный или промежуточный статус решения.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: AuditConfig
+    """
+    # Решение по сессии всегда финальное, поэтому промежуточный статус не может быть триггером
+    allowed = [status.value for status in VisualCheckStatus if status is not VisualCheckStatus.PENDING]
+
+    triggers = []
+    for trigger in raw.get("triggers", ["mismatch"]):
+        if trigger not in allowed:
+            raise ValueError(
+                f"Invalid audit trigger: {trigger}. "
+                f"Allowed: {', '.join(allowed)}."
+            )
+        triggers.append(VisualCheckStatus(trigger))
+
+    return AuditConfig(
+        output_dir=raw["output_dir"],
+        pre_seconds=raw.get("pre_seconds", 10.0),
+        post_seconds=raw.get("post_seconds", 3.0),
+        max_mb=raw.get("max_mb", 64.0),
+        jpeg_quality=raw.get("jpeg_quality", 80),
+        triggers=tuple(triggers),
+        queue_size=raw.get("queue_size", 8),
+    )
@@ -0,0 +1,51 @@
+from typing import Any, Literal, get_args
+from dataclasses import dataclass
+
+DropPolicy = Literal["oldest", "newest"]
+
+
+@dataclass(frozen=True)
+class BrokerConfig:
+    """
+    Параметры брокера кадров камеры и подписки пайплайна на него.
+
+    :var queue_size: Максимальное количество кадров в очереди пайплайна.
+    :vartype queue_size: int, optional
+    :var drop_policy: Политика при переполнении очереди пайплайна
+        (``oldest`` - вытеснение самого старого кадра, ``newest`` - отбрасывание нового).
+    :vartype drop_policy: DropPolicy, optional
+    :var read_timeout: Время ожидания кадра (в секундах).
+    :vartype read_timeout: float, optional
+    :var retry_interval: Пауза перед повторным чтением после ошибки камеры (в секундах).
+    :vartype retry_interval: float, optional
+    """
+    queue_size: int = 1
+    drop_policy: DropPolicy = "oldest"
+    read_timeout: float = 1.0
+    retry_interval: float = 1.0
+
+
+def parse(raw: dict[str, Any]) -> BrokerConfig:
+    """
+    Создает экземпляр конфигурации брокера кадров :class:`BrokerConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если указана неизвестная политика переполнения очереди.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: BrokerConfig
+    """
+    drop_policy = raw.get("drop_policy", "oldest")
+    if drop_policy not in get_args(DropPolicy):
+        raise ValueError(
+            f"Invalid drop policy: {drop_policy}. "
+            f"Allowed: {', '.join(get_args(DropPolicy))}."
+        )
+
+    return BrokerConfig(
+        queue_size=raw.get("queue_size", 1),
+        drop_policy=drop_policy,
+        read_timeout=raw.get("read_timeout", 1.0),
+        retry_interval=raw.get("retry_interval", 1.0),
+    )
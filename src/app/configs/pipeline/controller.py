@@ -0,0 +1,66 @@
+from typing import Any
+from dataclasses import field, dataclass
+
+STAGES = ("capture", "detect", "verify", "output")
+
+
+@dataclass(frozen=True)
+class ControllerConfig:
+    """
+    Параметры регулятора рабочей точки пайплайна.
+
+    :var latency_budget: Бюджет задержки обработки одного кадра (в секундах).
+    :vartype latency_budget: float
+    :var input_sizes: Допустимые размеры входа детектора.
+    :vartype input_sizes: tuple[int, ...]
+    :var min_fps: Минимальная частота обработки кадров.
+    :vartype min_fps: float
+    :var max_fps: Максимальная частота обработки кадров.
+    :vartype max_fps: float
+    :var window: Количество кадров, по которым принимается решение об изменении рабочей точки.
+    :vartype window: int, optional
+    :var recover_ratio: Доля бюджета, ниже которой p95 задержки позволяет увеличить размер входа.
+    :vartype recover_ratio: float, optional
+    :var headroom: Целевая загрузка пайплайна ``(0, 1]`` при выборе частоты обработки.
+    :vartype headroom: float, optional
+    :var stage_budgets: Бюджеты задержки стадий вида ``{stage: seconds}``.
+    :vartype stage_budgets: dict[str, float], optional
+    """
+    latency_budget: float
+    input_sizes: tuple[int, ...]
+    min_fps: float
+    max_fps: float
+    window: int = 30
+    recover_ratio: float = 0.6
+    headroom: float = 0.8
+    stage_budgets: dict[str, float] = field(default_factory=dict)
+
+
+def parse(raw: dict[str, Any]) -> ControllerConfig:
+    """
+    Создает экземпляр конфигурации регулятора :class:`ControllerConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если бюджет задан для неизвестной стадии.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: ControllerConfig
+    """
+    min_fps, max_fps = raw["fps_range"]
+
+    stage_budgets = dict(raw.get("stage_budgets") or {})
+    for stage in stage_budgets:
+        if stage not in STAGES:
+            raise ValueError(f"Invalid controller stage: {stage}. Allowed: {', '.join(STAGES)}.")
+
+    return ControllerConfig(
+        latency_budget=raw["latency_budget"],
+        input_sizes=tuple(raw["input_sizes"]),
+        min_fps=min_fps,
+        max_fps=max_fps,
+        window=raw.get("window", 30),
+        recover_ratio=raw.get("recover_ratio", 0.6),
+        headroom=raw.get("headroom", 0.8),
+        stage_budgets=stage_budgets,
+    )
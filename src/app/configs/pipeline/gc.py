@@ -0,0 +1,38 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GCConfig:
+    """
+    Параметры сборщика мусора в установившемся режиме работы.
+
+    :var freeze: Переносить ли объекты, созданные при инициализации,
+        в постоянное поколение (``gc.freeze()``).
+    :vartype freeze: bool, optional
+    :var threshold: Порог автоматической сборки нулевого поколения.
+        ``None`` оставляет значение по умолчанию.
+    :vartype threshold: int | None, optional
+    :var collect_between_sessions: Выполнять ли полную сборку перед ожиданием запроса кассы.
+    :vartype collect_between_sessions: bool, optional
+    """
+    freeze: bool = True
+    threshold: int | None = None
+    collect_between_sessions: bool = True
+
+
+def parse(raw: dict[str, Any]) -> GCConfig:
+    """
+    Создает экземпляр конфигурации сборщика мусора :class:`GCConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: GCConfig
+    """
+    return GCConfig(
+        freeze=raw.get("freeze", True),
+        threshold=raw.get("threshold"),
+        collect_between_sessions=raw.get("collect_between_sessions", True),
+    )
@@ -0,0 +1,69 @@
+from typing import Any
+from dataclasses import field, dataclass
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+@dataclass(frozen=True)
+class LoggingConfig:
+    """
+    Параметры структурированного асинхронного логирования.
+
+    :var level: Уровень логирования компонентов.
+    :vartype level: str, optional
+    :var path: Путь к файлу лога в формате JSON lines. ``None`` отключает запись в файл.
+    :vartype path: str | None, optional
+    :var max_mb: Максимальный размер файла лога перед ротацией (в мегабайтах).
+    :vartype max_mb: float, optional
+    :var backups: Количество хранимых файлов после ротации.
+    :vartype backups: int, optional
+    :var console: Выводить ли записи в stderr.
+    :vartype console: bool, optional
+    :var debug_rate: Максимальное количество отладочных записей в секунду на место вызова.
+    :vartype debug_rate: float, optional
+    :var queue_size: Максимальное количество записей, ожидающих записи.
+    :vartype queue_size: int, optional
+    :var levels: Уровни логирования отдельных компонентов вида ``{component: level}``.
+    :vartype levels: dict[str, str], optional
+    """
+    level: str = "INFO"
+    path: str | None = None
+    max_mb: float = 10.0
+    backups: int = 5
+    console: bool = True
+    debug_rate: float = 1.0
+    queue_size: int = 10_000
+    levels: dict[str, str] = field(default_factory=dict)
+
+
+def parse(raw: dict[str, Any]) -> LoggingConfig:
+    """
+    Создает экземпляр конфигурации логирования :class:`LoggingConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если указан неизвестный уровень логирования.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: LoggingConfig
+    """
+    level = raw.get("level", "INFO").upper()
+    levels = {component: value.upper() for component, value in (raw.get("levels") or {}).items()}
+
+    for value in (level, *levels.values()):
+        if value not in LEVELS:
+            raise ValueError(
+                f"Invalid logging level: {value}. "
+                f"Allowed: {', '.join(LEVELS)}."
+            )
+
+    return LoggingConfig(
+        level=level,
+        path=raw.get("path"),
+        max_mb=raw.get("max_mb", 10.0),
+        backups=raw.get("backups", 5),
+        console=raw.get("console", True),
+        debug_rate=raw.get("debug_rate", 1.0),
+        queue_size=raw.get("queue_size", 10_000),
+        levels=levels,
+    )
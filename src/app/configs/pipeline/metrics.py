@@ -0,0 +1,31 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    """
+    Параметры выгрузки метрик пайплайна.
+
+    :var interval: Период записи снимка метрик в лог (в секундах).
+    :vartype interval: float, optional
+    """
+    interval: float = 10.0
+
+
+def parse(raw: dict[str, Any]) -> MetricsConfig:
+    """
+    Создает экземпляр конфигурации выгрузки метрик :class:`MetricsConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если период выгрузки не положительный.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: MetricsConfig
+    """
+    interval = raw.get("interval", 10.0)
+    if interval <= 0:
+        raise ValueError(f"Invalid metrics interval: {interval}. Allowed: > 0.")
+
+    return MetricsConfig(interval=interval)
@@ -0,0 +1,40 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class OutcomesConfig:
+    """
+    Параметры хранилища итогов сессий проверки.
+
+    :var path: Путь к файлу базы данных SQLite.
+    :vartype path: str
+    :var batch_size: Количество итогов, при накоплении которого выполняется запись.
+    :vartype batch_size: int, optional
+    :var flush_interval: Максимальное время ожидания записи итога (в секундах).
+    :vartype flush_interval: float, optional
+    :var retention_days: Срок хранения итогов (в днях). ``None`` - без ограничения.
+    :vartype retention_days: float | None, optional
+    """
+    path: str
+    batch_size: int = 64
+    flush_interval: float = 1.0
+    retention_days: float | None = 30.0
+
+
+def parse(raw: dict[str, Any]) -> OutcomesConfig:
+    """
+    Создает экземпляр конфигурации хранилища итогов :class:`OutcomesConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: OutcomesConfig
+    """
+    return OutcomesConfig(
+        path=raw["path"],
+        batch_size=raw.get("batch_size", 64),
+        flush_interval=raw.get("flush_interval", 1.0),
+        retention_days=raw.get("retention_days", 30.0),
+    )
@@ -0,0 +1,122 @@
+from typing import Any
+from dataclasses import dataclass
+from collections.abc import Callable
+
+from .gc import GCConfig
+from .gc import parse as parse_gc
+from .audit import AuditConfig
+from .audit import parse as parse_audit
+from .broker import BrokerConfig
+from .broker import parse as parse_broker
+from .logging import LoggingConfig
+from .logging import parse as parse_logging
+from .metrics import MetricsConfig
+from .metrics import parse as parse_metrics
+from .startup import StartupConfig
+from .startup import parse as parse_startup
+from .threads import ThreadsConfig
+from .threads import parse as parse_threads
+from .tracing import TracingConfig
+from .tracing import parse as parse_tracing
+from .outcomes import OutcomesConfig
+from .outcomes import parse as parse_outcomes
+from .profiler import ProfilerConfig
+from .profiler import parse as parse_profiler
+from .scheduler import SchedulerConfig
+from .scheduler import parse as parse_scheduler
+from .controller import ControllerConfig
+from .controller import parse as parse_controller
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """
+    Параметры пайплайна визуальной проверки.
+
+    Каждая секция необязательна: отсутствующая или отключенная
+    (``enabled: false``) секция соответствует значению ``None``.
+
+    :var controller: Параметры регулятора рабочей точки.
+    :vartype controller: ControllerConfig | None, optional
+    :var threads: Параметры пулов потоков вычислительных библиотек.
+    :vartype threads: ThreadsConfig | None, optional
+    :var broker: Параметры брокера кадров камеры.
+    :vartype broker: BrokerConfig | None, optional
+    :var audit: Параметры кольцевого буфера кадров для разбора спорных решений.
+    :vartype audit: AuditConfig | None, optional
+    :var scheduler: Параметры планировщика кадров по сроку актуальности.
+    :vartype scheduler: SchedulerConfig | None, optional
+    :var gc: Параметры сборщика мусора в установившемся режиме работы.
+    :vartype gc: GCConfig | None, optional
+    :var tracing: Параметры трассировки сессий проверки.
+    :vartype tracing: TracingConfig | None, optional
+    :var profiler: Параметры сэмплирующего профилировщика, запускаемого сигналом.
+    :vartype profiler: ProfilerConfig | None, optional
+    :var logging: Параметры структурированного асинхронного логирования.
+    :vartype logging: LoggingConfig | None, optional
+    :var outcomes: Параметры хранилища итогов сессий проверки.
+    :vartype outcomes: OutcomesConfig | None, optional
+    :var startup: Параметры параллельного создания компонентов при запуске.
+    :vartype startup: StartupConfig | None, optional
+    :var metrics: Параметры выгрузки метрик пайплайна в лог.
+    :vartype metrics: MetricsConfig | None, optional
+    """
+    controller: ControllerConfig | None = None
+    threads: ThreadsConfig | None = None
+    broker: BrokerConfig | None = None
+    audit: AuditConfig | None = None
+    scheduler: SchedulerConfig | None = None
+    gc: GCConfig | None = None
+    tracing: TracingConfig | None = None
+    profiler: ProfilerConfig | None = None
+    logging: LoggingConfig | None = None
+    outcomes: OutcomesConfig | None = None
+    startup: StartupConfig | None = None
+    metrics: MetricsConfig | None = None
+
+
+def parse(raw: dict[str, Any] | None) -> PipelineConfig:
+    """
+    Создает экземпляр конфигурации пайплайна :class:`PipelineConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any] | None
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: PipelineConfig
+    """
+    raw = raw or {}
+    return PipelineConfig(
+        controller=_parse_section(raw.get("controller"), parse_controller),
+        threads=_parse_section(raw.get("threads"), parse_threads),
+        broker=_parse_section(raw.get("broker"), parse_broker),
+        audit=_parse_section(raw.get("audit"), parse_audit),
+        scheduler=_parse_section(raw.get("scheduler"), parse_scheduler),
+        gc=_parse_section(raw.get("gc"), parse_gc),
+        tracing=_parse_section(raw.get("tracing"), parse_tracing),
+        profiler=_parse_section(raw.get("profiler"), parse_profiler),
+        logging=_parse_section(raw.get("logging"), parse_logging),
+        outcomes=_parse_section(raw.get("outcomes"), parse_outcomes),
+        startup=_parse_section(raw.get("startup"), parse_startup),
+        metrics=_parse_section(raw.get("metrics"), parse_metrics),
+    )
+
+
+def _parse_section(
+    raw: dict[str, Any] | None,
+    parse_fn: Callable[[dict[str, Any]], Any],
+) -> Any:
+    """
+    Разбирает необязательную секцию конфигурации пайплайна.
+
+    :param raw: Словарь с параметрами секции.
+    :type raw: dict[str, Any] | None
+    :param parse_fn: Функция разбора секции.
+    :type parse_fn: Callable[[dict[str, Any]], Any]
+    :return: Конфигурация секции или ``None``, если секция отсутствует или отключена.
+    :rtype: Any
+    """
+    if not raw or not raw.get("enabled", True):
+        return None
+
+    return parse_fn(raw)
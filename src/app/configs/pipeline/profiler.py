@@ -0,0 +1,51 @@
+import signal
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ProfilerConfig:
+    """
+    Параметры сэмплирующего профилировщика, запускаемого сигналом.
+
+    :var output_dir: Директория файлов профилирования.
+    :vartype output_dir: str
+    :var duration: Длительность профилирования (в секундах).
+    :vartype duration: float, optional
+    :var interval: Период снятия стеков (в секундах).
+    :vartype interval: float, optional
+    :var signum: Сигнал, запускающий профилирование.
+    :vartype signum: signal.Signals, optional
+    """
+    output_dir: str
+    duration: float = 30.0
+    interval: float = 0.01
+    signum: signal.Signals = signal.SIGUSR1
+
+
+def parse(raw: dict[str, Any]) -> ProfilerConfig:
+    """
+    Создает экземпляр конфигурации профилировщика :class:`ProfilerConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если указан неизвестный сигнал.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: ProfilerConfig
+    """
+    allowed = ["SIGUSR1", "SIGUSR2"]
+
+    signal_name = raw.get("signal", "SIGUSR1")
+    if signal_name not in allowed:
+        raise ValueError(
+            f"Invalid profiler signal: {signal_name}. "
+            f"Allowed: {', '.join(allowed)}."
+        )
+
+    return ProfilerConfig(
+        output_dir=raw["output_dir"],
+        duration=raw.get("duration", 30.0),
+        interval=raw.get("interval", 0.01),
+        signum=signal.Signals[signal_name],
+    )
@@ -0,0 +1,32 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """
+    Параметры планировщика кадров по сроку актуальности.
+
+    :var max_frame_age: Максимальный возраст кадра к началу детекции (в секундах).
+    :vartype max_frame_age: float
+    :var max_skips: Максимальное количество кадров, пропускаемых подряд.
+    :vartype max_skips: int, optional
+    """
+    max_frame_age: float
+    max_skips: int = 3
+
+
+def parse(raw: dict[str, Any]) -> SchedulerConfig:
+    """
+    Создает экземпляр конфигурации планировщика кадров :class:`SchedulerConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: SchedulerConfig
+    """
+    return SchedulerConfig(
+        max_frame_age=raw["max_frame_age"],
+        max_skips=raw.get("max_skips", 3),
+    )
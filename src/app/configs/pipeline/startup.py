@@ -0,0 +1,44 @@
+from typing import Any
+from dataclasses import field, dataclass
+
+COMPONENTS = ("camera", "detector", "verifier", "checkout_input", "checkout_output")
+
+
+@dataclass(frozen=True)
+class StartupConfig:
+    """
+    Параметры параллельного создания компонентов при запуске.
+
+    :var timeout: Время готовности компонента с начала запуска или, для компонента
+        с зависимостями, с готовности зависимостей (в секундах). ``None`` - без ограничения.
+    :vartype timeout: float | None, optional
+    :var timeouts: Время готовности отдельных компонентов вида ``{component: seconds}``.
+    :vartype timeouts: dict[str, float], optional
+    """
+    timeout: float | None = 60.0
+    timeouts: dict[str, float] = field(default_factory=dict)
+
+
+def parse(raw: dict[str, Any]) -> StartupConfig:
+    """
+    Создает экземпляр конфигурации запуска :class:`StartupConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если указан неизвестный компонент.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: StartupConfig
+    """
+    timeouts = raw.get("timeouts") or {}
+    for component in timeouts:
+        if component not in COMPONENTS:
+            raise ValueError(
+                f"Invalid startup component: {component}. "
+                f"Allowed: {', '.join(COMPONENTS)}."
+            )
+
+    return StartupConfig(
+        timeout=raw.get("timeout", 60.0),
+        timeouts=dict(timeouts),
+    )
@@ -0,0 +1,56 @@
+from typing import Any, get_args
+from dataclasses import field, dataclass
+
+from src.core.affinity import Stage
+
+
+@dataclass(frozen=True)
+class ThreadsConfig:
+    """
+    Параметры пулов потоков вычислительных библиотек и привязки стадий к ядрам процессора.
+
+    :var torch: Количество потоков внутриоператорного параллелизма PyTorch.
+        ``None`` оставляет значение по умолчанию.
+    :vartype torch: int | None, optional
+    :var opencv: Количество потоков OpenCV (``cv2.setNumThreads``).
+        ``None`` оставляет значение по умолчанию.
+    :vartype opencv: int | None, optional
+    :var blas: Количество потоков BLAS, используемых NumPy.
+        ``None`` оставляет значение по умолчанию.
+    :vartype blas: int | None, optional
+    :var affinity: Ядра процессора стадий вида ``{stage: cpus}``:
+        ``capture`` - чтение камеры, ``inference`` - цикл пайплайна и пулы потоков моделей,
+        ``io`` - подписчики событий и фоновая запись на диск.
+    :vartype affinity: dict[Stage, tuple[int, ...]], optional
+    """
+    torch: int | None = None
+    opencv: int | None = None
+    blas: int | None = None
+    affinity: dict[Stage, tuple[int, ...]] = field(default_factory=dict)
+
+
+def parse(raw: dict[str, Any]) -> ThreadsConfig:
+    """
+    Создает экземпляр конфигурации пулов потоков :class:`ThreadsConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если указана неизвестная стадия пайплайна.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: ThreadsConfig
+    """
+    affinity = raw.get("affinity") or {}
+    for stage in affinity:
+        if stage not in get_args(Stage):
+            raise ValueError(
+                f"Invalid affinity stage: {stage}. "
+                f"Allowed: {', '.join(get_args(Stage))}."
+            )
+
+    return ThreadsConfig(
+        torch=raw.get("torch"),
+        opencv=raw.get("opencv"),
+        blas=raw.get("blas"),
+        affinity={stage: tuple(cpus) for stage, cpus in affinity.items()},
+    )
@@ -0,0 +1,49 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TracingConfig:
+    """
+    Параметры трассировки сессий проверки.
+
+    :var output_dir: Директория файлов трассировки.
+    :vartype output_dir: str
+    :var sample_rate: Доля трассируемых сессий ``[0, 1]``.
+    :vartype sample_rate: float, optional
+    :var flush_interval: Период записи накопленных событий (в секундах).
+    :vartype flush_interval: float, optional
+    :var max_mb: Максимальный размер файла трассировки перед ротацией (в мегабайтах).
+    :vartype max_mb: float, optional
+    :var backups: Количество хранимых файлов после ротации.
+    :vartype backups: int, optional
+    """
+    output_dir: str
+    sample_rate: float = 1.0
+    flush_interval: float = 1.0
+    max_mb: float = 50.0
+    backups: int = 5
+
+
+def parse(raw: dict[str, Any]) -> TracingConfig:
+    """
+    Создает экземпляр конфигурации трассировки :class:`TracingConfig`
+    на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :raises ValueError: Если доля трассируемых сессий вне диапазона ``[0, 1]``.
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: TracingConfig
+    """
+    sample_rate = raw.get("sample_rate", 1.0)
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError(f"Invalid tracing sample rate: {sample_rate}. Allowed: [0, 1].")
+
+    return TracingConfig(
+        output_dir=raw["output_dir"],
+        sample_rate=sample_rate,
+        flush_interval=raw.get("flush_interval", 1.0),
+        max_mb=raw.get("max_mb", 50.0),
+        backups=raw.get("backups", 5),
+    )
@@ -1,7 +1,9 @@
 from .mock import MockVerifierConfig
 from .windowed import WindowedVerifierConfig
+from .embedding import EmbeddingVerifierConfig
 
 __all__ = [
     "MockVerifierConfig",
     "WindowedVerifierConfig",
+    "EmbeddingVerifierConfig",
 ]
@@ -0,0 +1,54 @@
+from typing import Any
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EmbeddingVerifierConfig:
+    """
+    Параметры инициализации верификатора по эмбеддингам.
+
+    :var index_path: Путь до директории индекса прототипов.
+    :vartype index_path: str
+    :var weights_path: Путь до ``state_dict`` бэкбона. Если не указан,
+        используются предобученные веса ``torchvision``.
+    :vartype weights_path: str | None, optional
+    :var device: Целевое устройство для инференса бэкбона.
+    :vartype device: str, optional
+    :var similarity: Минимальная косинусная близость детекции к прототипу.
+    :vartype similarity: float, optional
+    :var window_size: Длительность окна агрегации детекций (в секундах).
+    :vartype window_size: float, optional
+    :var confidence: Минимальная средняя близость для подтверждения товара.
+    :vartype confidence: float, optional
+    :var detections: Минимальное число появлений товара.
+    :vartype detections: int, optional
+    """
+    index_path: str
+    weights_path: str | None = None
+    device: str = "cpu"
+    similarity: float = 0.5
+    window_size: float = 5.0
+    confidence: float = 0.5
+    detections: int = 1
+
+
+def parse(raw: dict[str, Any]) -> EmbeddingVerifierConfig:
+    """
+    Создает экземпляр конфигурации верификатора по эмбеддингам
+    :class:`EmbeddingVerifierConfig` на основе переданного словаря.
+
+    :param raw: Словарь с параметрами для конфигурации.
+    :type raw: dict[str, Any]
+    :return: Экземпляр конфигурации, инициализированный параметрами из словаря.
+    :rtype: EmbeddingVerifierConfig
+    """
+    thresholds = raw.get("thresholds", {})
+    return EmbeddingVerifierConfig(
+        index_path=raw["index_path"],
+        weights_path=raw.get("weights_path"),
+        device=raw.get("device", "cpu"),
+        similarity=thresholds.get("similarity", 0.5),
+        window_size=raw["window_size"],
+        confidence=thresholds.get("confidence", 0.5),
+        detections=thresholds.get("detections", 1),
+    )
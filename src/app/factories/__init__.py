@@ -1,6 +1,14 @@
+from .audit import build_audit_recorder
+from .broker import build_camera_broker
 from .camera import build_camera
+from .tracer import build_tracer
+from .metrics import build_metrics_reporter
 from .detector import build_detector
+from .outcomes import build_outcome_store
+from .profiler import build_profiler
 from .verifier import build_verifier
+from .scheduler import build_scheduler
+from .controller import build_controller
 from .checkout_input import build_checkout_input
 from .checkout_output import build_checkout_output
 
@@ -10,4 +18,12 @@ __all__ = [
     "build_checkout_input",
     "build_checkout_output",
     "build_verifier",
+    "build_controller",
+    "build_camera_broker",
+    "build_audit_recorder",
+    "build_scheduler",
+    "build_tracer",
+    "build_profiler",
+    "build_outcome_store",
+    "build_metrics_reporter",
 ]
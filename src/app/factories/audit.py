@@ -0,0 +1,30 @@
+from src.core.events import EventBus
+from src.adapters.video.audit import AuditRecorder
+from src.app.configs.pipeline import AuditConfig
+
+
+def build_audit_recorder(config: AuditConfig | None, events: EventBus) -> AuditRecorder | None:
+    """
+    Возвращает кольцевой буфер кадров, подписанный на события пайплайна.
+
+    :param config: Конфигурация буфера. ``None``, если буфер отключен.
+    :type config: AuditConfig | None
+    :param events: Шина событий пайплайна.
+    :type events: EventBus
+    :return: Экземпляр буфера или ``None``, если буфер отключен.
+    :rtype: AuditRecorder | None
+    """
+    if config is None:
+        return None
+
+    recorder = AuditRecorder(
+        output_dir=config.output_dir,
+        pre_seconds=config.pre_seconds,
+        post_seconds=config.post_seconds,
+        max_bytes=int(config.max_mb * 1024 ** 2),
+        jpeg_quality=config.jpeg_quality,
+        triggers=config.triggers,
+    )
+    recorder.attach(events, queue_size=config.queue_size)
+
+    return recorder
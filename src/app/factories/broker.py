@@ -0,0 +1,20 @@
+from src.core.ports import Camera
+from src.app.configs.pipeline import BrokerConfig
+from src.adapters.cameras.broker import CameraBroker
+
+
+def build_camera_broker(config: BrokerConfig | None, camera: Camera) -> CameraBroker | None:
+    """
+    Возвращает экземпляр брокера кадров камеры.
+
+    :param config: Конфигурация брокера. ``None``, если брокер отключен.
+    :type config: BrokerConfig | None
+    :param camera: Камера - источник кадров.
+    :type camera: Camera
+    :return: Экземпляр брокера или ``None``, если брокер отключен.
+    :rtype: CameraBroker | None
+    """
+    if config is None:
+        return None
+
+    return CameraBroker(camera, retry_interval=config.retry_interval)
@@ -1,17 +1,21 @@
 from typing import TypeAlias
 
+from src.core.metrics import MetricsRegistry
 from src.core.ports.camera import Camera
-from src.app.configs.cameras import MockCameraConfig, OpenCVCameraConfig
+from src.app.configs.cameras import MockCameraConfig, FFmpegCameraConfig
+from src.app.configs.cameras import OpenCVCameraConfig
 
-CameraConfig: TypeAlias = MockCameraConfig | OpenCVCameraConfig
+CameraConfig: TypeAlias = MockCameraConfig | OpenCVCameraConfig | FFmpegCameraConfig
 
-def build_camera(config: CameraConfig) -> Camera:
+def build_camera(config: CameraConfig, metrics: MetricsRegistry | None = None) -> Camera:
     """
     Возвращает экземпляр камеры в зависимости от
     типа переданной конфигурации.
 
     :param config: Конфигурация камеры.
     :type config: CameraConfig
+    :param metrics: Реестр метрик для публикации метрик захвата кадров.
+    :type metrics: MetricsRegistry | None, optional
     :raises TypeError: Если тип конфигурции не соответвует допустимому.
     :return: Экзепляр камеры, инициализированный конфигурацией.
     :rtype: Camera
@@ -22,9 +26,13 @@ def build_camera(config: CameraConfig) -> Camera:
 
     if isinstance(config, OpenCVCameraConfig):
         from src.adapters.cameras.opencv import OpenCVCamera
-        return OpenCVCamera(config)
+        return OpenCVCamera(config, metrics)
+
+    if isinstance(config, FFmpegCameraConfig):
+        from src.adapters.cameras.ffmpeg import FFmpegCamera
+        return FFmpegCamera(config, metrics)
 
     raise TypeError(
         f"Invalid configuration type: {type(config)}. "
-        f"Allowed: MockCameraConfig, OpenCVCameraConfig."
+        f"Allowed: MockCameraConfig, OpenCVCameraConfig, FFmpegCameraConfig."
     )
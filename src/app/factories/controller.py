@@ -0,0 +1,38 @@
+from src.core.ports import Detector
+from src.core.metrics import MetricsRegistry
+from src.core.services import AdaptiveController
+from src.app.configs.pipeline import ControllerConfig
+
+
+def build_controller(
+    config: ControllerConfig | None,
+    detector: Detector,
+    metrics: MetricsRegistry | None = None,
+) -> AdaptiveController | None:
+    """
+    Возвращает экземпляр регулятора рабочей точки пайплайна.
+
+    :param config: Конфигурация регулятора. ``None``, если регулятор отключен.
+    :type config: ControllerConfig | None
+    :param detector: Детектор, размер входа которого регулируется.
+    :type detector: Detector
+    :param metrics: Реестр метрик для публикации текущей рабочей точки.
+    :type metrics: MetricsRegistry | None, optional
+    :return: Экземпляр регулятора или ``None``, если регулятор отключен.
+    :rtype: AdaptiveController | None
+    """
+    if config is None:
+        return None
+
+    return AdaptiveController(
+        detector=detector,
+        latency_budget=config.latency_budget,
+        input_sizes=config.input_sizes,
+        min_fps=config.min_fps,
+        max_fps=config.max_fps,
+        window=config.window,
+        recover_ratio=config.recover_ratio,
+        headroom=config.headroom,
+        stage_budgets=config.stage_budgets,
+        metrics=metrics,
+    )
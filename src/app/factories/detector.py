@@ -1,17 +1,23 @@
 from typing import TypeAlias
 
+from src.core.metrics import MetricsRegistry
 from src.core.ports.detector import Detector
 from src.app.configs.detectors import MockDetectorConfig, YOLODetectorConfig
+from src.app.configs.detectors import CachedDetectorConfig, SwitchingDetectorConfig
 
-DetectorConfig: TypeAlias = MockDetectorConfig | YOLODetectorConfig
+DetectorConfig: TypeAlias = (
+    MockDetectorConfig | YOLODetectorConfig | SwitchingDetectorConfig | CachedDetectorConfig
+)
 
-def build_detector(config: DetectorConfig) -> Detector:
+def build_detector(config: DetectorConfig, metrics: MetricsRegistry | None = None) -> Detector:
     """
     Возвращает экземпляр детектора в зависимости от
     типа переданной конфигурации.
 
     :param config: Конфигурация детектора.
     :type config: DetectorConfig
+    :param metrics: Реестр метрик пайплайна.
+    :type metrics: MetricsRegistry | None, optional
     :raises TypeError: Если тип Конфигурации не соответвует допустимому.
     :return: Экзепляр детектора, инициализированный конфигурацией
     :rtype: Detector
@@ -24,7 +30,28 @@ def build_detector(config: DetectorConfig) -> Detector:
         from src.adapters.detectors.yolo import YOLODetector
         return YOLODetector(config)
 
+    if isinstance(config, SwitchingDetectorConfig):
+        from src.adapters.detectors.switching import SwitchingDetector
+        return SwitchingDetector(
+            primary=build_detector(config.primary, metrics),
+            fallback=build_detector(config.fallback, metrics),
+            latency_threshold=config.latency_threshold,
+            recover_threshold=config.recover_threshold,
+            window=config.window,
+            min_dwell=config.min_dwell,
+        )
+
+    if isinstance(config, CachedDetectorConfig):
+        from src.adapters.detectors.cached import CachedDetector
+        return CachedDetector(
+            detector=build_detector(config.detector, metrics),
+            hash_size=config.hash_size,
+            tolerance=config.tolerance,
+            max_age=config.max_age,
+            metrics=metrics,
+        )
+
     raise TypeError(
         f"Invalid configuration type: {type(config)}. "
-        f"Allowed: MockDetectorConfig, YOLODetectorConfig."
+        f"Allowed: MockDetectorConfig, YOLODetectorConfig, SwitchingDetectorConfig, CachedDetectorConfig."
     )
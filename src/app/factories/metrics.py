@@ -0,0 +1,19 @@
+from src.core.metrics import MetricsRegistry, MetricsReporter
+from src.app.configs.pipeline import MetricsConfig
+
+
+def build_metrics_reporter(config: MetricsConfig | None, metrics: MetricsRegistry) -> MetricsReporter | None:
+    """
+    Возвращает запущенную выгрузку метрик пайплайна в лог.
+
+    :param config: Конфигурация выгрузки метрик. ``None``, если выгрузка отключена.
+    :type config: MetricsConfig | None
+    :param metrics: Реестр метрик пайплайна.
+    :type metrics: MetricsRegistry
+    :return: Экземпляр выгрузки метрик или ``None``, если выгрузка отключена.
+    :rtype: MetricsReporter | None
+    """
+    if config is None:
+        return None
+
+    return MetricsReporter(metrics, interval=config.interval)
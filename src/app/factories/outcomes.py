@@ -0,0 +1,28 @@
+from src.core.events import EventBus
+from src.adapters.storage import OutcomeStore
+from src.app.configs.pipeline import OutcomesConfig
+
+
+def build_outcome_store(config: OutcomesConfig | None, events: EventBus) -> OutcomeStore | None:
+    """
+    Возвращает хранилище итогов сессий, подписанное на решения пайплайна.
+
+    :param config: Конфигурация хранилища. ``None``, если хранилище отключено.
+    :type config: OutcomesConfig | None
+    :param events: Шина событий пайплайна.
+    :type events: EventBus
+    :return: Экземпляр хранилища или ``None``, если хранилище отключено.
+    :rtype: OutcomeStore | None
+    """
+    if config is None:
+        return None
+
+    store = OutcomeStore(
+        path=config.path,
+        batch_size=config.batch_size,
+        flush_interval=config.flush_interval,
+        retention_days=config.retention_days,
+    )
+    store.attach(events)
+
+    return store
@@ -0,0 +1,24 @@
+from src.app.profiler import SamplingProfiler
+from src.app.configs.pipeline import ProfilerConfig
+
+
+def build_profiler(config: ProfilerConfig | None) -> SamplingProfiler | None:
+    """
+    Возвращает сэмплирующий профилировщик с установленным обработчиком сигнала.
+
+    :param config: Конфигурация профилировщика. ``None``, если профилировщик отключен.
+    :type config: ProfilerConfig | None
+    :return: Экземпляр профилировщика или ``None``, если профилировщик отключен.
+    :rtype: SamplingProfiler | None
+    """
+    if config is None:
+        return None
+
+    profiler = SamplingProfiler(
+        output_dir=config.output_dir,
+        duration=config.duration,
+        interval=config.interval,
+    )
+    profiler.install(config.signum)
+
+    return profiler
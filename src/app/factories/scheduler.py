@@ -0,0 +1,20 @@
+from src.core.services import FrameScheduler
+from src.app.configs.pipeline import SchedulerConfig
+
+
+def build_scheduler(config: SchedulerConfig | None) -> FrameScheduler | None:
+    """
+    Возвращает экземпляр планировщика кадров.
+
+    :param config: Конфигурация планировщика. ``None``, если планировщик отключен.
+    :type config: SchedulerConfig | None
+    :return: Экземпляр планировщика или ``None``, если планировщик отключен.
+    :rtype: FrameScheduler | None
+    """
+    if config is None:
+        return None
+
+    return FrameScheduler(
+        max_frame_age=config.max_frame_age,
+        max_skips=config.max_skips,
+    )
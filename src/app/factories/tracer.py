@@ -0,0 +1,31 @@
+import time
+from pathlib import Path
+
+from src.core.tracing import Tracer
+from src.app.configs.pipeline import TracingConfig
+
+
+def build_tracer(config: TracingConfig | None) -> Tracer | None:
+    """
+    Возвращает экземпляр трассировки сессий проверки.
+
+    Файл трассировки создается в :attr:`TracingConfig.output_dir`
+    с временем запуска в имени и ротируется при превышении :attr:`TracingConfig.max_mb`.
+
+    :param config: Конфигурация трассировки. ``None``, если трассировка отключена.
+    :type config: TracingConfig | None
+    :return: Экземпляр трассировки или ``None``, если трассировка отключена.
+    :rtype: Tracer | None
+    """
+    if config is None:
+        return None
+
+    filename = time.strftime("trace_%Y%m%d_%H%M%S.json")
+
+    return Tracer(
+        path=Path(config.output_dir) / filename,
+        sample_rate=config.sample_rate,
+        flush_interval=config.flush_interval,
+        max_bytes=int(config.max_mb * 1024 ** 2),
+        backups=config.backups,
+    )
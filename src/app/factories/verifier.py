@@ -2,8 +2,9 @@ from typing import TypeAlias
 
 from src.core.services import VisualVerifier
 from src.app.configs.verifiers import MockVerifierConfig, WindowedVerifierConfig
+from src.app.configs.verifiers import EmbeddingVerifierConfig
 
-VerifierConfig: TypeAlias = MockVerifierConfig | WindowedVerifierConfig
+VerifierConfig: TypeAlias = MockVerifierConfig | WindowedVerifierConfig | EmbeddingVerifierConfig
 
 def build_verifier(
     config: VerifierConfig,
@@ -36,7 +37,11 @@ def build_verifier(
             )
         return WindowedVisualVerifier(config, classes)
 
+    if isinstance(config, EmbeddingVerifierConfig):
+        from src.adapters.verifiers.embedding import EmbeddingVisualVerifier
+        return EmbeddingVisualVerifier(config)
+
     raise TypeError(
         f"Invalid configuration type: {type(config)}. "
-        f"Allowed: MockVerifierConfig, WindowedVerifierConfig."
+        f"Allowed: MockVerifierConfig, WindowedVerifierConfig, EmbeddingVerifierConfig."
     )
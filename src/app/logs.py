@@ -0,0 +1,26 @@
+from src.core.logging import setup_logging
+from src.app.configs.pipeline import LoggingConfig
+
+
+def configure_logging(config: LoggingConfig | None) -> None:
+    """
+    Настраивает логирование компонентов.
+
+    Вызывается до создания компонентов, чтобы записи инициализации попали в лог.
+
+    :param config: Конфигурация логирования. ``None`` оставляет настройки по умолчанию.
+    :type config: LoggingConfig | None
+    """
+    if config is None:
+        return
+
+    setup_logging(
+        level=config.level,
+        path=config.path,
+        max_bytes=int(config.max_mb * 1024 ** 2),
+        backup_count=config.backups,
+        console=config.console,
+        debug_rate=config.debug_rate,
+        queue_size=config.queue_size,
+        levels=config.levels,
+    )
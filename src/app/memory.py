@@ -0,0 +1,26 @@
+import gc
+
+from src.app.configs.pipeline import GCConfig
+
+
+def configure_gc(config: GCConfig | None) -> None:
+    """
+    Настраивает сборщик мусора для установившегося режима работы.
+
+    Вызывается после создания всех компонентов: долгоживущие объекты (модели,
+    конфигурации, буферы) переносятся в постоянное поколение и не обходятся
+    при последующих сборках.
+
+    :param config: Конфигурация сборщика мусора. ``None`` оставляет значения по умолчанию.
+    :type config: GCConfig | None
+    """
+    if config is None:
+        return
+
+    if config.threshold is not None:
+        _, threshold1, threshold2 = gc.get_threshold()
+        gc.set_threshold(config.threshold, threshold1, threshold2)
+
+    if config.freeze:
+        gc.collect()
+        gc.freeze()
@@ -1,5 +1,6 @@
 from .camera import parse_camera
 from .detector import parse_detector
+from .pipeline import parse_pipeline
 from .verifier import parse_verifier
 from .checkout_input import parse_checkout_input
 from .checkout_output import parse_checkout_output
@@ -10,4 +11,5 @@ __all__ = [
     "parse_checkout_input",
     "parse_checkout_output",
     "parse_verifier",
+    "parse_pipeline",
 ]
@@ -1,10 +1,12 @@
 from typing import Any
 
-from src.app.configs.cameras import MockCameraConfig, OpenCVCameraConfig
+from src.app.configs.cameras import MockCameraConfig, FFmpegCameraConfig
+from src.app.configs.cameras import OpenCVCameraConfig
 from src.app.configs.cameras.mock import parse as parse_mock
+from src.app.configs.cameras.ffmpeg import parse as parse_ffmpeg
 from src.app.configs.cameras.opencv import parse as parse_opencv
 
-CameraConfig = MockCameraConfig | OpenCVCameraConfig
+CameraConfig = MockCameraConfig | OpenCVCameraConfig | FFmpegCameraConfig
 
 def parse_camera(raw_data: dict[str, Any]) -> CameraConfig:
     """
@@ -27,8 +29,11 @@ def parse_camera(raw_data: dict[str, Any]) -> CameraConfig:
         case "mock":
             return parse_mock(data_copy)
 
+        case "ffmpeg":
+            return parse_ffmpeg(data_copy)
+
         case _:
             raise TypeError(
                 f"Invalid camera configuration type: {type}. "
-                f"Allowed: mock, opencv."
+                f"Allowed: mock, opencv, ffmpeg."
             )
@@ -1,10 +1,13 @@
 from typing import Any
 
 from src.app.configs.detectors import MockDetectorConfig, YOLODetectorConfig
+from src.app.configs.detectors import CachedDetectorConfig, SwitchingDetectorConfig
 from src.app.configs.detectors.mock import parse as parse_mock
 from src.app.configs.detectors.yolo import parse as parse_yolo
+from src.app.configs.detectors.cached import parse as parse_cached
+from src.app.configs.detectors.switching import parse as parse_switching
 
-DetectorConfig = MockDetectorConfig | YOLODetectorConfig
+DetectorConfig = MockDetectorConfig | YOLODetectorConfig | SwitchingDetectorConfig | CachedDetectorConfig
 
 def parse_detector(raw_data: dict[str, Any]) -> DetectorConfig:
     """
@@ -24,11 +27,17 @@ def parse_detector(raw_data: dict[str, Any]) -> DetectorConfig:
         case "yolo":
             return parse_yolo(data_copy)
 
+        case "switching":
+            return parse_switching(data_copy)
+
+        case "cached":
+            return parse_cached(data_copy)
+
         case "mock":
             return parse_mock(data_copy)
 
         case _:
             raise TypeError(
-                f"Invalid camera configuration type: {type}. "
-                f"Allowed: mock, opencv."
+                f"Invalid detector configuration type: {type}. "
+                f"Allowed: mock, yolo, switching, cached."
             )
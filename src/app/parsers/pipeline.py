@@ -0,0 +1,16 @@
+from typing import Any
+
+from src.app.configs.pipeline import PipelineConfig
+from src.app.configs.pipeline.pipeline import parse
+
+
+def parse_pipeline(raw_data: dict[str, Any] | None) -> PipelineConfig:
+    """
+    Возвращает экземпляр конфигурации пайплайна.
+
+    :param raw_data: Словарь с параметрами пайплайна.
+    :type raw_data: dict[str, Any] | None
+    :return: Экземпляр конфигурации пайплайна.
+    :rtype: PipelineConfig
+    """
+    return parse(raw_data)
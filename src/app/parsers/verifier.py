@@ -1,10 +1,12 @@
 from typing import Any
 
 from src.app.configs.verifiers import MockVerifierConfig, WindowedVerifierConfig
+from src.app.configs.verifiers import EmbeddingVerifierConfig
 from src.app.configs.verifiers.mock import parse as parse_mock
 from src.app.configs.verifiers.windowed import parse as parse_windowed
+from src.app.configs.verifiers.embedding import parse as parse_embedding
 
-VerifierConfig = MockVerifierConfig | WindowedVerifierConfig
+VerifierConfig = MockVerifierConfig | WindowedVerifierConfig | EmbeddingVerifierConfig
 
 def parse_verifier(raw_data: dict[str, Any]) -> VerifierConfig:
     """
@@ -24,11 +26,14 @@ def parse_verifier(raw_data: dict[str, Any]) -> VerifierConfig:
         case "windowed":
             return parse_windowed(data_copy)
 
+        case "embedding":
+            return parse_embedding(data_copy)
+
         case "mock":
             return parse_mock(data_copy)
 
         case _:
             raise TypeError(
-                f"Invalid camera configuration type: {type}. "
-                f"Allowed: mock, opencv."
+                f"Invalid verifier configuration type: {type}. "
+                f"Allowed: mock, windowed, embedding."
             )
@@ -0,0 +1,147 @@
+import sys
+import time
+import signal
+import threading
+from pathlib import Path
+from collections import Counter
+
+from src.utils import PathLike
+
+
+class SamplingProfiler:
+    """
+    Сэмплирующий профилировщик работающего процесса по сигналу.
+
+    Пока профилировщик не активен, его накладные расходы ограничиваются
+    установленным обработчиком сигнала. По сигналу запускается фоновый поток,
+    который в течение :attr:`duration` секунд с периодом :attr:`interval`
+    снимает стеки Python всех потоков процесса.
+
+    Результат сохраняется в формате свернутых стеков (``*.folded``):
+    строка ``поток;функция;...;функция количество`` на каждый уникальный стек.
+    Формат принимается ``flamegraph.pl``, speedscope и
+    `inferno <https://github.com/jonhoo/inferno>`_.
+    """
+
+    def __init__(
+        self,
+        output_dir: PathLike,
+        duration: float = 30.0,
+        interval: float = 0.01,
+    ):
+        """
+        Инициализирует профилировщик.
+
+        :param output_dir: Директория файлов профилирования.
+        :type output_dir: PathLike
+        :param duration: Длительность профилирования (в секундах).
+        :type duration: float, optional
+        :param interval: Период снятия стеков (в секундах).
+        :type interval: float, optional
+        """
+        self.output_dir = Path(output_dir)
+        self.duration = duration
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._sampler: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Выполняется ли профилирование.
+
+        :return: ``True``, если профилирование выполняется.
+        :rtype: bool
+        """
+        return self._sampler is not None
+
+    def install(self, signum: int = signal.SIGUSR1) -> None:
+        """
+        Устанавливает обработчик сигнала, запускающий профилирование.
+
+        Должен вызываться из главного потока процесса.
+
+        :param signum: Номер сигнала.
+        :type signum: int, optional
+        """
+        signal.signal(signum, lambda *_: self.start())
+
+    def start(self) -> bool:
+        """
+        Запускает профилирование в фоновом потоке.
+
+        :return: ``True``, если профилирование запущено; ``False``, если оно уже выполняется.
+        :rtype: bool
+        """
+        with self._lock:
+            if self._sampler is not None:
+                return False
+
+            self._sampler = threading.Thread(
+                target=self._sample_loop,
+                name="sampling-profiler",
+                daemon=True,
+            )
+            self._sampler.start()
+
+        return True
+
+    def _sample_loop(self) -> None:
+        """Снимает стеки потоков в течение :attr:`duration` и сохраняет результат."""
+        stacks: Counter[str] = Counter()
+        own_id = threading.get_ident()
+        started = time.strftime("%Y%m%d_%H%M%S")
+
+        try:
+            deadline = time.monotonic() + self.duration
+            while time.monotonic() < deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_id:
+                        continue
+                    stacks[self._collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+
+                time.sleep(self.interval)
+
+            self._write(stacks, self.output_dir / f"profile_{started}.folded")
+        finally:
+            with self._lock:
+                self._sampler = None
+
+    @staticmethod
+    def _collapse(thread_name: str, frame) -> str:
+        """
+        Сворачивает стек потока в строку от корня к вершине.
+
+        :param thread_name: Название потока (корень стека).
+        :type thread_name: str
+        :param frame: Верхний кадр стека потока.
+        :type frame: types.FrameType
+        :return: Стек вида ``поток;модуль:функция:строка;...``.
+        :rtype: str
+        """
+        calls = []
+        while frame is not None:
+            code = frame.f_code
+            calls.append(f"{Path(code.co_filename).stem}:{code.co_name}:{frame.f_lineno}")
+            frame = frame.f_back
+
+        calls.append(thread_name.replace(";", "_").replace(" ", "_"))
+        return ";".join(reversed(calls))
+
+    @staticmethod
+    def _write(stacks: Counter[str], path: Path) -> None:
+        """
+        Сохраняет свернутые стеки.
+
+        :param stacks: Количество снимков каждого стека.
+        :type stacks: Counter[str]
+        :param path: Путь к файлу.
+        :type path: Path
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            for stack, count in stacks.most_common():
+                file.write(f"{stack} {count}\n")
@@ -0,0 +1,75 @@
+import atexit
+import signal
+import threading
+from collections.abc import Callable
+
+from src.core.logging import get_logger
+
+logger = get_logger("shutdown")
+
+_lock = threading.Lock()
+_hooks: list[tuple[str, Callable[[], None]]] = []
+_registered = False
+
+# Время ожидания обработки событий, уже поставленных в очереди подписчиков (в секундах)
+EVENTS_TIMEOUT = 5.0
+
+
+def on_shutdown(name: str, hook: Callable[[], None]) -> None:
+    """
+    Регистрирует действие, выполняемое при завершении процесса.
+
+    Действия выполняются в порядке, обратном порядку регистрации, поэтому
+    компоненты закрываются раньше тех, от которых они зависят.
+    Обработчик :mod:`atexit` регистрируется при первом вызове, то есть после
+    настройки логирования, и выполняется до остановки записи логов.
+
+    :param name: Название компонента для записи в лог.
+    :type name: str
+    :param hook: Действие без аргументов (например, ``close`` компонента).
+    :type hook: Callable[[], None]
+    """
+    global _registered
+
+    with _lock:
+        _hooks.append((name, hook))
+        if not _registered:
+            atexit.register(shutdown)
+            _registered = True
+
+
+def shutdown() -> None:
+    """
+    Выполняет зарегистрированные действия завершения.
+
+    Каждое действие выполняется один раз, ошибка одного действия записывается
+    в лог и не прерывает остальные.
+    """
+    with _lock:
+        hooks = _hooks[::-1]
+        _hooks.clear()
+
+    for name, hook in hooks:
+        try:
+            hook()
+        except Exception:
+            logger.exception("Shutdown hook failed", extra={"component": name})
+
+
+def install_signal_handlers(signums: tuple[int, ...] = (signal.SIGTERM,)) -> None:
+    """
+    Завершает процесс штатно по сигналам остановки (например, ``docker stop``).
+
+    По умолчанию ``SIGTERM`` завершает процесс без выполнения :mod:`atexit`,
+    поэтому сигнал преобразуется в :class:`SystemExit` в главном потоке,
+    после чего выполняются действия, зарегистрированные :func:`on_shutdown`.
+
+    :param signums: Сигналы остановки.
+    :type signums: tuple[int, ...], optional
+    """
+    def _exit(signum: int, _) -> None:
+        logger.info("Shutdown signal received", extra={"signal": signal.Signals(signum).name})
+        raise SystemExit(0)
+
+    for signum in signums:
+        signal.signal(signum, _exit)
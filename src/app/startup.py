@@ -0,0 +1,253 @@
+import time
+import threading
+from typing import Any
+from dataclasses import dataclass
+from collections.abc import Mapping, Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from src.exceptions import ComponentStartError, ConfigValidationError
+from src.core.logging import get_logger
+
+logger = get_logger("startup")
+
+
+@dataclass(frozen=True)
+class ComponentStatus:
+    """
+    Готовность компонента после запуска.
+
+    :var name: Название компонента.
+    :vartype name: str
+    :var ready: Создан ли компонент.
+    :vartype ready: bool
+    :var duration: Время создания компонента или ожидания до истечения срока (в секундах).
+    :vartype duration: float
+    :var error: Описание ошибки, если компонент не создан.
+    :vartype error: str | None
+    """
+    name: str
+    ready: bool
+    duration: float
+    error: str | None = None
+
+
+def parse_configs(
+    parsers: Mapping[str, Callable[[dict[str, Any]], Any]],
+    load: Callable[[str], dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Считывает и разбирает все конфигурации, собирая ошибки за один проход.
+
+    :param parsers: Функции разбора вида ``{name: parse}``.
+    :type parsers: Mapping[str, Callable[[dict[str, Any]], Any]]
+    :param load: Функция чтения конфигурации по названию.
+    :type load: Callable[[str], dict[str, Any]]
+    :raises ConfigValidationError: Если хотя бы одна конфигурация не прочитана или некорректна.
+    :return: Конфигурации вида ``{name: config}``.
+    :rtype: dict[str, Any]
+    """
+    configs: dict[str, Any] = {}
+    errors: list[str] = []
+
+    for name, parse in parsers.items():
+        try:
+            configs[name] = parse(load(name))
+        except Exception as error:
+            errors.append(f"{name}: {type(error).__name__}: {error}")
+
+    if errors:
+        raise ConfigValidationError("Invalid configuration:\n  " + "\n  ".join(errors))
+
+    return configs
+
+
+class ComponentBuilder:
+    """
+    Параллельное создание компонентов с ограничением времени готовности.
+
+    Каждый компонент создается в отдельном фоновом потоке, поэтому медленное
+    подключение к камере не задерживает загрузку модели. Компонент может зависеть
+    от других компонентов: функция создания получает их в качестве аргументов.
+    Время готовности компонента без зависимостей отсчитывается от создания
+    экземпляра построителя, компонента с зависимостями - от создания последней из них.
+    Если запуск прерывается, созданные компоненты закрываются.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        timeouts: Mapping[str, float] | None = None,
+        parallel: bool = True,
+    ):
+        """
+        Инициализирует построитель компонентов.
+
+        :param timeout: Время готовности компонента (в секундах). ``None`` - без ограничения.
+        :type timeout: float | None, optional
+        :param timeouts: Время готовности отдельных компонентов вида ``{name: seconds}``.
+        :type timeouts: Mapping[str, float] | None, optional
+        :param parallel: Создавать ли компоненты в фоновых потоках. Если ``False``,
+            компоненты создаются последовательно при вызове :meth:`submit`.
+        :type parallel: bool, optional
+        """
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.parallel = parallel
+
+        self._started = time.monotonic()
+        self._futures: dict[str, Future] = {}
+        self._dependencies: dict[str, tuple[str, ...]] = {}
+        self._durations: dict[str, float] = {}
+        self._finished: dict[str, float] = {}
+
+    def submit(self, name: str, build: Callable[..., Any], *depends_on: str) -> None:
+        """
+        Запускает создание компонента.
+
+        :param name: Название компонента.
+        :type name: str
+        :param build: Функция создания компонента. Получает созданные зависимости
+            в порядке перечисления в ``depends_on``.
+        :type build: Callable[..., Any]
+        :param depends_on: Названия компонентов, от которых зависит компонент.
+        :type depends_on: str
+        """
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        dependencies = {dependency: self._futures[dependency] for dependency in depends_on}
+
+        def run() -> None:
+            try:
+                args = []
+                for dependency, dependency_future in dependencies.items():
+                    if dependency_future.exception() is not None:
+                        raise ComponentStartError(f"dependency {dependency} failed")
+                    args.append(dependency_future.result())
+
+                start = time.monotonic()
+                component = build(*args)
+                self._finished[name] = time.monotonic()
+                self._durations[name] = self._finished[name] - start
+                future.set_result(component)
+            except BaseException as error:
+                self._finished[name] = time.monotonic()
+                future.set_exception(error)
+
+        self._futures[name] = future
+        self._dependencies[name] = depends_on
+
+        if not self.parallel:
+            run()
+            return
+
+        # Потоки-демоны не препятствуют завершению процесса, если компонент завис
+        threading.Thread(target=run, name=f"startup-{name}", daemon=True).start()
+
+    def wait(self) -> tuple[dict[str, Any], list[ComponentStatus]]:
+        """
+        Дожидается создания всех компонентов и записывает их готовность в лог.
+
+        Если запуск прерывается, созданные компоненты закрываются, а компоненты,
+        создание которых не завершилось, закрываются по его завершении.
+
+        :raises ComponentStartError: Если хотя бы один компонент не создан
+            или не готов в отведенное время.
+        :return: Созданные компоненты вида ``{name: component}`` и готовность компонентов.
+        :rtype: tuple[dict[str, Any], list[ComponentStatus]]
+        """
+        components: dict[str, Any] = {}
+        statuses: list[ComponentStatus] = []
+
+        # Зависимости создаются раньше зависимых компонентов, поэтому к моменту ожидания
+        # компонента все его зависимости уже созданы или не готовы
+        for name, future in self._futures.items():
+            dependencies = self._dependencies[name]
+            started = max((self._finished[dependency] for dependency in dependencies), default=self._started)
+            timeout = self.timeouts.get(name, self.timeout)
+            remaining = None if timeout is None else max(0.0, started + timeout - time.monotonic())
+
+            pending = [dependency for dependency in dependencies if dependency not in components]
+            try:
+                if pending:
+                    raise ComponentStartError(f"dependency {', '.join(pending)} not ready")
+                components[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                status = self._failed(name, f"not ready in {timeout}s", started)
+            except Exception as error:
+                status = self._failed(name, f"{type(error).__name__}: {error}", started)
+            else:
+                status = ComponentStatus(name=name, ready=True, duration=self._durations.get(name, 0.0))
+
+            statuses.append(status)
+            if status.ready:
+                logger.info("Component ready", extra={"component": name, "duration": status.duration})
+            else:
+                logger.error("Component failed", extra={"component": name, "error": status.error})
+
+        failed = [status for status in statuses if not status.ready]
+        if failed:
+            for name, component in reversed(components.items()):
+                self._close(name, component)
+            for status in failed:
+                self._futures[status.name].add_done_callback(
+                    lambda future, name=status.name: self._close_built(name, future)
+                )
+
+            raise ComponentStartError(
+                "Components failed to start:\n  "
+                + "\n  ".join(f"{status.name}: {status.error}" for status in failed)
+            )
+
+        return components, statuses
+
+    def _failed(self, name: str, error: str, started: float) -> ComponentStatus:
+        """
+        Возвращает готовность компонента, который не был создан.
+
+        :param name: Название компонента.
+        :type name: str
+        :param error: Описание ошибки.
+        :type error: str
+        :param started: Момент, от которого отсчитывается время готовности компонента.
+        :type started: float
+        :return: Готовность компонента.
+        :rtype: ComponentStatus
+        """
+        return ComponentStatus(
+            name=name,
+            ready=False,
+            duration=time.monotonic() - started,
+            error=error,
+        )
+
+    def _close_built(self, name: str, future: Future) -> None:
+        """
+        Закрывает компонент, создание которого завершилось после прерывания запуска.
+
+        :param name: Название компонента.
+        :type name: str
+        :param future: Результат создания компонента.
+        :type future: Future
+        """
+        if future.exception() is None:
+            self._close(name, future.result())
+
+    @staticmethod
+    def _close(name: str, component: Any) -> None:
+        """
+        Закрывает компонент, если он поддерживает закрытие.
+
+        :param name: Название компонента.
+        :type name: str
+        :param component: Компонент.
+        :type component: Any
+        """
+        close = getattr(component, "close", None)
+        if close is None:
+            return
+
+        try:
+            close()
+        except Exception:
+            logger.exception("Component close failed", extra={"component": name})
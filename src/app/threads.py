@@ -0,0 +1,32 @@
+from src.core.affinity import set_stage_cpus
+from src.app.configs.pipeline import ThreadsConfig
+
+
+def configure_threads(config: ThreadsConfig | None) -> None:
+    """
+    Настраивает пулы потоков вычислительных библиотек и ядра процессора стадий.
+
+    Вызывается до создания моделей, чтобы настройки применились к первому инференсу.
+
+    :param config: Конфигурация пулов потоков. ``None`` оставляет значения по умолчанию.
+    :type config: ThreadsConfig | None
+    """
+    if config is None:
+        return
+
+    if config.torch is not None:
+        import torch
+
+        torch.set_num_threads(config.torch)
+
+    if config.opencv is not None:
+        import cv2
+
+        cv2.setNumThreads(config.opencv)
+
+    if config.blas is not None:
+        from threadpoolctl import threadpool_limits
+
+        threadpool_limits(limits=config.blas, user_api="blas")
+
+    set_stage_cpus(config.affinity)
@@ -1,16 +1,15 @@
 import time
 from pathlib import Path
 
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QIcon, QCloseEvent
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout
 
-from src.core.dto import CheckoutRequest, VisualCheckStatus
+from src.core.dto import CheckoutRequest, VisualCheckResult
 from src.core.pipeline import VisualVerificationPipeline
-from src.visualization import DetectionVisualizer
 from src.adapters.checkout.inputs.ui import UICheckoutInput
 from src.adapters.checkout.outputs.ui import UICheckoutOutput
 
+from .worker import PipelineWorker
 from .widgets import CameraWidget, ResultWidget, CheckoutControlWidget
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -20,6 +19,9 @@ ICON_PATH = str(PROJECT_ROOT / "assets" / "icons" / "ProdEye.ico")
 class CheckoutEmulator(QWidget):
     """
     PyQt-эмулятор кассы самообслуживания.
+
+    Пайплайн и чтение камеры выполняются в рабочем потоке :class:`PipelineWorker`,
+    GUI-поток только отображает готовые кадры и результаты проверки.
     """
 
     def __init__(self, pipeline: VisualVerificationPipeline):
@@ -38,20 +40,17 @@ class CheckoutEmulator(QWidget):
         self._checkout_input = self._require_ui_input()
         self._checkout_output = self._require_ui_output()
 
+        # Рабочий поток пайплайна
+        self._worker = PipelineWorker(self.pipeline)
+        self._worker.frame_ready.connect(self._on_frame_ready)
+        self._worker.result_ready.connect(self._on_result_ready)
+        self._worker.failed.connect(self._on_worker_failed)
+
         # Подготовка окна UI
         self._setup_window()
         self._setup_ui()
 
-        self._overlay = DetectionVisualizer(
-            classes=self.pipeline.detector.get_classes()
-        )
-
-        # Настройка таймера для вызова шага пайплайна
-        fps = self.pipeline.camera.get_actual_properties().fps
-        self._pipeline_interval_ms = int(1000 / fps)
-
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._tick)
+        self._worker.start()
 
     def _setup_window(self) -> None:
         """Настройка параметров окна UI."""
@@ -116,7 +115,8 @@ class CheckoutEmulator(QWidget):
         main_layout = QHBoxLayout(self)
         side_panel = QVBoxLayout()
 
-        self.camera_widget = CameraWidget(self.pipeline.camera)
+        self.camera_widget = CameraWidget()
+        self.camera_widget.resized.connect(self._worker.set_display_size)
         self.control_widget = CheckoutControlWidget(
             products=list(self.pipeline.detector.get_classes().values()),
             on_scan=self._on_scan,
@@ -181,24 +181,38 @@ class CheckoutEmulator(QWidget):
 
         # Переход системы в активное состояние
         self.result_widget.reset()
-        self._timer.start(self._pipeline_interval_ms)
-        self.camera_widget.stop_stream()
-
-    def _tick(self) -> None:
-        """Шаг работы пайплайна, вызываемый по таймеру."""
-        step = self.pipeline.run_once()
-
-        # Отрисовка детекций на кадре
-        frame = step.frame
-        if step.detections:
-            frame = self._overlay.plot_predictions(frame, step.detections)
-
-        # Визуализация кадра в виджете,
-        # обновление виджета с результатами работы
-        self.camera_widget.show_frame(frame)
-        self.result_widget.update(step.result)
-
-        # Переход в idle состояние при получении финального ответа
-        if step.result.status != VisualCheckStatus.PENDING:
-            self._timer.stop()
-            self.camera_widget.start_stream()
+        self._worker.start_session()
+
+    def _on_frame_ready(self) -> None:
+        """Отображает последний подготовленный рабочим потоком кадр."""
+        frame = self._worker.take_frame()
+        if frame is not None:
+            self.camera_widget.show_frame(frame)
+
+    def _on_result_ready(self, result: VisualCheckResult) -> None:
+        """
+        Обновляет виджет с результатами проверки.
+
+        :param result: Результат визуальной проверки.
+        :type result: VisualCheckResult
+        """
+        self.result_widget.update(result)
+
+    def _on_worker_failed(self, message: str) -> None:
+        """
+        Отображает ошибку, остановившую рабочий поток.
+
+        :param message: Текст ошибки.
+        :type message: str
+        """
+        self.result_widget.show_error(message)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """
+        Останавливает рабочий поток при закрытии окна.
+
+        :param event: Событие закрытия окна.
+        :type event: QCloseEvent
+        """
+        self._worker.stop()
+        super().closeEvent(event)
@@ -1,27 +1,26 @@
 from collections.abc import Callable
 
 import numpy as np
-from PyQt6.QtGui import QImage, QPixmap
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QImage, QPixmap, QResizeEvent
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import QLabel, QWidget, QComboBox, QGroupBox, QPushButton
 from PyQt6.QtWidgets import QSizePolicy, QVBoxLayout
 
 from src.core.dto import VisualCheckResult, VisualCheckStatus
-from src.core.ports import Camera
 
 
 class CameraWidget(QWidget):
     """
     Виджет отображения видеопотока.
+
+    Кадры должны быть заранее масштабированы до размера области отображения,
+    который передается сигналом :attr:`resized`.
     """
 
-    def __init__(self, camera: Camera):
-        """
-        Инициализация виджета для отображения видеопотока.
+    resized = pyqtSignal(int, int)
 
-        :param camera: Экземпляр камеры с видеопотоком.
-        :type camera: Camera
-        """
+    def __init__(self):
+        """Инициализация виджета для отображения видеопотока."""
         super().__init__()
 
         self.setStyleSheet("""
@@ -32,8 +31,6 @@ class CameraWidget(QWidget):
             }
         """)
 
-        self._camera = camera
-
         # Настройка подложки для отображения видеопотока
         self.label = QLabel()
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -47,17 +44,9 @@ class CameraWidget(QWidget):
         layout.addWidget(self.label)
         layout.setContentsMargins(10, 10, 10, 10)
 
-        # Настройка таймера для отоборажения видепотока
-        fps = camera.get_actual_properties().fps
-        self._interval_ms = int(1000 / fps)
-
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._update_frame)
-        self.start_stream()
-
     def show_frame(self, frame: np.ndarray) -> None:
         """
-        Отображает кадр в UI.
+        Отображает кадр в UI без дополнительного масштабирования.
 
         :param frame: Кадр для отображения.
         :type frame: numpy.ndarray
@@ -73,27 +62,20 @@ class CameraWidget(QWidget):
             QImage.Format.Format_RGB888,
         )
 
-        pixmap = QPixmap.fromImage(qt_image)
-        pixmap = pixmap.scaled(
-            self.label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-
-        self.label.setPixmap(pixmap)
+        self.label.setPixmap(QPixmap.fromImage(qt_image))
 
-    def start_stream(self) -> None:
-        """Запускает таймер для отображения видеопотока."""
-        self._timer.start(self._interval_ms)
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """
+        Сообщает новый размер области отображения кадров.
 
-    def stop_stream(self) -> None:
-        """Останавливает таймер для отображения видеопотока."""
-        self._timer.stop()
+        :param event: Событие изменения размера.
+        :type event: QResizeEvent
+        """
+        super().resizeEvent(event)
 
-    def _update_frame(self) -> None:
-        """Считывает кадр из видеопотока и отображает в UI."""
-        frame = self._camera.read()
-        self.show_frame(frame)
+        # Учет рамки и внутренних отступов подложки
+        rect = self.label.contentsRect()
+        self.resized.emit(rect.width(), rect.height())
 
 
 class CheckoutControlWidget(QGroupBox):
@@ -188,6 +170,19 @@ class ResultWidget(QGroupBox):
         self.confidence_label.setText("")
         self.detected_label.setText("")
 
+    def show_error(self, message: str) -> None:
+        """
+        Отображает ошибку работы пайплайна.
+
+        :param message: Текст ошибки.
+        :type message: str
+        """
+        self._last_status = None
+        self.status_label.setText("Ошибка пайплайна")
+        self.status_label.setStyleSheet("color: red; font-size: 16px;")
+        self.confidence_label.setText("")
+        self.detected_label.setText(message)
+
     def update(self, result: VisualCheckResult) -> None:
         """
         Обновляет информацию на виджете текущим результатом проверки.
@@ -0,0 +1,156 @@
+import threading
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.core.dto import VisualCheckStatus
+from src.core.pipeline import VisualVerificationPipeline
+from src.visualization import DetectionVisualizer
+
+
+class PipelineWorker(QThread):
+    """
+    Рабочий поток эмулятора кассы.
+
+    Вне сессии проверки считывает кадры камеры для предпросмотра, во время сессии
+    выполняет шаги пайплайна. Отрисовка детекций и масштабирование кадра до размера
+    области отображения выполняются в рабочем потоке, поэтому GUI-поток только
+    выводит готовый кадр.
+
+    Кадры передаются через ячейку последнего кадра: если GUI-поток не успел забрать
+    предыдущий кадр, он заменяется новым, и устаревшие кадры не накапливаются.
+    """
+
+    frame_ready = pyqtSignal()
+    result_ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, pipeline: VisualVerificationPipeline):
+        """
+        Инициализирует рабочий поток эмулятора.
+
+        :param pipeline: Экземпляр пайплайна визуальной проверки.
+        :type pipeline: VisualVerificationPipeline
+        """
+        super().__init__()
+
+        self.pipeline = pipeline
+
+        self._overlay = DetectionVisualizer(
+            classes=self.pipeline.detector.get_classes()
+        )
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._session_event = threading.Event()
+
+        self._latest_frame: np.ndarray | None = None
+        self._display_size: tuple[int, int] | None = None
+
+    def start_session(self) -> None:
+        """Переводит рабочий поток в режим выполнения шагов пайплайна."""
+        self._session_event.set()
+
+    def stop(self) -> None:
+        """Останавливает рабочий поток и ожидает его завершения."""
+        self._stop_event.set()
+        self.wait()
+
+    def set_display_size(self, width: int, height: int) -> None:
+        """
+        Устанавливает размер области отображения кадров.
+
+        :param width: Ширина области отображения.
+        :type width: int
+        :param height: Высота области отображения.
+        :type height: int
+        """
+        with self._lock:
+            self._display_size = (width, height)
+
+    def take_frame(self) -> np.ndarray | None:
+        """
+        Забирает последний подготовленный кадр.
+
+        :return: Кадр в размере области отображения или ``None``, если нового кадра нет.
+        :rtype: np.ndarray | None
+        """
+        with self._lock:
+            frame, self._latest_frame = self._latest_frame, None
+
+        return frame
+
+    def run(self) -> None:
+        """Основной цикл рабочего потока."""
+        last_status: VisualCheckStatus | None = None
+
+        try:
+            while not self._stop_event.is_set():
+                if not self._session_event.is_set():
+                    self._publish_frame(self.pipeline.camera.read())
+                    continue
+
+                step = self.pipeline.run_once()
+
+                frame = step.frame
+                if step.detections:
+                    frame = self._overlay.plot_predictions(frame, step.detections)
+                self._publish_frame(frame)
+
+                if step.result.status != last_status:
+                    last_status = step.result.status
+                    self.result_ready.emit(step.result)
+
+                # Возврат к предпросмотру при получении финального ответа,
+                # если не поступили запросы на проверку следующих товаров
+                if step.result.status != VisualCheckStatus.PENDING:
+                    last_status = None
+                    self._session_event.clear()
+                    if self.pipeline.poll_requests():
+                        self._session_event.set()
+
+        except Exception as error:
+            self.failed.emit(str(error))
+
+    def _publish_frame(self, frame: np.ndarray) -> None:
+        """
+        Масштабирует кадр до размера области отображения и помещает его в ячейку последнего кадра.
+
+        :param frame: Кадр.
+        :type frame: np.ndarray
+        """
+        frame = self._fit_to_display(frame)
+
+        with self._lock:
+            has_pending = self._latest_frame is not None
+            self._latest_frame = frame
+
+        # Сигнал отправляется, только если GUI-поток забрал предыдущий кадр
+        if not has_pending:
+            self.frame_ready.emit()
+
+    def _fit_to_display(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Масштабирует кадр до размера области отображения с сохранением пропорций.
+
+        :param frame: Кадр.
+        :type frame: np.ndarray
+        :return: Масштабированный непрерывный в памяти кадр.
+        :rtype: np.ndarray
+        """
+        with self._lock:
+            display_size = self._display_size
+
+        if display_size is None:
+            return np.ascontiguousarray(frame)
+
+        height, width = frame.shape[:2]
+        scale = min(display_size[0] / width, display_size[1] / height)
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+        if size == (width, height):
+            return np.ascontiguousarray(frame)
+
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        return cv2.resize(frame, size, interpolation=interpolation)
@@ -0,0 +1,44 @@
+import sys
+import argparse
+
+from src.app.parsers import parse_detector
+from src.app.autotune import Autotuner
+from src.app.bootstrap import CONFIGS_PATH, load_yaml, load_config
+from src.app.configs.autotune import parse as parse_autotune
+from src.app.configs.detectors import YOLODetectorConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Автонастройка детектора под аппаратную платформу",
+    )
+    parser.add_argument(
+        "--config",
+        default=str(CONFIGS_PATH / "autotune.yaml"),
+        help="Путь к конфигурации автонастройки",
+    )
+    args = parser.parse_args()
+
+    config = parse_autotune(load_yaml(args.config))
+
+    # Оверлей автонастройки не учитывается, чтобы замеры начинались с исходной конфигурации
+    detector_config = parse_detector(load_config("detector", overlays=False))
+    if not isinstance(detector_config, YOLODetectorConfig):
+        sys.exit("Autotune supports only the yolo detector")
+
+    autotuner = Autotuner(detector_config, config)
+    results = autotuner.run()
+
+    best = autotuner.select(results)
+    if best is None:
+        sys.exit(f"No configuration reached the minimum accuracy {config.min_accuracy}")
+
+    output_path = autotuner.write_overlay(best)
+    print(
+        f"Selected {best.backend}, imgsz={best.input_size}, threads={best.threads or 'auto'} "
+        f"(p95={best.latency_p95 * 1000:.1f}ms). Overlay written to {output_path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import sys
+import argparse
+
+from src.app.parsers import parse_pipeline
+from src.app.benchmark import measure_latency, measure_allocations
+from src.app.bootstrap import bootstrap, load_config
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Проверка задержки и прироста памяти пайплайна в установившемся режиме. "
+            "Пайплайн создается без хранилища итогов, буфера аудита и выгрузки метрик "
+            "(секции outcomes, audit и metrics), чтобы замеры не попадали в рабочие данные"
+        ),
+    )
+    parser.add_argument("--frames", type=int, default=500, help="Количество измеряемых кадров")
+    parser.add_argument("--warmup", type=int, default=100, help="Количество кадров прогрева")
+    parser.add_argument(
+        "--max-bytes-per-frame",
+        type=float,
+        default=64.0,
+        help="Допустимый прирост памяти на кадр (в байтах)",
+    )
+    parser.add_argument(
+        "--max-p99",
+        type=float,
+        default=None,
+        help="Допустимый 99-й перцентиль задержки шага (в секундах)",
+    )
+    args = parser.parse_args()
+
+    pipeline = bootstrap(record=False)
+
+    print(f"threads: {parse_pipeline(load_config('pipeline')).threads}")
+
+    latency = measure_latency(pipeline, frames=args.frames, warmup=args.warmup)
+    print(
+        f"{latency.frames} frames: p50 {latency.p50 * 1e3:.1f} ms, p95 {latency.p95 * 1e3:.1f} ms, "
+        f"p99 {latency.p99 * 1e3:.1f} ms, max {latency.max * 1e3:.1f} ms"
+    )
+
+    report = measure_allocations(pipeline, frames=args.frames, warmup=args.warmup)
+    print(
+        f"{report.frames} frames: {report.bytes_per_frame:.1f} B/frame, "
+        f"{report.blocks_per_frame:.2f} blocks/frame"
+    )
+    for line in report.top:
+        print(f"  {line}")
+
+    if args.max_p99 is not None and latency.p99 > args.max_p99:
+        sys.exit(f"Step latency p99 {latency.p99 * 1e3:.1f} ms exceeds {args.max_p99 * 1e3:.1f} ms")
+
+    if report.bytes_per_frame > args.max_bytes_per_frame:
+        sys.exit(
+            f"Net allocations {report.bytes_per_frame:.1f} B/frame "
+            f"exceed {args.max_bytes_per_frame:.1f} B/frame"
+        )
+
+
+if __name__ == "__main__":
+    main()
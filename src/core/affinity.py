@@ -0,0 +1,45 @@
+import os
+from typing import Literal
+from collections.abc import Mapping, Iterable
+
+from .logging import get_logger
+
+Stage = Literal["capture", "inference", "io"]
+
+logger = get_logger("affinity")
+
+_stage_cpus: dict[str, frozenset[int]] = {}
+
+
+def set_stage_cpus(stage_cpus: Mapping[Stage, Iterable[int]]) -> None:
+    """
+    Задает наборы ядер процессора для стадий пайплайна.
+
+    Потоки стадий привязываются к ядрам при запуске вызовом :func:`pin_thread`.
+
+    :param stage_cpus: Наборы ядер вида ``{stage: cpus}``.
+    :type stage_cpus: Mapping[Stage, Iterable[int]]
+    """
+    _stage_cpus.clear()
+    _stage_cpus.update({stage: frozenset(cpus) for stage, cpus in stage_cpus.items()})
+
+
+def pin_thread(stage: Stage) -> None:
+    """
+    Привязывает текущий поток к ядрам стадии.
+
+    Потоки, создаваемые текущим потоком (например, пулы потоков PyTorch и OpenCV),
+    наследуют привязку. Если ядра стадии не заданы или платформа не поддерживает
+    привязку, вызов ничего не делает.
+
+    :param stage: Стадия пайплайна.
+    :type stage: Stage
+    """
+    cpus = _stage_cpus.get(stage)
+    if cpus is None or not hasattr(os, "sched_setaffinity"):
+        return
+
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as error:
+        logger.warning("Failed to pin thread", extra={"stage": stage, "cpus": sorted(cpus), "error": str(error)})
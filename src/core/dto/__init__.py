@@ -1,5 +1,5 @@
 from .detection import Detection
-from .visual_result import VisualCheckResult, VisualCheckStatus
+from .visual_result import PENDING_RESULT, VisualCheckResult, VisualCheckStatus
 from .checkout_request import CheckoutRequest
 
 __all__ = [
@@ -7,4 +7,5 @@ __all__ = [
     "CheckoutRequest",
     "VisualCheckResult",
     "VisualCheckStatus",
+    "PENDING_RESULT",
 ]
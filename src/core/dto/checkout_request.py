@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+import uuid
+from dataclasses import field, dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckoutRequest:
     """
     Запрос от кассы на визуальную проверку товара.
@@ -10,6 +11,9 @@ class CheckoutRequest:
     :vartype label: str
     :var timestamp: Временной шаг запроса.
     :vartype timestamp: float
+    :var session_id: Идентификатор сессии проверки. По умолчанию генерируется случайно.
+    :vartype session_id: str, optional
     """
     label: str
     timestamp: float
+    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
@@ -8,7 +8,7 @@ class VisualCheckStatus(Enum):
     MISMATCH = "mismatch"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VisualCheckResult:
     """
     Результат визуальной проверки товара.
@@ -23,3 +23,7 @@ class VisualCheckResult:
     status: VisualCheckStatus
     confidence: float | None = None
     detected_label: str | None = None
+
+
+# Промежуточный результат не содержит данных проверки и разделяется всеми шагами пайплайна
+PENDING_RESULT = VisualCheckResult(status=VisualCheckStatus.PENDING)
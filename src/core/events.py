@@ -0,0 +1,330 @@
+import threading
+from typing import Literal, TypeVar
+from collections import deque
+from dataclasses import dataclass
+from collections.abc import Callable
+
+import numpy as np
+
+from .dto import Detection, CheckoutRequest, VisualCheckResult
+from .logging import get_logger
+from .metrics import MetricsRegistry
+from .affinity import pin_thread
+
+DropPolicy = Literal["oldest", "newest"]
+
+logger = get_logger("events")
+
+
+@dataclass(frozen=True)
+class PipelineEvent:
+    """
+    Базовое событие пайплайна.
+
+    :var timestamp: Время возникновения события (Unix time, в секундах).
+    :vartype timestamp: float
+    """
+    timestamp: float
+
+
+@dataclass(frozen=True)
+class SessionOpened(PipelineEvent):
+    """
+    Открыта сессия проверки по запросу кассы.
+
+    :var request: Запрос от кассы.
+    :vartype request: CheckoutRequest
+    """
+    request: CheckoutRequest
+
+
+@dataclass(frozen=True)
+class FrameCaptured(PipelineEvent):
+    """
+    Получен кадр камеры.
+
+    :var frame: Видеокадр.
+    :vartype frame: np.ndarray
+    :var latency: Задержка захвата кадра (в секундах).
+    :vartype latency: float
+    """
+    frame: np.ndarray
+    latency: float
+
+
+@dataclass(frozen=True)
+class DetectionsReady(PipelineEvent):
+    """
+    Получены детекции на кадре.
+
+    :var frame: Видеокадр.
+    :vartype frame: np.ndarray
+    :var detections: Детекции на видеокадре.
+    :vartype detections: list[Detection]
+    :var request: Запрос самой ранней открытой сессии проверки.
+    :vartype request: CheckoutRequest
+    :var latency: Задержка детекции (в секундах).
+    :vartype latency: float
+    """
+    frame: np.ndarray
+    detections: list[Detection]
+    request: CheckoutRequest
+    latency: float
+
+
+@dataclass(frozen=True)
+class DecisionMade(PipelineEvent):
+    """
+    Принято финальное решение по сессии проверки.
+
+    :var request: Запрос от кассы.
+    :vartype request: CheckoutRequest
+    :var result: Финальный результат проверки.
+    :vartype result: VisualCheckResult
+    :var latency: Задержка верификации кадра, на котором принято решение (в секундах).
+    :vartype latency: float
+    :var session_duration: Время от запроса кассы до решения (в секундах).
+    :vartype session_duration: float
+    """
+    request: CheckoutRequest
+    result: VisualCheckResult
+    latency: float
+    session_duration: float
+
+
+EventT = TypeVar("EventT", bound=PipelineEvent)
+
+
+class EventSubscription:
+    """
+    Подписка на события пайплайна.
+
+    Обработчик выполняется в собственном потоке подписки, события передаются
+    через ограниченную очередь. При переполнении очереди события отбрасываются
+    согласно политике :attr:`drop_policy`, поэтому медленный обработчик
+    не задерживает пайплайн.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        event_types: tuple[type[PipelineEvent], ...],
+        handler: Callable[[PipelineEvent], None],
+        queue_size: int = 64,
+        drop_policy: DropPolicy = "oldest",
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Инициализирует подписку и запускает ее поток.
+
+        :param name: Название подписки (используется в метриках).
+        :type name: str
+        :param event_types: Типы событий, передаваемые обработчику.
+        :type event_types: tuple[type[PipelineEvent], ...]
+        :param handler: Обработчик событий.
+        :type handler: Callable[[PipelineEvent], None]
+        :param queue_size: Максимальное количество событий в очереди.
+        :type queue_size: int, optional
+        :param drop_policy: Политика при переполнении очереди:
+            ``oldest`` - вытесняется самое старое событие,
+            ``newest`` - отбрасывается поступившее событие.
+        :type drop_policy: DropPolicy, optional
+        :param metrics: Реестр метрик для учета отброшенных событий и ошибок обработчика.
+        :type metrics: MetricsRegistry | None, optional
+        """
+        self.name = name
+        self.event_types = event_types
+        self.handler = handler
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self.metrics = metrics
+
+        self._events: deque[PipelineEvent] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self._worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"event-subscriber-{name}",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def accepts(self, event: PipelineEvent) -> bool:
+        """
+        Проверяет, подписан ли обработчик на событие.
+
+        :param event: Событие.
+        :type event: PipelineEvent
+        :return: ``True``, если событие передается обработчику.
+        :rtype: bool
+        """
+        return isinstance(event, self.event_types)
+
+    def put(self, event: PipelineEvent) -> None:
+        """
+        Помещает событие в очередь без ожидания.
+
+        :param event: Событие.
+        :type event: PipelineEvent
+        """
+        with self._condition:
+            if self._closed:
+                return
+
+            if len(self._events) >= self.queue_size:
+                self._count("dropped")
+                if self.drop_policy == "newest":
+                    return
+                self._events.popleft()
+
+            self._events.append(event)
+            self._condition.notify()
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Останавливает поток подписки после обработки уже поставленных событий.
+
+        :param timeout: Время ожидания завершения потока (в секундах).
+        :type timeout: float | None, optional
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        self._worker.join(timeout)
+
+    def _worker_loop(self) -> None:
+        """Извлекает события из очереди и передает их обработчику."""
+        pin_thread("io")
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._events or self._closed)
+                if not self._events:
+                    return
+                event = self._events.popleft()
+
+            try:
+                self.handler(event)
+            except Exception:
+                self._count("errors")
+                logger.exception("Event handler failed", extra={"subscription": self.name})
+
+    def _count(self, counter: str) -> None:
+        """
+        Увеличивает счетчик подписки в реестре метрик.
+
+        :param counter: Название счетчика.
+        :type counter: str
+        """
+        if self.metrics is not None:
+            self.metrics.increment(f"events.{self.name}.{counter}")
+
+
+class EventBus:
+    """
+    Шина событий пайплайна.
+
+    Публикация события не блокирует вызывающий поток: событие помещается
+    в очереди подписок, обработчики выполняются в потоках подписок.
+    """
+
+    def __init__(self, metrics: MetricsRegistry | None = None):
+        """
+        Инициализирует шину событий.
+
+        :param metrics: Реестр метрик для учета отброшенных событий и ошибок обработчиков.
+        :type metrics: MetricsRegistry | None, optional
+        """
+        self.metrics = metrics
+
+        self._lock = threading.Lock()
+        self._subscriptions: list[EventSubscription] = []
+
+    def subscribe(
+        self,
+        event_types: type[EventT] | tuple[type[EventT], ...],
+        handler: Callable[[EventT], None],
+        name: str | None = None,
+        queue_size: int = 64,
+        drop_policy: DropPolicy = "oldest",
+    ) -> EventSubscription:
+        """
+        Подписывает обработчик на события указанных типов.
+
+        :param event_types: Тип или кортеж типов событий.
+        :type event_types: type[EventT] | tuple[type[EventT], ...]
+        :param handler: Обработчик событий.
+        :type handler: Callable[[EventT], None]
+        :param name: Название подписки. По умолчанию - имя обработчика.
+        :type name: str | None, optional
+        :param queue_size: Максимальное количество событий в очереди подписки.
+        :type queue_size: int, optional
+        :param drop_policy: Политика при переполнении очереди.
+        :type drop_policy: DropPolicy, optional
+        :return: Подписка.
+        :rtype: EventSubscription
+        """
+        if not isinstance(event_types, tuple):
+            event_types = (event_types,)
+
+        subscription = EventSubscription(
+            name=name or getattr(handler, "__name__", type(handler).__name__),
+            event_types=event_types,
+            handler=handler,
+            queue_size=queue_size,
+            drop_policy=drop_policy,
+            metrics=self.metrics,
+        )
+
+        with self._lock:
+            self._subscriptions = [*self._subscriptions, subscription]
+
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """
+        Отменяет подписку и останавливает ее поток.
+
+        :param subscription: Подписка.
+        :type subscription: EventSubscription
+        """
+        with self._lock:
+            self._subscriptions = [sub for sub in self._subscriptions if sub is not subscription]
+
+        subscription.close()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """
+        Есть ли у шины подписки.
+
+        :return: ``True``, если есть хотя бы одна подписка.
+        :rtype: bool
+        """
+        return bool(self._subscriptions)
+
+    def publish(self, event: PipelineEvent) -> None:
+        """
+        Публикует событие всем подпискам на его тип без ожидания обработки.
+
+        :param event: Событие.
+        :type event: PipelineEvent
+        """
+        for subscription in self._subscriptions:
+            if subscription.accepts(event):
+                subscription.put(event)
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Останавливает потоки всех подписок.
+
+        :param timeout: Время ожидания завершения каждого потока (в секундах).
+        :type timeout: float | None, optional
+        """
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+
+        for subscription in subscriptions:
+            subscription.close(timeout)
@@ -0,0 +1,223 @@
+import copy
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+from typing import Any
+from pathlib import Path
+from collections.abc import Mapping
+
+ROOT_LOGGER = "prodeye"
+
+# Атрибуты LogRecord, которые не являются пользовательскими полями записи
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message"}
+
+
+def get_logger(component: str) -> logging.Logger:
+    """
+    Возвращает логгер компонента.
+
+    :param component: Название компонента (например, ``pipeline`` или ``cameras.ffmpeg``).
+    :type component: str
+    :return: Логгер ``prodeye.<component>``.
+    :rtype: logging.Logger
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{component}")
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Форматирует запись лога в одну строку JSON.
+
+    Помимо времени, уровня, логгера и сообщения в строку включаются
+    поля, переданные через ``extra``, и трассировка исключения.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Форматирует запись лога.
+
+        :param record: Запись лога.
+        :type record: logging.LogRecord
+        :return: Строка JSON.
+        :rtype: str
+        """
+        entry: dict[str, Any] = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Ограничивает частоту записей лога уровня не выше :attr:`max_level`.
+
+    Лимит применяется отдельно к каждому месту вызова (логгер и шаблон сообщения).
+    Количество подавленных записей добавляется в поле ``suppressed``
+    следующей пропущенной записи того же места вызова.
+    """
+
+    def __init__(self, rate: float = 1.0, max_level: int = logging.DEBUG):
+        """
+        Инициализирует фильтр.
+
+        :param rate: Максимальное количество записей в секунду на место вызова.
+        :type rate: float, optional
+        :param max_level: Максимальный уровень ограничиваемых записей.
+        :type max_level: int, optional
+        """
+        super().__init__()
+
+        self.interval = 1.0 / rate
+        self.max_level = max_level
+
+        self._lock = threading.Lock()
+        self._state: dict[tuple[str, str], tuple[float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Пропускает запись, если лимит места вызова не исчерпан.
+
+        :param record: Запись лога.
+        :type record: logging.LogRecord
+        :return: ``True``, если запись нужно обработать.
+        :rtype: bool
+        """
+        if record.levelno > self.max_level:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+
+        with self._lock:
+            last, suppressed = self._state.get(key, (float("-inf"), 0))
+            if now - last < self.interval:
+                self._state[key] = (last, suppressed + 1)
+                return False
+            self._state[key] = (now, 0)
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Обработчик, отбрасывающий записи при переполнении очереди вместо ожидания."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped: int = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Сообщение и трассировка исключения фиксируются до передачи в поток записи,
+        # пользовательские поля записи сохраняются
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging(
+    level: str = "INFO",
+    path: Path | str | None = None,
+    max_bytes: int = 10 * 1024 ** 2,
+    backup_count: int = 5,
+    console: bool = True,
+    debug_rate: float = 1.0,
+    queue_size: int = 10_000,
+    levels: Mapping[str, str] | None = None,
+) -> logging.handlers.QueueListener:
+    """
+    Настраивает асинхронное структурированное логирование.
+
+    Логгеры компонентов помещают записи в ограниченную очередь без ожидания,
+    а форматирование и запись на диск выполняются потоком :class:`QueueListener`.
+    При переполнении очереди записи отбрасываются, поэтому медленный диск
+    не задерживает поток обработки кадров. Файл лога в формате JSON lines
+    ротируется при достижении ``max_bytes``.
+
+    :param level: Уровень логгера ``prodeye``.
+    :type level: str, optional
+    :param path: Путь к файлу лога. ``None`` отключает запись в файл.
+    :type path: Path | str | None, optional
+    :param max_bytes: Максимальный размер файла лога (в байтах).
+    :type max_bytes: int, optional
+    :param backup_count: Количество хранимых файлов после ротации.
+    :type backup_count: int, optional
+    :param console: Выводить ли записи в stderr.
+    :type console: bool, optional
+    :param debug_rate: Максимальное количество отладочных записей в секунду на место вызова.
+    :type debug_rate: float, optional
+    :param queue_size: Максимальное количество записей в очереди.
+    :type queue_size: int, optional
+    :param levels: Уровни логгеров компонентов вида ``{component: level}``.
+    :type levels: Mapping[str, str] | None, optional
+    :return: Запущенный поток записи логов (останавливается при завершении процесса).
+    :rtype: logging.handlers.QueueListener
+    """
+    formatter = JsonFormatter()
+
+    handlers: list[logging.Handler] = []
+    if path is not None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(
+            logging.handlers.RotatingFileHandler(
+                path,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding="utf-8",
+            )
+        )
+    if console:
+        handlers.append(logging.StreamHandler())
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    queue_handler = _DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    queue_handler.addFilter(RateLimitFilter(rate=debug_rate))
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level)
+    root.handlers = [queue_handler]
+    root.propagate = False
+
+    for component, component_level in (levels or {}).items():
+        get_logger(component).setLevel(component_level)
+
+    listener = logging.handlers.QueueListener(
+        queue_handler.queue,
+        *handlers,
+        respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    return listener
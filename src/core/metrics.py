@@ -0,0 +1,192 @@
+import threading
+from collections import deque
+
+import numpy as np
+
+from .logging import get_logger
+from .affinity import pin_thread
+
+logger = get_logger("metrics")
+
+
+class LatencyWindow:
+    """Скользящее окно последних измерений задержки."""
+
+    def __init__(self, size: int = 100):
+        """
+        Инициализирует окно измерений.
+
+        :param size: Максимальное количество хранимых измерений.
+        :type size: int, optional
+        """
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        """
+        Добавляет измерение в окно, вытесняя самое старое при переполнении.
+
+        :param value: Задержка (в секундах).
+        :type value: float
+        """
+        self._samples.append(value)
+
+    def clear(self) -> None:
+        """Очищает окно измерений."""
+        self._samples.clear()
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Возвращает перцентиль задержки в окне.
+
+        :param q: Перцентиль в диапазоне ``[0, 100]``.
+        :type q: float
+        :return: Значение перцентиля или ``None``, если окно пустое.
+        :rtype: float | None
+        """
+        if not self._samples:
+            return None
+
+        return float(np.percentile(self._samples, q))
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class MetricsRegistry:
+    """
+    Потокобезопасный реестр метрик пайплайна.
+
+    Хранит мгновенные значения (gauges), счетчики и окна задержек по стадиям.
+    """
+
+    def __init__(self, window_size: int = 100):
+        """
+        Инициализирует пустой реестр метрик.
+
+        :param window_size: Размер окна задержек каждой стадии.
+        :type window_size: int, optional
+        """
+        self.window_size = window_size
+
+        self._lock = threading.Lock()
+        self._gauges: dict[str, float] = {}
+        self._counters: dict[str, int] = {}
+        self._latencies: dict[str, LatencyWindow] = {}
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Устанавливает мгновенное значение метрики.
+
+        :param name: Название метрики.
+        :type name: str
+        :param value: Значение метрики.
+        :type value: float
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """
+        Увеличивает счетчик.
+
+        :param name: Название счетчика.
+        :type name: str
+        :param value: Величина приращения.
+        :type value: int, optional
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """
+        Добавляет измерение задержки стадии.
+
+        :param stage: Название стадии.
+        :type stage: str
+        :param seconds: Задержка стадии (в секундах).
+        :type seconds: float
+        """
+        with self._lock:
+            window = self._latencies.get(stage)
+            if window is None:
+                window = self._latencies[stage] = LatencyWindow(self.window_size)
+            window.add(seconds)
+
+    def latency(self, stage: str, q: float) -> float | None:
+        """
+        Возвращает перцентиль задержки стадии.
+
+        :param stage: Название стадии.
+        :type stage: str
+        :param q: Перцентиль в диапазоне ``[0, 100]``.
+        :type q: float
+        :return: Значение перцентиля или ``None``, если измерений нет.
+        :rtype: float | None
+        """
+        with self._lock:
+            window = self._latencies.get(stage)
+            return window.percentile(q) if window is not None else None
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Возвращает плоский снимок всех метрик.
+
+        Для задержек стадий возвращаются ключи ``latency.<stage>.p50`` и ``latency.<stage>.p95``.
+
+        :return: Словарь вида ``{metric_name: value}``.
+        :rtype: dict[str, float]
+        """
+        with self._lock:
+            snapshot: dict[str, float] = {**self._gauges, **self._counters}
+            for stage, window in self._latencies.items():
+                if len(window):
+                    snapshot[f"latency.{stage}.p50"] = window.percentile(50)
+                    snapshot[f"latency.{stage}.p95"] = window.percentile(95)
+
+        return snapshot
+
+
+class MetricsReporter:
+    """
+    Периодическая выгрузка снимка реестра метрик в структурированный лог.
+
+    Снимок (:meth:`MetricsRegistry.snapshot`) записывается фоновым потоком
+    записью ``Metrics snapshot`` с полем ``metrics``, поэтому рабочая точка
+    регулятора, задержки стадий и счетчики доступны сборщику логов.
+    """
+
+    def __init__(self, registry: MetricsRegistry, interval: float = 10.0):
+        """
+        Инициализирует и запускает выгрузку метрик.
+
+        :param registry: Реестр метрик.
+        :type registry: MetricsRegistry
+        :param interval: Период выгрузки (в секундах).
+        :type interval: float, optional
+        """
+        self.registry = registry
+        self.interval = interval
+
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._report_loop, name="metrics-reporter", daemon=True)
+        self._worker.start()
+
+    def report(self) -> None:
+        """Записывает текущий снимок метрик в лог."""
+        logger.info("Metrics snapshot", extra={"metrics": self.registry.snapshot()})
+
+    def close(self) -> None:
+        """Останавливает выгрузку, записав последний снимок."""
+        if self._stop.is_set():
+            return
+
+        self._stop.set()
+        self._worker.join()
+        self.report()
+
+    def _report_loop(self) -> None:
+        """Цикл фонового потока выгрузки."""
+        pin_thread("io")
+
+        while not self._stop.wait(self.interval):
+            self.report()
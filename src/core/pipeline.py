@@ -1,7 +1,22 @@
-from .dto import CheckoutRequest, VisualCheckStatus
+import gc
+import time
+import logging
+from typing import Any
+from collections import deque
+
+import numpy as np
+
+from .dto import PENDING_RESULT, CheckoutRequest, VisualCheckResult, VisualCheckStatus
 from .ports import Camera, Detector, Pipeline, CheckoutInput, CheckoutOutput
 from .ports import PipelineStepResult
-from .services import VisualVerifier
+from .events import EventBus, DecisionMade, FrameCaptured, PipelineEvent, SessionOpened
+from .events import DetectionsReady
+from .logging import get_logger
+from .metrics import MetricsRegistry
+from .tracing import Tracer
+from .services import FrameScheduler, VisualVerifier, AdaptiveController
+
+logger = get_logger("pipeline")
 
 
 class VisualVerificationPipeline(Pipeline):
@@ -13,43 +28,294 @@ class VisualVerificationPipeline(Pipeline):
         verifier: VisualVerifier,
         checkout_input: CheckoutInput,
         checkout_output: CheckoutOutput,
+        controller: AdaptiveController | None = None,
+        scheduler: FrameScheduler | None = None,
+        metrics: MetricsRegistry | None = None,
+        events: EventBus | None = None,
+        collect_between_sessions: bool = False,
+        tracer: Tracer | None = None,
     ):
         self.camera = camera
         self.detector = detector
         self.verifier = verifier
         self.checkout_input = checkout_input
         self.checkout_output = checkout_output
+        self.controller = controller
+        self.scheduler = scheduler
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.events = events if events is not None else EventBus(self.metrics)
+        self.collect_between_sessions = collect_between_sessions
+        self.tracer = tracer
+
+        self._sessions: deque[CheckoutRequest] = deque()
+        self._resolved: dict[CheckoutRequest, VisualCheckResult] = {}
+        # Порядковый номер обработанного кадра, по которому верификатор отличает новые кадры
+        self._frame_id: int = 0
 
-        self._active_request: CheckoutRequest | None = None
+    @property
+    def active_requests(self) -> list[CheckoutRequest]:
+        """
+        Запросы открытых сессий проверки в порядке поступления.
+
+        :return: Список запросов.
+        :rtype: list[CheckoutRequest]
+        """
+        return list(self._sessions)
+
+    def poll_requests(self) -> int:
+        """
+        Открывает сессии по всем поступившим запросам кассы без ожидания.
+
+        :return: Количество открытых сессий проверки.
+        :rtype: int
+        """
+        while (request := self.checkout_input.poll_request()) is not None:
+            self._open_session(request)
+
+        return len(self._sessions)
 
     def run_once(self) -> PipelineStepResult:
         """
         Выполняет один цикл визуальной проверки.
 
-        Открывает новую сессию, если нет активного запроса от кассы.
-        Закрывает активную сессию, если верификатор вернул финальный результат проверки.
+        Если нет открытых сессий, ожидает запрос от кассы. Если включен
+        :attr:`collect_between_sessions`, то перед ожиданием выполняется сборка мусора,
+        чтобы паузы сборщика не приходились на обработку кадров. Запросы, поступившие
+        во время проверки, открывают дополнительные сессии, поэтому детекции одного
+        кадра передаются верификатору для каждой открытой сессии.
+
+        Сессии закрываются в порядке поступления запросов: финальный результат
+        сессии отправляется кассе только после результатов всех предыдущих сессий.
+        Если на шаге не закрыта ни одна сессия, кассе отправляется промежуточный
+        результат самой ранней сессии.
+
+        Задержка каждой стадии и возраст кадра к началу детекции публикуются в :attr:`metrics`.
+        Если задан регулятор, то кадры сверх его целевой частоты обработки пропускаются
+        без детекции, а задержка обработки кадра передается регулятору. Если задан
+        планировщик, то устаревшие кадры пропускаются без детекции.
+
+        Ход проверки публикуется в шину :attr:`events` событиями :class:`SessionOpened`,
+        :class:`FrameCaptured`, :class:`DetectionsReady` и :class:`DecisionMade`.
+        Если задана трассировка, то интервалы стадий кадра записываются
+        для каждой открытой сессии.
 
-        :return: Результат одного шага пайплайна.
+        :return: Результат одного шага пайплайна с последним отправленным кассе результатом.
         :rtype: PipelineStepResult
         """
-        # Открытие сессии, если нет активного запроса
-        if self._active_request is None:
-            self._active_request = self.checkout_input.get_request()
+        # Открытие сессии, если нет активных запросов
+        if not self._sessions:
+            if self.collect_between_sessions:
+                self._collect_garbage()
+            self._open_session(self.checkout_input.get_request())
+        self.poll_requests()
 
         # Детекция товаров
-        frame = self.camera.read()
+        capture_start = time.perf_counter()
+        frame = self._read_frame()
+        self._frame_id += 1
+
+        detect_start = time.perf_counter()
+        self._publish(FrameCaptured, frame=frame, latency=detect_start - capture_start)
+
         detections = self.detector.detect(frame)
 
-        # Визуальная проверка и отправка результата
-        result = self.verifier.verify(detections, self._active_request)
-        self.checkout_output.send_result(result)
+        # Визуальная проверка по каждой открытой сессии
+        verify_start = time.perf_counter()
+        self._publish(
+            DetectionsReady,
+            frame=frame,
+            detections=detections,
+            request=self._sessions[0],
+            latency=verify_start - detect_start,
+        )
+
+        head_result = PENDING_RESULT
+        for request in self._sessions:
+            if request in self._resolved:
+                continue
+
+            result = self.verifier.verify(detections, request, frame, frame_id=self._frame_id)
+            if result.status != VisualCheckStatus.PENDING:
+                self._resolved[request] = result
+            elif request is self._sessions[0]:
+                head_result = result
+
+        # Отправка результатов закрытых по порядку сессий
+        output_start = time.perf_counter()
+        traced = list(self._sessions) if self.tracer is not None else None
+        decisions = self._close_resolved()
+        for _, result in decisions:
+            self.checkout_output.send_result(result)
 
-        # Закрытие сессии при финальном результате
-        if result.status != VisualCheckStatus.PENDING:
-            self._active_request = None
+        if decisions:
+            result = decisions[-1][1]
+        else:
+            result = head_result
+            self.checkout_output.send_result(result)
+
+        output_end = time.perf_counter()
+        self._observe_latencies(capture_start, detect_start, verify_start, output_start, output_end)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Frame processed",
+                extra={
+                    "sessions": len(self._sessions) + len(decisions),
+                    "detections": len(detections),
+                    "processing": output_end - detect_start,
+                },
+            )
+
+        if self.tracer is not None:
+            self.tracer.record_frame(
+                traced,
+                [
+                    ("capture", capture_start, detect_start),
+                    ("detect", detect_start, verify_start),
+                    ("verify", verify_start, output_start),
+                    ("output", output_start, output_end),
+                ],
+            )
+            for request, decision in decisions:
+                self.tracer.end_session(request, decision)
+
+        for request, decision in decisions:
+            logger.info(
+                "Decision made",
+                extra={
+                    "session_id": request.session_id,
+                    "label": request.label,
+                    "status": decision.status.value,
+                    "detected_label": decision.detected_label,
+                    "confidence": decision.confidence,
+                    "session_duration": time.time() - request.timestamp,
+                },
+            )
+            self._publish(
+                DecisionMade,
+                request=request,
+                result=decision,
+                latency=output_start - verify_start,
+                session_duration=time.time() - request.timestamp,
+            )
 
         return PipelineStepResult(
             frame=frame,
             detections=detections,
             result=result,
         )
+
+    def _read_frame(self) -> np.ndarray:
+        """
+        Считывает кадр камеры, пропуская кадры, отклоненные планировщиком,
+        и кадры сверх целевой частоты регулятора.
+
+        :return: Кадр, передаваемый на детекцию.
+        :rtype: np.ndarray
+        """
+        deadline = self.verifier.get_deadline(self._sessions[0])
+
+        while True:
+            frame = self.camera.read()
+            frame_age = time.monotonic() - self.camera.get_frame_timestamp()
+
+            if self.scheduler is not None and not self.scheduler.admit(frame_age, deadline):
+                self.metrics.increment("frames.stale")
+                logger.debug("Stale frame skipped", extra={"frame_age": frame_age})
+                continue
+
+            if self.controller is not None and not self.controller.admit_frame():
+                self.metrics.increment("frames.paced")
+                continue
+
+            self.metrics.observe("frame_age", frame_age)
+            return frame
+
+    def _collect_garbage(self) -> None:
+        """Выполняет сборку мусора и публикует ее длительность в :attr:`metrics`."""
+        start = time.perf_counter()
+        gc.collect()
+        self.metrics.observe("gc", time.perf_counter() - start)
+
+    def _open_session(self, request: CheckoutRequest) -> None:
+        """
+        Открывает сессию проверки по запросу кассы.
+
+        :param request: Запрос от кассы.
+        :type request: CheckoutRequest
+        """
+        self._sessions.append(request)
+        self._publish(SessionOpened, request=request)
+
+        logger.info(
+            "Session opened",
+            extra={"session_id": request.session_id, "label": request.label},
+        )
+
+        if self.tracer is not None:
+            self.tracer.start_session(request)
+
+    def _close_resolved(self) -> list[tuple[CheckoutRequest, VisualCheckResult]]:
+        """
+        Закрывает сессии с финальным результатом в порядке поступления запросов.
+
+        Закрытие останавливается на первой сессии без финального результата.
+
+        :return: Запросы закрытых сессий и их финальные результаты.
+        :rtype: list[tuple[CheckoutRequest, VisualCheckResult]]
+        """
+        decisions = []
+        while self._sessions and self._sessions[0] in self._resolved:
+            request = self._sessions.popleft()
+            decisions.append((request, self._resolved.pop(request)))
+
+        return decisions
+
+    def _observe_latencies(
+        self,
+        capture_start: float,
+        detect_start: float,
+        verify_start: float,
+        output_start: float,
+        output_end: float,
+    ) -> None:
+        """
+        Публикует задержки стадий шага и передает задержки обработки и стадий регулятору.
+
+        :param capture_start: Начало захвата кадра.
+        :type capture_start: float
+        :param detect_start: Начало детекции.
+        :type detect_start: float
+        :param verify_start: Начало верификации.
+        :type verify_start: float
+        :param output_start: Начало отправки результата.
+        :type output_start: float
+        :param output_end: Окончание отправки результата.
+        :type output_end: float
+        """
+        processing = output_end - detect_start
+        stages = {
+            "capture": detect_start - capture_start,
+            "detect": verify_start - detect_start,
+            "verify": output_start - verify_start,
+            "output": output_end - output_start,
+        }
+
+        for stage, latency in stages.items():
+            self.metrics.observe(stage, latency)
+        self.metrics.observe("processing", processing)
+
+        if self.controller is not None:
+            self.controller.update(processing, stages)
+
+    def _publish(self, event_type: type[PipelineEvent], **fields: Any) -> None:
+        """
+        Публикует событие в шину, если на нее есть подписки.
+
+        :param event_type: Тип события.
+        :type event_type: type[PipelineEvent]
+        :param fields: Поля события без ``timestamp``.
+        :type fields: Any
+        """
+        if self.events.has_subscribers:
+            self.events.publish(event_type(timestamp=time.time(), **fields))
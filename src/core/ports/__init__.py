@@ -1,5 +1,5 @@
 from .camera import Camera, CameraProperties
-from .detector import Detector
+from .detector import Detector, BatchDetector
 from .pipeline import Pipeline, PipelineStepResult
 from .checkout_input import CheckoutInput
 from .checkout_output import CheckoutOutput
@@ -7,6 +7,7 @@ from .checkout_output import CheckoutOutput
 __all__ = [
     "Camera",
     "Detector",
+    "BatchDetector",
     "Pipeline",
     "CheckoutInput",
     "CheckoutOutput",
@@ -30,6 +30,15 @@ class Camera(Protocol):
         """Освобождает ресурсы источника."""
         pass
 
+    def get_frame_timestamp(self) -> float:
+        """
+        Возвращает момент захвата последнего считанного кадра.
+
+        :return: Момент захвата по часам :func:`time.monotonic` (в секундах).
+        :rtype: float
+        """
+        pass
+
     def get_actual_properties(self) -> CameraProperties:
         """
         Возвращает фактические параметры видеопотока.
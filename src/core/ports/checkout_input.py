@@ -20,3 +20,15 @@ class CheckoutInput(Protocol):
         :rtype: CheckoutRequest
         """
         pass
+
+    def poll_request(self) -> CheckoutRequest | None:
+        """
+        Получает поступивший запрос на визуальную проверку без ожидания.
+
+        Используется пайплайном для приема запросов, поступивших
+        во время проверки предыдущих товаров.
+
+        :return: Запрос от кассы или ``None``, если новых запросов нет.
+        :rtype: CheckoutRequest | None
+        """
+        pass
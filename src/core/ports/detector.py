@@ -27,3 +27,38 @@ class Detector(Protocol):
         :return: Словарь вида``{class_id: label}``.
         :rtype: dict[int, str]
         """
+        pass
+
+    def get_input_size(self) -> int:
+        """
+        Возвращает текущий размер входа модели.
+
+        :return: Сторона входного изображения модели (в пикселях).
+        :rtype: int
+        """
+        pass
+
+    def set_input_size(self, size: int) -> None:
+        """
+        Устанавливает размер входа модели для последующих вызовов :meth:`detect`.
+
+        :param size: Сторона входного изображения модели (в пикселях).
+        :type size: int
+        """
+        pass
+
+
+@runtime_checkable
+class BatchDetector(Detector, Protocol):
+    """Контракт детектора объектов с пакетной обработкой изображений."""
+
+    def detect_batch(self, frames: list[np.ndarray]) -> list[list[Detection]]:
+        """
+        Выполняет детекцию объектов на пакете изображений за один инференс.
+
+        :param frames: Изображения.
+        :type frames: list[numpy.ndarray]
+        :return: Списки детекций для каждого изображения в порядке ``frames``.
+        :rtype: list[list[Detection]]
+        """
+        pass
@@ -1,5 +1,9 @@
 from .verifier import VisualVerifier
+from .scheduler import FrameScheduler
+from .controller import AdaptiveController
 
 __all__ = [
     "VisualVerifier",
+    "AdaptiveController",
+    "FrameScheduler",
 ]
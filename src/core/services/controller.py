@@ -0,0 +1,213 @@
+import time
+from collections.abc import Mapping, Sequence
+
+from src.core.ports import Detector
+from src.core.logging import get_logger
+from src.core.metrics import LatencyWindow, MetricsRegistry
+
+logger = get_logger("controller")
+
+
+class AdaptiveController:
+    """
+    Регулятор рабочей точки пайплайна по бюджету задержки.
+
+    Управляет двумя параметрами в заданных границах:
+
+    - размером входа детектора: при превышении бюджета задержки обработки кадра или бюджета
+      задержки любой из стадий размер уменьшается, при устойчивом запасе по задержке
+      всех стадий - увеличивается;
+    - частотой обработки кадров: ограничивается сверху частотой, которую
+      пайплайн способен выдержать с учетом запаса ``headroom``. Камера при этом
+      читается с собственной частотой, а кадры сверх целевой частоты пропускаются
+      без детекции (:meth:`admit_frame`), поэтому они не копятся в буфере камеры
+      и не устаревают независимо от стратегии ``drain`` камеры.
+    """
+
+    def __init__(
+        self,
+        detector: Detector,
+        latency_budget: float,
+        input_sizes: Sequence[int],
+        min_fps: float,
+        max_fps: float,
+        window: int = 30,
+        recover_ratio: float = 0.6,
+        headroom: float = 0.8,
+        stage_budgets: Mapping[str, float] | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
+        """
+        Инициализирует регулятор.
+
+        :param detector: Детектор, размер входа которого регулируется.
+        :type detector: Detector
+        :param latency_budget: Бюджет задержки обработки одного кадра (в секундах).
+        :type latency_budget: float
+        :param input_sizes: Допустимые размеры входа детектора.
+        :type input_sizes: Sequence[int]
+        :param min_fps: Минимальная частота обработки кадров.
+        :type min_fps: float
+        :param max_fps: Максимальная частота обработки кадров.
+        :type max_fps: float
+        :param window: Количество кадров, по которым принимается решение об изменении рабочей точки.
+        :type window: int, optional
+        :param recover_ratio: Доля бюджета, ниже которой p95 задержки позволяет увеличить размер входа.
+        :type recover_ratio: float, optional
+        :param headroom: Целевая загрузка пайплайна ``(0, 1]`` при выборе частоты обработки.
+        :type headroom: float, optional
+        :param stage_budgets: Бюджеты задержки отдельных стадий вида ``{stage: seconds}``
+            (например, ``detect`` или ``verify``).
+        :type stage_budgets: Mapping[str, float] | None, optional
+        :param metrics: Реестр метрик для публикации текущей рабочей точки.
+        :type metrics: MetricsRegistry | None, optional
+        :raises ValueError: Если не указан ни один размер входа.
+        """
+        if not input_sizes:
+            raise ValueError("AdaptiveController requires at least one input size")
+
+        self.detector = detector
+        self.latency_budget = latency_budget
+        self.input_sizes = sorted(set(input_sizes), reverse=True)
+        self.min_fps = min_fps
+        self.max_fps = max_fps
+        self.window = window
+        self.recover_ratio = recover_ratio
+        self.headroom = headroom
+        self.stage_budgets = dict(stage_budgets or {})
+        self.metrics = metrics
+
+        self._latencies = LatencyWindow(window)
+        self._stage_latencies = {stage: LatencyWindow(window) for stage in self.stage_budgets}
+
+        self._size_idx = self._closest_size_idx(detector.get_input_size())
+        self._target_fps = max_fps
+        self._next_frame: float | None = None
+
+        self.detector.set_input_size(self.input_size)
+        self._publish(0.0)
+
+    @property
+    def input_size(self) -> int:
+        """
+        Текущий размер входа детектора.
+
+        :return: Размер входа (в пикселях).
+        :rtype: int
+        """
+        return self.input_sizes[self._size_idx]
+
+    @property
+    def target_fps(self) -> float:
+        """
+        Текущая целевая частота обработки кадров.
+
+        :return: Частота обработки кадров.
+        :rtype: float
+        """
+        return self._target_fps
+
+    def admit_frame(self) -> bool:
+        """
+        Решает, обрабатывать ли считанный кадр согласно текущей целевой частоте обработки.
+
+        Вместо паузы перед чтением, во время которой кадры копились бы в буфере камеры,
+        кадры, поступившие раньше срока, пропускаются.
+
+        :return: ``True``, если кадр нужно обработать; ``False``, если кадр пропускается.
+        :rtype: bool
+        """
+        now = time.perf_counter()
+        if self._next_frame is not None and now < self._next_frame:
+            return False
+
+        # Срок следующего кадра отсчитывается от срока текущего, чтобы средняя частота
+        # не снижалась из-за дискретности кадров камеры
+        interval = 1.0 / self._target_fps
+        self._next_frame = now + interval if self._next_frame is None else max(self._next_frame + interval, now)
+        return True
+
+    def update(self, processing_latency: float, stage_latencies: Mapping[str, float] | None = None) -> None:
+        """
+        Учитывает задержки обработки очередного кадра и при накоплении окна
+        пересчитывает рабочую точку.
+
+        :param processing_latency: Задержка обработки кадра без учета ожидания кадра камеры (в секундах).
+        :type processing_latency: float
+        :param stage_latencies: Задержки стадий кадра вида ``{stage: seconds}``.
+            Учитываются стадии, для которых задан бюджет.
+        :type stage_latencies: Mapping[str, float] | None, optional
+        """
+        self._latencies.add(processing_latency)
+        for stage, latency in (stage_latencies or {}).items():
+            if stage in self._stage_latencies:
+                self._stage_latencies[stage].add(latency)
+
+        if len(self._latencies) < self.window:
+            return
+
+        latency_p95 = self._latencies.percentile(95)
+        # Отношение p95 задержки к бюджету для всего кадра и для каждой стадии с бюджетом
+        load = [latency_p95 / self.latency_budget]
+        for stage, window in self._stage_latencies.items():
+            if len(window):
+                stage_p95 = window.percentile(95)
+                load.append(stage_p95 / self.stage_budgets[stage])
+                if self.metrics is not None:
+                    self.metrics.set_gauge(f"controller.load.{stage}", stage_p95 / self.stage_budgets[stage])
+
+        # Размер входа: уменьшение при превышении любого бюджета, увеличение при устойчивом запасе по всем
+        if max(load) > 1.0 and self._size_idx < len(self.input_sizes) - 1:
+            self._set_size_idx(self._size_idx + 1)
+        elif max(load) < self.recover_ratio and self._size_idx > 0:
+            self._set_size_idx(self._size_idx - 1)
+
+        # Частота обработки: не выше выдерживаемой пайплайном с учетом запаса
+        sustainable_fps = self.headroom / latency_p95 if latency_p95 > 0 else self.max_fps
+        self._target_fps = min(max(sustainable_fps, self.min_fps), self.max_fps)
+
+        # Новое окно наблюдений после пересчета рабочей точки
+        self._latencies.clear()
+        for window in self._stage_latencies.values():
+            window.clear()
+        self._publish(max(load))
+
+    def _set_size_idx(self, idx: int) -> None:
+        """
+        Переключает размер входа детектора.
+
+        :param idx: Индекс размера в :attr:`input_sizes`.
+        :type idx: int
+        """
+        self._size_idx = idx
+        self.detector.set_input_size(self.input_size)
+
+        logger.info("Detector input size changed", extra={"input_size": self.input_size})
+
+    def _closest_size_idx(self, size: int) -> int:
+        """
+        Возвращает индекс ближайшего к ``size`` допустимого размера входа.
+
+        :param size: Исходный размер входа.
+        :type size: int
+        :return: Индекс в :attr:`input_sizes`.
+        :rtype: int
+        """
+        return min(
+            range(len(self.input_sizes)),
+            key=lambda idx: abs(self.input_sizes[idx] - size),
+        )
+
+    def _publish(self, load: float) -> None:
+        """
+        Публикует текущую рабочую точку в реестр метрик.
+
+        :param load: Наибольшее отношение p95 задержки к бюджету за последнее окно.
+        :type load: float
+        """
+        if self.metrics is None:
+            return
+
+        self.metrics.set_gauge("controller.input_size", self.input_size)
+        self.metrics.set_gauge("controller.target_fps", self._target_fps)
+        self.metrics.set_gauge("controller.load", load)
@@ -0,0 +1,52 @@
+import time
+
+
+class FrameScheduler:
+    """
+    Планировщик кадров по сроку актуальности.
+
+    Каждому кадру назначается срок актуальности - момент захвата плюс
+    :attr:`max_frame_age`. Кадр, срок актуальности которого истек к началу
+    детекции, пропускается, и пайплайн считывает следующий кадр. Поэтому
+    при нехватке ресурсов детекция выполняется по свежим кадрам, а не по кадрам,
+    накопившимся в буфере камеры.
+
+    Устаревший кадр все же обрабатывается, если срок сессии проверки уже наступил
+    (пропуск только задержит решение) или подряд пропущено :attr:`max_skips` кадров.
+    """
+
+    def __init__(self, max_frame_age: float, max_skips: int = 3):
+        """
+        Инициализирует планировщик кадров.
+
+        :param max_frame_age: Максимальный возраст кадра к началу детекции (в секундах).
+        :type max_frame_age: float
+        :param max_skips: Максимальное количество кадров, пропускаемых подряд.
+        :type max_skips: int, optional
+        """
+        self.max_frame_age = max_frame_age
+        self.max_skips = max_skips
+
+        self._skips: int = 0
+
+    def admit(self, frame_age: float, session_deadline: float | None = None) -> bool:
+        """
+        Решает, передавать ли кадр на детекцию.
+
+        :param frame_age: Возраст кадра - время от захвата до текущего момента (в секундах).
+        :type frame_age: float
+        :param session_deadline: Срок самой ранней сессии проверки (Unix time, в секундах).
+            ``None``, если срок не определен.
+        :type session_deadline: float | None, optional
+        :return: ``True``, если кадр нужно обработать; ``False``, если кадр пропускается.
+        :rtype: bool
+        """
+        is_fresh = frame_age <= self.max_frame_age
+        is_due = session_deadline is not None and time.time() >= session_deadline
+
+        if is_fresh or is_due or self._skips >= self.max_skips:
+            self._skips = 0
+            return True
+
+        self._skips += 1
+        return False
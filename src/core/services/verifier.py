@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 
+import numpy as np
+
 from src.core.dto import Detection, CheckoutRequest, VisualCheckResult
 
 
@@ -13,7 +15,9 @@ class VisualVerifier(ABC):
     def verify(
         self,
         detections: Sequence[Detection],
-        request: CheckoutRequest
+        request: CheckoutRequest,
+        frame: np.ndarray | None = None,
+        frame_id: int | None = None,
     ) -> VisualCheckResult:
         """
         Выполняет визуальную проверку соответствия товара.
@@ -25,7 +29,25 @@ class VisualVerifier(ABC):
         :type detections: Sequence[Detection]
         :param request: Запрос от кассы с информацией об ожидаемом товаре.
         :type request: CheckoutRequest
+        :param frame: Видеокадр, на котором получены детекции.
+            Используется реализациями, анализирующими содержимое bbox'ов.
+        :type frame: numpy.ndarray | None, optional
+        :param frame_id: Порядковый номер кадра. Вызовы для нескольких открытых сессий
+            с одним номером относятся к одному кадру. ``None`` - каждый вызов относится
+            к новому кадру.
+        :type frame_id: int | None, optional
         :return: Результат визуальной проверки товара.
         :rtype: VisualCheckResult
         """
         raise NotImplementedError
+
+    def get_deadline(self, request: CheckoutRequest) -> float | None:
+        """
+        Возвращает срок, к которому верификатор примет решение по запросу.
+
+        :param request: Запрос от кассы.
+        :type request: CheckoutRequest
+        :return: Срок принятия решения (Unix time, в секундах) или ``None``, если срок не определен.
+        :rtype: float | None
+        """
+        return None
@@ -0,0 +1,302 @@
+import json
+import time
+import zlib
+import threading
+from typing import Any, TextIO
+from pathlib import Path
+from collections import deque
+from collections.abc import Iterable
+
+from .dto import CheckoutRequest, VisualCheckResult
+from .affinity import pin_thread
+
+
+class Tracer:
+    """
+    Трассировка сессий проверки в формате Chrome Trace Event.
+
+    Для каждой сессии, попавшей в выборку, записываются интервалы стадий
+    (захват, детекция, верификация, отправка результата) каждого обработанного кадра
+    и интервал всей сессии. Каждая сессия отображается отдельной строкой.
+
+    События записываются по одному в строке массива JSON без закрывающей скобки,
+    что допускается форматом, поэтому файл открывается в ``chrome://tracing``
+    и Perfetto даже при аварийном завершении процесса. Запись выполняется
+    фоновым потоком, а сессии отбираются детерминированно по идентификатору
+    с долей :attr:`sample_rate`, поэтому трассировка может оставаться включенной.
+
+    При превышении :attr:`max_bytes` файл ротируется: текущий файл переименовывается
+    в ``<имя>.1.json`` (предыдущие сдвигаются, хранится не более :attr:`backups`),
+    а названия строк открытых сессий повторяются в новом файле.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        sample_rate: float = 1.0,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000,
+        max_bytes: int | None = None,
+        backups: int = 5,
+    ):
+        """
+        Инициализирует трассировку и запускает поток записи.
+
+        :param path: Путь к файлу трассировки.
+        :type path: Path | str
+        :param sample_rate: Доля трассируемых сессий ``[0, 1]``.
+        :type sample_rate: float, optional
+        :param flush_interval: Период записи накопленных событий (в секундах).
+        :type flush_interval: float, optional
+        :param max_pending: Максимальное количество событий, ожидающих записи.
+            При переполнении новые события отбрасываются.
+        :type max_pending: int, optional
+        :param max_bytes: Размер файла, при превышении которого он ротируется (в байтах).
+            ``None`` отключает ротацию.
+        :type max_bytes: int | None, optional
+        :param backups: Количество хранимых файлов после ротации.
+        :type backups: int, optional
+        """
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+        self._pid = 1
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._pending: deque[dict[str, Any]] = deque()
+        self._dropped: int = 0
+        self._closed = False
+
+        # Открытые сессии в выборке: идентификатор строки и начало сессии
+        self._sessions: dict[str, tuple[int, float]] = {}
+        self._next_tid: int = 1
+        # Названия строк открытых сессий для повторения в новом файле после ротации
+        self._thread_names: dict[int, dict[str, Any]] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._open()
+
+        self._writer = threading.Thread(target=self._writer_loop, name="tracer", daemon=True)
+        self._writer.start()
+
+    @property
+    def dropped(self) -> int:
+        """
+        Количество событий, отброшенных из-за переполнения очереди записи.
+
+        :return: Количество отброшенных событий.
+        :rtype: int
+        """
+        return self._dropped
+
+    def is_sampled(self, session_id: str) -> bool:
+        """
+        Проверяет, попадает ли сессия в выборку трассировки.
+
+        :param session_id: Идентификатор сессии.
+        :type session_id: str
+        :return: ``True``, если сессия трассируется.
+        :rtype: bool
+        """
+        return zlib.crc32(session_id.encode()) < self.sample_rate * 2 ** 32
+
+    def start_session(self, request: CheckoutRequest) -> None:
+        """
+        Начинает трассировку сессии, если она попадает в выборку.
+
+        :param request: Запрос открытой сессии.
+        :type request: CheckoutRequest
+        """
+        if not self.is_sampled(request.session_id):
+            return
+
+        tid = self._next_tid
+        self._next_tid += 1
+        self._sessions[request.session_id] = (tid, time.perf_counter())
+
+        thread_name = {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": self._pid,
+            "tid": tid,
+            "args": {"name": f"{request.label} [{request.session_id[:8]}]"},
+        }
+        with self._lock:
+            self._thread_names[tid] = thread_name
+        self._emit(thread_name)
+
+    def record_frame(
+        self,
+        requests: list[CheckoutRequest],
+        stages: list[tuple[str, float, float]],
+    ) -> None:
+        """
+        Записывает интервалы стадий обработки кадра для трассируемых сессий.
+
+        :param requests: Запросы сессий, для которых обработан кадр.
+        :type requests: list[CheckoutRequest]
+        :param stages: Стадии в виде ``(название, начало, конец)`` по часам :func:`time.perf_counter`.
+        :type stages: list[tuple[str, float, float]]
+        """
+        for request in requests:
+            session = self._sessions.get(request.session_id)
+            if session is None:
+                continue
+
+            for name, start, end in stages:
+                self._emit(self._span(name, session[0], start, end))
+
+    def end_session(self, request: CheckoutRequest, result: VisualCheckResult) -> None:
+        """
+        Завершает трассировку сессии и записывает интервал всей сессии.
+
+        :param request: Запрос закрытой сессии.
+        :type request: CheckoutRequest
+        :param result: Финальный результат проверки.
+        :type result: VisualCheckResult
+        """
+        session = self._sessions.pop(request.session_id, None)
+        if session is None:
+            return
+
+        tid, start = session
+        with self._lock:
+            self._thread_names.pop(tid, None)
+        self._emit(
+            self._span(
+                "session",
+                tid,
+                start,
+                time.perf_counter(),
+                session_id=request.session_id,
+                label=request.label,
+                status=result.status.value,
+                detected_label=result.detected_label,
+            )
+        )
+
+    def close(self) -> None:
+        """Записывает оставшиеся события и закрывает файл трассировки."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        self._writer.join()
+        self._file.close()
+
+    def _open(self) -> TextIO:
+        """
+        Создает файл трассировки и записывает начало массива событий.
+
+        :return: Открытый файл трассировки.
+        :rtype: TextIO
+        """
+        file = self.path.open("w", encoding="utf-8")
+        file.write("[\n")
+        return file
+
+    def _rotate(self) -> None:
+        """Переименовывает текущий файл трассировки и начинает новый."""
+        self._file.close()
+
+        for idx in range(self.backups - 1, 0, -1):
+            source = self._backup_path(idx)
+            if source.exists():
+                source.replace(self._backup_path(idx + 1))
+        if self.backups > 0:
+            self.path.replace(self._backup_path(1))
+
+        self._file = self._open()
+
+        with self._lock:
+            thread_names = list(self._thread_names.values())
+        self._write(thread_names)
+
+    def _backup_path(self, idx: int) -> Path:
+        """
+        Возвращает путь файла трассировки после ротации.
+
+        :param idx: Номер файла (1 - самый новый).
+        :type idx: int
+        :return: Путь ``<имя>.<idx><расширение>``.
+        :rtype: Path
+        """
+        return self.path.with_name(f"{self.path.stem}.{idx}{self.path.suffix}")
+
+    def _write(self, events: Iterable[dict[str, Any]]) -> None:
+        """
+        Записывает события в текущий файл трассировки.
+
+        :param events: События трассировки.
+        :type events: Iterable[dict[str, Any]]
+        """
+        self._file.writelines(
+            json.dumps(event, separators=(",", ":")) + ",\n"
+            for event in events
+        )
+        self._file.flush()
+
+    def _span(self, name: str, tid: int, start: float, end: float, **args: Any) -> dict[str, Any]:
+        """
+        Формирует завершенное событие (интервал) формата Chrome Trace Event.
+
+        :param name: Название интервала.
+        :type name: str
+        :param tid: Идентификатор строки трассировки.
+        :type tid: int
+        :param start: Начало интервала по часам :func:`time.perf_counter`.
+        :type start: float
+        :param end: Конец интервала по часам :func:`time.perf_counter`.
+        :type end: float
+        :param args: Дополнительные атрибуты интервала.
+        :type args: Any
+        :return: Событие трассировки.
+        :rtype: dict[str, Any]
+        """
+        event = {
+            "name": name,
+            "ph": "X",
+            "pid": self._pid,
+            "tid": tid,
+            "ts": round(start * 1e6),
+            "dur": round((end - start) * 1e6),
+        }
+        if args:
+            event["args"] = args
+
+        return event
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        """
+        Помещает событие в очередь записи.
+
+        :param event: Событие трассировки.
+        :type event: dict[str, Any]
+        """
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self._dropped += 1
+                return
+            self._pending.append(event)
+
+    def _writer_loop(self) -> None:
+        """Периодически записывает накопленные события в файл."""
+        pin_thread("io")
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed, timeout=self.flush_interval)
+                events, self._pending = self._pending, deque()
+                closed = self._closed
+
+            if events:
+                self._write(events)
+                if self.max_bytes is not None and self._file.tell() >= self.max_bytes:
+                    self._rotate()
+
+            if closed:
+                return
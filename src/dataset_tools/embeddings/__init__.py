@@ -0,0 +1,5 @@
+from .builder import PrototypeIndexBuilder
+
+__all__ = [
+    "PrototypeIndexBuilder",
+]
@@ -0,0 +1,165 @@
+from pathlib import Path
+from collections.abc import Iterable
+
+import cv2
+import numpy as np
+from tqdm import tqdm
+
+from ...utils import PathLike
+from ..structures import YOLOLabel, YOLODataset
+from ...adapters.embeddings import CropEmbedder, PrototypeIndex
+
+
+class PrototypeIndexBuilder:
+
+    def __init__(self, embedder: CropEmbedder, batch_size: int = 64):
+        """
+        Инициализирует утилиту построения индекса прототипов товаров.
+
+        :param embedder: Экстрактор эмбеддингов вырезанных областей.
+        :type embedder: CropEmbedder
+        :param batch_size: Количество областей в одном батче бэкбона.
+        :type batch_size: int, optional
+        """
+        self.embedder = embedder
+        self.batch_size = batch_size
+
+    def build(
+        self,
+        dataset: YOLODataset,
+        splits: Iterable[str] = ("train",),
+        output_dir: PathLike | None = None,
+        progress_bar: bool = True,
+    ) -> PrototypeIndex:
+        """
+        Строит индекс прототипов по bbox'ам из сплитов датасета.
+
+        Прототип класса - это L2-нормированное среднее эмбеддингов всех его bbox'ов.
+        Классы без единого bbox'а в индекс не попадают.
+
+        :param dataset: Экземпляр датасета :class:`YOLODataset`.
+        :type dataset: YOLODataset
+        :param splits: Названия сплитов, по которым строится индекс.
+        :type splits: Iterable[str], optional
+        :param output_dir: Директория для сохранения индекса. Если ``None``, индекс не сохраняется.
+        :type output_dir: PathLike | None, optional
+        :param progress_bar: Включить ли индикатор выполнения. Шаг соответствует сэмплу.
+        :type progress_bar: bool, optional
+        :return: Построенный индекс прототипов.
+        :rtype: PrototypeIndex
+        """
+        sums = np.zeros((dataset.num_classes, self.embedder.dim), dtype=np.float64)
+        counts = np.zeros(dataset.num_classes, dtype=np.int64)
+
+        crops: list[np.ndarray] = []
+        crop_classes: list[int] = []
+
+        samples = [
+            sample
+            for split_name in splits
+            for sample in dataset.get_split(split_name).iter_samples()
+        ]
+
+        for image_path, label_path in tqdm(samples, desc="Построение индекса", disable=not progress_bar):
+            label = YOLOLabel(label_path)
+            if label.is_empty():
+                continue
+
+            image = self._read_image(image_path)
+            for class_id, crop in self._crop_bboxes(image, label):
+                crops.append(crop)
+                crop_classes.append(class_id)
+
+            if len(crops) >= self.batch_size:
+                self._accumulate(crops, crop_classes, sums, counts)
+                crops.clear()
+                crop_classes.clear()
+
+        if crops:
+            self._accumulate(crops, crop_classes, sums, counts)
+
+        present = np.flatnonzero(counts)
+        prototypes = sums[present] / counts[present, None]
+        prototypes /= np.linalg.norm(prototypes, axis=1, keepdims=True)
+
+        index = PrototypeIndex(
+            prototypes=prototypes.astype(np.float32),
+            labels=[dataset.class_names[int(class_id)] for class_id in present],
+            backbone=self.embedder.backbone,
+            input_size=self.embedder.input_size,
+            weights_path=self.embedder.weights_path,
+            weights_checksum=self.embedder.weights_checksum,
+        )
+
+        if output_dir is not None:
+            index.save(output_dir)
+
+        return index
+
+    def _accumulate(
+        self,
+        crops: list[np.ndarray],
+        crop_classes: list[int],
+        sums: np.ndarray,
+        counts: np.ndarray,
+    ) -> None:
+        """
+        Добавляет эмбеддинги батча областей к суммам по классам.
+
+        :param crops: Вырезанные RGB-области.
+        :type crops: list[numpy.ndarray]
+        :param crop_classes: Индексы классов областей.
+        :type crop_classes: list[int]
+        :param sums: Суммы эмбеддингов по классам ``C x D`` (изменяется in-place).
+        :type sums: numpy.ndarray
+        :param counts: Количество областей по классам ``C`` (изменяется in-place).
+        :type counts: numpy.ndarray
+        """
+        embeddings = self.embedder.embed(crops)
+        class_ids = np.asarray(crop_classes)
+
+        np.add.at(sums, class_ids, embeddings)
+        np.add.at(counts, class_ids, 1)
+
+    @staticmethod
+    def _read_image(image_path: Path) -> np.ndarray:
+        """
+        Считывает изображение в формате RGB.
+
+        :param image_path: Путь до изображения.
+        :type image_path: pathlib.Path
+        :raises ValueError: Если изображение не удалось прочитать.
+        :return: RGB-изображение ``H x W x C``.
+        :rtype: numpy.ndarray
+        """
+        image = cv2.imread(str(image_path))
+        if image is None:
+            raise ValueError(f"Failed to read image: {image_path}")
+
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    @staticmethod
+    def _crop_bboxes(image: np.ndarray, label: YOLOLabel) -> list[tuple[int, np.ndarray]]:
+        """
+        Вырезает области bbox'ов метки из изображения.
+
+        :param image: RGB-изображение.
+        :type image: numpy.ndarray
+        :param label: Метка изображения в формате YOLO.
+        :type label: YOLOLabel
+        :return: Пары ``(class_id, область)`` для невырожденных bbox'ов.
+        :rtype: list[tuple[int, numpy.ndarray]]
+        """
+        h, w = image.shape[:2]
+
+        crops: list[tuple[int, np.ndarray]] = []
+        for bbox in label.bboxes:
+            x1 = max(int((bbox.x - bbox.w / 2) * w), 0)
+            y1 = max(int((bbox.y - bbox.h / 2) * h), 0)
+            x2 = min(int((bbox.x + bbox.w / 2) * w), w)
+            y2 = min(int((bbox.y + bbox.h / 2) * h), h)
+
+            if x2 > x1 and y2 > y1:
+                crops.append((bbox.class_id, image[y1:y2, x1:x2]))
+
+        return crops
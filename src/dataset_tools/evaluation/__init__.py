@@ -0,0 +1,7 @@
+from .evaluator import ClassMetrics, EvaluationReport, DetectorEvaluator
+
+__all__ = [
+    "ClassMetrics",
+    "DetectorEvaluator",
+    "EvaluationReport",
+]
@@ -0,0 +1,401 @@
+import time
+from pathlib import Path
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from tqdm import tqdm
+
+from ...utils import prefetch_map
+from ...core.dto import Detection
+from ..structures import Split, YOLOLabel
+from ...core.ports import Detector, BatchDetector
+
+
+@dataclass(frozen=True)
+class ClassMetrics:
+    """
+    Метрики детектора по одному классу.
+
+    :var label: Название класса.
+    :vartype label: str
+    :var support: Количество bbox'ов класса в разметке.
+    :vartype support: int
+    :var ap: Average precision при пороге IoU оценки (``nan``, если класса нет в разметке).
+    :vartype ap: float
+    :var precision: Доля верных детекций класса при пороге уверенности детектора.
+    :vartype precision: float
+    :var recall: Доля найденных bbox'ов класса при пороге уверенности детектора.
+    :vartype recall: float
+    """
+    label: str
+    support: int
+    ap: float
+    precision: float
+    recall: float
+
+
+@dataclass(frozen=True)
+class EvaluationReport:
+    """
+    Результат оценки детектора на сплите датасета.
+
+    :var images: Количество оцененных изображений.
+    :vartype images: int
+    :var mean_ap: Среднее AP по классам, присутствующим в разметке.
+    :vartype mean_ap: float
+    :var classes: Метрики по классам в порядке индексов.
+    :vartype classes: list[ClassMetrics]
+    :var confusion: Матрица ошибок ``(C + 1) x (C + 1)``: строка - класс разметки,
+        столбец - класс детекции, последняя строка и столбец - фон
+        (лишняя детекция и пропущенный bbox соответственно).
+    :vartype confusion: numpy.ndarray
+    :var images_per_second: Скорость инференса (изображений в секунду без учета чтения).
+    :vartype images_per_second: float
+    :var elapsed: Общее время оценки (в секундах).
+    :vartype elapsed: float
+    """
+    images: int
+    mean_ap: float
+    classes: list[ClassMetrics]
+    confusion: np.ndarray
+    images_per_second: float
+    elapsed: float
+
+
+class DetectorEvaluator:
+
+    def __init__(
+        self,
+        detector: Detector,
+        class_names: dict[int, str],
+        iou_threshold: float = 0.5,
+        batch_size: int = 8,
+        workers: int = 4,
+    ):
+        """
+        Инициализирует утилиту оценки точности и скорости детектора.
+
+        Подходит для любой реализации :class:`Detector`. Если детектор поддерживает
+        пакетную обработку (:class:`BatchDetector`), изображения передаются батчами.
+
+        :param detector: Детектор.
+        :type detector: Detector
+        :param class_names: Классы датасета вида ``{class_id: label}``.
+            Детекции классов вне датасета не учитываются.
+        :type class_names: dict[int, str]
+        :param iou_threshold: Минимальный IoU совпадения детекции с bbox'ом разметки.
+        :type iou_threshold: float, optional
+        :param batch_size: Количество изображений в одном батче детектора.
+        :type batch_size: int, optional
+        :param workers: Количество потоков чтения изображений.
+        :type workers: int, optional
+        """
+        self.detector = detector
+        self.class_names = class_names
+        self.num_classes = max(class_names) + 1 if class_names else 0
+        self.iou_threshold = iou_threshold
+        self.batch_size = batch_size
+        self.workers = workers
+
+    def evaluate(self, split: Split, progress_bar: bool = True) -> EvaluationReport:
+        """
+        Оценивает детектор на сэмплах сплита.
+
+        Сэмплы читаются пулом потоков с упреждением на два батча, поэтому
+        чтение изображений выполняется параллельно с инференсом.
+
+        :param split: Сплит датасета.
+        :type split: Split
+        :param progress_bar: Включить ли индикатор выполнения. Шаг соответствует изображению.
+        :type progress_bar: bool, optional
+        :return: Результат оценки.
+        :rtype: EvaluationReport
+        """
+        started = time.perf_counter()
+
+        confidences: list[np.ndarray] = []
+        pred_classes: list[np.ndarray] = []
+        true_positives: list[np.ndarray] = []
+        gt_counts = np.zeros(self.num_classes, dtype=np.int64)
+        confusion = np.zeros((self.num_classes + 1, self.num_classes + 1), dtype=np.int64)
+
+        images = 0
+        inference = 0.0
+
+        batch_images: list[np.ndarray] = []
+        batch_gt: list[np.ndarray] = []
+
+        samples = list(split.iter_samples())
+        decoded = prefetch_map(
+            self._read_sample,
+            samples,
+            workers=self.workers,
+            depth=2 * self.batch_size,
+            thread_name_prefix="evaluator-read",
+        )
+
+        for idx, (_, (image, gt)) in enumerate(tqdm(decoded, total=len(samples), desc="Оценка", disable=not progress_bar)):
+            batch_images.append(image)
+            batch_gt.append(gt)
+            if len(batch_images) < self.batch_size and idx < len(samples) - 1:
+                continue
+
+            start = time.perf_counter()
+            batch_detections = self._detect(batch_images)
+            inference += time.perf_counter() - start
+
+            for detections, gt in zip(batch_detections, batch_gt):
+                preds = self._to_array(detections)
+                confidences.append(preds[:, 1])
+                pred_classes.append(preds[:, 0].astype(np.int64))
+                true_positives.append(self._match(preds, gt))
+                gt_counts += np.bincount(gt[:, 0].astype(np.int64), minlength=self.num_classes)
+                self._update_confusion(confusion, preds, gt)
+
+            images += len(batch_images)
+            batch_images, batch_gt = [], []
+
+        classes = self._class_metrics(
+            np.concatenate(confidences) if confidences else np.empty(0),
+            np.concatenate(pred_classes) if pred_classes else np.empty(0, dtype=np.int64),
+            np.concatenate(true_positives) if true_positives else np.empty(0, dtype=bool),
+            gt_counts,
+        )
+        present = [metrics.ap for metrics in classes if metrics.support > 0]
+
+        return EvaluationReport(
+            images=images,
+            mean_ap=float(np.mean(present)) if present else 0.0,
+            classes=classes,
+            confusion=confusion,
+            images_per_second=images / inference if inference > 0 else 0.0,
+            elapsed=time.perf_counter() - started,
+        )
+
+    def _detect(self, images: list[np.ndarray]) -> list[list[Detection]]:
+        """
+        Выполняет детекцию на батче изображений.
+
+        :param images: RGB-изображения.
+        :type images: list[numpy.ndarray]
+        :return: Списки детекций в порядке ``images``.
+        :rtype: list[list[Detection]]
+        """
+        if self.batch_size > 1 and isinstance(self.detector, BatchDetector):
+            return self.detector.detect_batch(images)
+
+        return [self.detector.detect(image) for image in images]
+
+    def _to_array(self, detections: list[Detection]) -> np.ndarray:
+        """
+        Преобразует детекции классов датасета в массив.
+
+        :param detections: Детекции.
+        :type detections: list[Detection]
+        :return: Массив ``N x 6`` вида ``(class_id, confidence, x1, y1, x2, y2)``.
+        :rtype: numpy.ndarray
+        """
+        preds = np.array(
+            [(d.class_id, d.confidence, *d.bbox) for d in detections],
+            dtype=np.float64,
+        ).reshape(-1, 6)
+
+        return preds[(preds[:, 0] >= 0) & (preds[:, 0] < self.num_classes)]
+
+    def _match(self, preds: np.ndarray, gt: np.ndarray) -> np.ndarray:
+        """
+        Сопоставляет детекции с bbox'ами разметки того же класса.
+
+        Каждый bbox разметки сопоставляется не более чем с одной детекцией:
+        пары с IoU не ниже :attr:`iou_threshold` выбираются в порядке убывания IoU.
+
+        :param preds: Детекции ``N x 6``.
+        :type preds: numpy.ndarray
+        :param gt: Разметка ``M x 5`` вида ``(class_id, x1, y1, x2, y2)``.
+        :type gt: numpy.ndarray
+        :return: Является ли каждая детекция верной.
+        :rtype: numpy.ndarray
+        """
+        tp = np.zeros(len(preds), dtype=bool)
+
+        pairs = self._pairs(preds[:, 2:], gt[:, 1:], preds[:, 0][:, None] == gt[:, 0][None, :])
+        tp[pairs[:, 0]] = True
+
+        return tp
+
+    def _update_confusion(self, confusion: np.ndarray, preds: np.ndarray, gt: np.ndarray) -> None:
+        """
+        Добавляет результаты изображения в матрицу ошибок.
+
+        Детекции сопоставляются с разметкой без учета класса.
+
+        :param confusion: Матрица ошибок (изменяется in-place).
+        :type confusion: numpy.ndarray
+        :param preds: Детекции ``N x 6``.
+        :type preds: numpy.ndarray
+        :param gt: Разметка ``M x 5``.
+        :type gt: numpy.ndarray
+        """
+        background = self.num_classes
+        pred_cls = preds[:, 0].astype(np.int64)
+        gt_cls = gt[:, 0].astype(np.int64)
+
+        pairs = self._pairs(preds[:, 2:], gt[:, 1:], np.ones((len(preds), len(gt)), dtype=bool))
+        np.add.at(confusion, (gt_cls[pairs[:, 1]], pred_cls[pairs[:, 0]]), 1)
+
+        missed = np.ones(len(gt), dtype=bool)
+        missed[pairs[:, 1]] = False
+        np.add.at(confusion, (gt_cls[missed], background), 1)
+
+        extra = np.ones(len(preds), dtype=bool)
+        extra[pairs[:, 0]] = False
+        np.add.at(confusion, (background, pred_cls[extra]), 1)
+
+    def _pairs(self, pred_boxes: np.ndarray, gt_boxes: np.ndarray, allowed: np.ndarray) -> np.ndarray:
+        """
+        Возвращает однозначные пары детекция-разметка с IoU не ниже :attr:`iou_threshold`.
+
+        :param pred_boxes: Bbox'ы детекций ``N x 4`` в формате ``xyxy``.
+        :type pred_boxes: numpy.ndarray
+        :param gt_boxes: Bbox'ы разметки ``M x 4`` в формате ``xyxy``.
+        :type gt_boxes: numpy.ndarray
+        :param allowed: Допустимые пары ``N x M``.
+        :type allowed: numpy.ndarray
+        :return: Массив ``K x 2`` индексов ``(детекция, разметка)``.
+        :rtype: numpy.ndarray
+        """
+        if not len(pred_boxes) or not len(gt_boxes):
+            return np.empty((0, 2), dtype=np.int64)
+
+        iou = self._iou(pred_boxes, gt_boxes)
+        pred_idx, gt_idx = np.nonzero((iou >= self.iou_threshold) & allowed)
+
+        # Жадное сопоставление в порядке убывания IoU: каждая детекция
+        # и каждый bbox разметки используются один раз
+        order = np.argsort(-iou[pred_idx, gt_idx], kind="stable")
+
+        pairs: list[tuple[int, int]] = []
+        used_pred: set[int] = set()
+        used_gt: set[int] = set()
+        for pred, gt in zip(pred_idx[order].tolist(), gt_idx[order].tolist()):
+            if pred in used_pred or gt in used_gt:
+                continue
+            used_pred.add(pred)
+            used_gt.add(gt)
+            pairs.append((pred, gt))
+
+        return np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+    @staticmethod
+    def _iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+        """
+        Вычисляет попарный IoU bbox'ов.
+
+        :param boxes_a: Bbox'ы ``N x 4`` в формате ``xyxy``.
+        :type boxes_a: numpy.ndarray
+        :param boxes_b: Bbox'ы ``M x 4`` в формате ``xyxy``.
+        :type boxes_b: numpy.ndarray
+        :return: Матрица IoU ``N x M``.
+        :rtype: numpy.ndarray
+        """
+        top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+        bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+        intersection = np.clip(bottom_right - top_left, 0, None).prod(axis=2)
+
+        area_a = (boxes_a[:, 2:] - boxes_a[:, :2]).prod(axis=1)
+        area_b = (boxes_b[:, 2:] - boxes_b[:, :2]).prod(axis=1)
+        union = area_a[:, None] + area_b[None, :] - intersection
+
+        return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+    def _class_metrics(
+        self,
+        confidences: np.ndarray,
+        pred_classes: np.ndarray,
+        true_positives: np.ndarray,
+        gt_counts: np.ndarray,
+    ) -> list[ClassMetrics]:
+        """
+        Вычисляет AP, precision и recall по классам.
+
+        AP вычисляется как площадь под огибающей кривой precision-recall
+        (интерполяция по всем точкам).
+
+        :param confidences: Уверенность всех детекций.
+        :type confidences: numpy.ndarray
+        :param pred_classes: Классы всех детекций.
+        :type pred_classes: numpy.ndarray
+        :param true_positives: Является ли каждая детекция верной.
+        :type true_positives: numpy.ndarray
+        :param gt_counts: Количество bbox'ов разметки по классам.
+        :type gt_counts: numpy.ndarray
+        :return: Метрики по классам в порядке индексов.
+        :rtype: list[ClassMetrics]
+        """
+        order = np.argsort(-confidences, kind="stable")
+        pred_classes, true_positives = pred_classes[order], true_positives[order]
+
+        metrics: list[ClassMetrics] = []
+        for class_id in range(self.num_classes):
+            tp = true_positives[pred_classes == class_id]
+            support = int(gt_counts[class_id])
+
+            tp_cum = np.cumsum(tp)
+            precision_curve = tp_cum / np.arange(1, len(tp) + 1)
+            recall_curve = tp_cum / support if support else np.zeros(len(tp))
+
+            ap = float("nan")
+            if support:
+                precision_env = np.concatenate(([0.0], precision_curve, [0.0]))
+                precision_env = np.flip(np.maximum.accumulate(np.flip(precision_env)))
+                recall_steps = np.diff(np.concatenate(([0.0], recall_curve, recall_curve[-1:] if len(tp) else [0.0])))
+                ap = float(np.sum(recall_steps * precision_env[1:]))
+
+            metrics.append(
+                ClassMetrics(
+                    label=self.class_names.get(class_id, str(class_id)),
+                    support=support,
+                    ap=ap,
+                    precision=float(tp.sum() / len(tp)) if len(tp) else 0.0,
+                    recall=float(tp.sum() / support) if support else 0.0,
+                )
+            )
+
+        return metrics
+
+    @staticmethod
+    def _read_sample(sample: tuple[Path, Path]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Считывает изображение и разметку сэмпла.
+
+        :param sample: Пути ``(изображение, метка)``.
+        :type sample: tuple[pathlib.Path, pathlib.Path]
+        :raises ValueError: Если изображение не удалось прочитать.
+        :return: RGB-изображение и разметка ``M x 5`` вида ``(class_id, x1, y1, x2, y2)``
+            в координатах изображения.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        image_path, label_path = sample
+
+        image = cv2.imread(str(image_path))
+        if image is None:
+            raise ValueError(f"Failed to read image: {image_path}")
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+        h, w = image.shape[:2]
+        gt = np.array(
+            [
+                (
+                    bbox.class_id,
+                    (bbox.x - bbox.w / 2) * w,
+                    (bbox.y - bbox.h / 2) * h,
+                    (bbox.x + bbox.w / 2) * w,
+                    (bbox.y + bbox.h / 2) * h,
+                )
+                for bbox in YOLOLabel(label_path).bboxes
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 5)
+
+        return image, gt
@@ -70,12 +70,10 @@ class YOLOSampleHandler:
         :rtype: list[str]
         """
         created: list[str] = []
-        for image_path in self._iter_images():
+        image_paths = self._iter_unlabeled_images() if skip_existing else self._iter_images()
+        for image_path in image_paths:
             label_path = self._get_label_path(image_path)
 
-            if label_path.exists() and skip_existing:
-                continue
-
             label_path.touch()
             created.append(str(label_path))
 
@@ -85,34 +83,22 @@ class YOLOSampleHandler:
         """
         Возвращает список изображений без меток.
 
-        :raises ValueError: Если не удалось сформировать путь до метки изображения.
         :return: Список путей до изображений без метки.
         :rtype: list[str]
         """
-        unlabeled: list[str] = []
-        for image_path in self._iter_images():
-            label_path = self._get_label_path(image_path)
-
-            if not label_path.exists():
-                unlabeled.append(str(image_path))
-
-        return unlabeled
+        return [str(image_path) for image_path in self._iter_unlabeled_images()]
 
     def remove_unlabeled_images(self) -> list[str]:
         """
         Удаляет изображения без меток.
 
-        :raises ValueError: Если не удалось сформировать путь до метки изображения.
         :return: Список путей удаленных файлов.
         :rtype: list[str]
         """
         removed: list[str] = []
-        for image_path in self._iter_images():
-            label_path = self._get_label_path(image_path)
-
-            if not label_path.exists():
-                removed.append(str(image_path))
-                image_path.unlink()
+        for image_path in self._iter_unlabeled_images():
+            removed.append(str(image_path))
+            image_path.unlink()
 
         return removed
 
@@ -183,6 +169,16 @@ class YOLOSampleHandler:
         for split in self.splits:
             yield from split.iter_images()
 
+    def _iter_unlabeled_images(self) -> Generator[Path, None, None]:
+        """
+        Итерируется по изображениям без меток во всех сплитах.
+
+        :return: Генератор путей к изображениям.
+        :rtype: Generator[pathlib.Path, None, None]
+        """
+        for split in self.splits:
+            yield from split.iter_unlabeled_images()
+
     def _iter_labels(self) -> Generator[Path, None, None]:
         """
         Итерируется по меткам во всех сплитах.
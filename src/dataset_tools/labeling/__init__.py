@@ -0,0 +1,6 @@
+from .pseudo import PseudoLabeler, PseudoLabelReport
+
+__all__ = [
+    "PseudoLabeler",
+    "PseudoLabelReport",
+]
@@ -0,0 +1,257 @@
+import shutil
+from pathlib import Path
+from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+
+import cv2
+import numpy as np
+from tqdm import tqdm
+
+from ...utils import IMAGE_EXTENSIONS, PathLike, prefetch_map
+from ..handlers import YOLOImageHandler
+from ...core.dto import Detection
+from ..structures import BBox, YOLOLabel
+from ...core.ports import BatchDetector
+
+
+@dataclass(frozen=True)
+class PseudoLabelReport:
+    """
+    Результат псевдоразметки директории изображений.
+
+    :var labelled: Количество изображений, для которых записаны метки.
+    :vartype labelled: int
+    :var review: Количество изображений, отправленных на ручную проверку.
+    :vartype review: int
+    :var skipped: Количество изображений, обработанных при предыдущих запусках.
+    :vartype skipped: int
+    :var failed: Пути изображений, которые не удалось прочитать.
+    :vartype failed: list[str]
+    """
+    labelled: int
+    review: int
+    skipped: int
+    failed: list[str]
+
+
+class PseudoLabeler:
+
+    def __init__(
+        self,
+        detector: BatchDetector,
+        confidence: float = 0.5,
+        review_confidence: float = 0.25,
+        batch_size: int = 16,
+        workers: int = 4,
+    ):
+        """
+        Инициализирует утилиту псевдоразметки изображений детектором.
+
+        :param detector: Детектор с пакетной обработкой изображений.
+        :type detector: BatchDetector
+        :param confidence: Минимальная уверенность bbox'а, записываемого в метку.
+        :type confidence: float, optional
+        :param review_confidence: Минимальная уверенность bbox'а, учитываемого при разметке.
+            Изображение с bbox'ом уверенностью ``[review_confidence, confidence)``
+            или без bbox'ов отправляется на ручную проверку.
+        :type review_confidence: float, optional
+        :param batch_size: Количество изображений в одном батче детектора.
+        :type batch_size: int, optional
+        :param workers: Количество потоков декодирования изображений.
+        :type workers: int, optional
+        """
+        self.detector = detector
+        self.confidence = confidence
+        self.review_confidence = review_confidence
+        self.batch_size = batch_size
+        self.workers = workers
+
+    def label_dir(
+        self,
+        images_dir: PathLike,
+        labels_dir: PathLike,
+        review_dir: PathLike,
+        image_ext: Iterable[str] = IMAGE_EXTENSIONS,
+        recursive: bool = False,
+        progress_bar: bool = True,
+    ) -> PseudoLabelReport:
+        """
+        Размечает изображения директории и записывает метки в формате YOLO.
+
+        Изображения, у которых все bbox'ы уверенные, получают метку в ``labels_dir``.
+        Остальные изображения копируются в ``review_dir/images``, а черновики их меток
+        (все bbox'ы не ниже :attr:`review_confidence`) - в ``review_dir/labels``.
+        Структура поддиректорий ``images_dir`` сохраняется. Изображения, для которых
+        уже есть метка или копия на проверке, пропускаются, поэтому прерванная
+        разметка продолжается повторным запуском.
+
+        :param images_dir: Директория с изображениями.
+        :type images_dir: PathLike
+        :param labels_dir: Директория для меток.
+        :type labels_dir: PathLike
+        :param review_dir: Директория изображений для ручной проверки.
+        :type review_dir: PathLike
+        :param image_ext: Расширения изображений.
+        :type image_ext: Iterable[str], optional
+        :param recursive: Обходить ли ``images_dir`` рекурсивно.
+        :type recursive: bool, optional
+        :param progress_bar: Включить ли индикатор выполнения. Шаг соответствует изображению.
+        :type progress_bar: bool, optional
+        :return: Результат псевдоразметки.
+        :rtype: PseudoLabelReport
+        """
+        images_dir, labels_dir, review_dir = Path(images_dir), Path(labels_dir), Path(review_dir)
+
+        image_paths = sorted(YOLOImageHandler(images_dir, image_ext, recursive).iter_files())
+
+        pending: list[Path] = []
+        for image_path in image_paths:
+            relative = image_path.relative_to(images_dir)
+            labelled = (labels_dir / relative).with_suffix(".txt").exists()
+            if not labelled and not (review_dir / "images" / relative).exists():
+                pending.append(image_path)
+
+        labelled = review = 0
+        failed: list[str] = []
+
+        batch_paths: list[Path] = []
+        batch_images: list[np.ndarray] = []
+
+        with tqdm(total=len(pending), desc="Псевдоразметка", disable=not progress_bar) as progress:
+            for image_path, image in self._decode(pending):
+                if image is None:
+                    failed.append(str(image_path))
+                    progress.update()
+                    continue
+
+                batch_paths.append(image_path)
+                batch_images.append(image)
+                if len(batch_images) < self.batch_size:
+                    continue
+
+                is_review = self._label_batch(batch_paths, batch_images, images_dir, labels_dir, review_dir)
+                review += sum(is_review)
+                labelled += len(is_review) - sum(is_review)
+                progress.update(len(batch_images))
+                batch_paths, batch_images = [], []
+
+            if batch_images:
+                is_review = self._label_batch(batch_paths, batch_images, images_dir, labels_dir, review_dir)
+                review += sum(is_review)
+                labelled += len(is_review) - sum(is_review)
+                progress.update(len(batch_images))
+
+        return PseudoLabelReport(
+            labelled=labelled,
+            review=review,
+            skipped=len(image_paths) - len(pending),
+            failed=failed,
+        )
+
+    def _label_batch(
+        self,
+        image_paths: list[Path],
+        images: list[np.ndarray],
+        images_dir: Path,
+        labels_dir: Path,
+        review_dir: Path,
+    ) -> list[bool]:
+        """
+        Размечает батч изображений и записывает метки или отправляет изображения на проверку.
+
+        :param image_paths: Пути изображений.
+        :type image_paths: list[pathlib.Path]
+        :param images: RGB-изображения.
+        :type images: list[numpy.ndarray]
+        :param images_dir: Директория с изображениями.
+        :type images_dir: pathlib.Path
+        :param labels_dir: Директория для меток.
+        :type labels_dir: pathlib.Path
+        :param review_dir: Директория изображений для ручной проверки.
+        :type review_dir: pathlib.Path
+        :return: Отправлено ли каждое изображение на проверку.
+        :rtype: list[bool]
+        """
+        is_review: list[bool] = []
+
+        for image_path, image, detections in zip(image_paths, images, self.detector.detect_batch(images)):
+            detections = [d for d in detections if d.confidence >= self.review_confidence]
+            uncertain = not detections or any(d.confidence < self.confidence for d in detections)
+
+            h, w = image.shape[:2]
+            bboxes = [self._to_bbox(detection, w, h) for detection in detections]
+            relative = image_path.relative_to(images_dir).with_suffix(".txt")
+
+            if uncertain:
+                # Копия изображения создается после черновика метки: по ней определяется,
+                # что изображение обработано
+                YOLOLabel(review_dir / "labels" / relative, bboxes).write()
+                review_image = review_dir / "images" / image_path.relative_to(images_dir)
+                review_image.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(image_path, review_image)
+            else:
+                YOLOLabel(labels_dir / relative, bboxes).write()
+
+            is_review.append(uncertain)
+
+        return is_review
+
+    def _decode(self, image_paths: list[Path]) -> Iterator[tuple[Path, np.ndarray | None]]:
+        """
+        Декодирует изображения в пуле потоков с упреждением на два батча.
+
+        :param image_paths: Пути изображений.
+        :type image_paths: list[pathlib.Path]
+        :return: Пары ``(путь, RGB-изображение)`` в порядке ``image_paths``.
+            Если изображение не удалось прочитать, вместо него возвращается ``None``.
+        :rtype: Iterator[tuple[pathlib.Path, numpy.ndarray | None]]
+        """
+        return prefetch_map(
+            self._read_image,
+            image_paths,
+            workers=self.workers,
+            depth=2 * self.batch_size,
+            thread_name_prefix="pseudo-decode",
+        )
+
+    @staticmethod
+    def _read_image(image_path: Path) -> np.ndarray | None:
+        """
+        Считывает изображение в формате RGB.
+
+        :param image_path: Путь до изображения.
+        :type image_path: pathlib.Path
+        :return: RGB-изображение ``H x W x C`` или ``None``, если изображение не удалось прочитать.
+        :rtype: numpy.ndarray | None
+        """
+        image = cv2.imread(str(image_path))
+        if image is None:
+            return None
+
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    @staticmethod
+    def _to_bbox(detection: Detection, width: int, height: int) -> BBox:
+        """
+        Преобразует детекцию в нормализованный bbox формата YOLO.
+
+        :param detection: Детекция в координатах изображения.
+        :type detection: Detection
+        :param width: Ширина изображения.
+        :type width: int
+        :param height: Высота изображения.
+        :type height: int
+        :return: Bbox ``(class_id, x, y, w, h)`` в диапазоне ``[0, 1]``.
+        :rtype: BBox
+        """
+        x1, y1, x2, y2 = detection.bbox
+        x1, x2 = max(x1, 0), min(x2, width)
+        y1, y2 = max(y1, 0), min(y2, height)
+
+        return BBox(
+            class_id=detection.class_id,
+            x=(x1 + x2) / 2 / width,
+            y=(y1 + y2) / 2 / height,
+            w=(x2 - x1) / width,
+            h=(y2 - y1) / height,
+        )
@@ -2,10 +2,13 @@ from .bbox import BBox
 from .label import YOLOLabel
 from .split import Split
 from .dataset import YOLODataset
+from .manifest import ManifestEntry, SplitManifest
 
 __all__ = [
     "Split",
     "BBox",
     "YOLOLabel",
     "YOLODataset",
+    "ManifestEntry",
+    "SplitManifest",
 ]
@@ -11,9 +11,13 @@ class YOLOLabel:
     bboxes: list[BBox] = field(default_factory=list)
 
     def __post_init__(self):
-        """Считывает bbox'ы из файла после создания объекта."""
+        """
+        Считывает bbox'ы из файла после создания объекта.
+        Если файл еще не создан, сохраняются переданные bbox'ы.
+        """
         self.path = Path(self.path)
-        self.bboxes = self.read()
+        if self.path.exists():
+            self.bboxes = self.read()
 
     def read(self) -> list[BBox]:
         """
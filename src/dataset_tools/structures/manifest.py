@@ -0,0 +1,205 @@
+import os
+import json
+import time
+from pathlib import Path
+from dataclasses import dataclass
+from collections.abc import Iterable
+
+from ...utils import PathLike, normalize_extensions
+
+MANIFEST_VERSION = 1
+
+# Директория, измененная позже этого срока до сканирования, сканируется повторно при следующем
+# обращении: изменения в пределах разрешения mtime файловой системы не меняют ее mtime
+MTIME_GRACE = 2.0
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """
+    Изображение сплита в манифесте.
+
+    :var name: Имя файла изображения в директории изображений.
+    :vartype name: str
+    :var size: Размер изображения (в байтах).
+    :vartype size: int
+    :var mtime: Время изменения изображения (в наносекундах).
+    :vartype mtime: int
+    :var labelled: Существует ли метка изображения.
+    :vartype labelled: bool
+    """
+    name: str
+    size: int
+    mtime: int
+    labelled: bool
+
+
+class SplitManifest:
+
+    def __init__(
+        self,
+        images_dir: PathLike,
+        labels_dir: PathLike,
+        image_ext: Iterable[str],
+        path: PathLike | None = None,
+    ):
+        """
+        Инициализирует индекс изображений и меток сплита, сохраняемый на диск.
+
+        Манифест хранит имена, размеры и время изменения изображений и наличие меток.
+        При обращении проверяется только время изменения директорий изображений и меток:
+        если оно не изменилось, используется сохраненный манифест. Иначе измененная
+        директория сканируется ``os.scandir``, а размер и время изменения изображений
+        обновляются, поэтому изображение, замененное под тем же именем, не остается
+        с устаревшими сведениями. Перезапись файла на месте не меняет время изменения
+        директории и обнаруживается только после :meth:`invalidate`.
+
+        :param images_dir: Директория с изображениями.
+        :type images_dir: PathLike
+        :param labels_dir: Директория с метками.
+        :type labels_dir: PathLike
+        :param image_ext: Расширения изображений.
+        :type image_ext: Iterable[str]
+        :param path: Путь до файла манифеста. По умолчанию ``.<images_dir.name>.manifest.json``
+            рядом с директорией изображений.
+        :type path: PathLike | None, optional
+        """
+        self.images_dir = Path(images_dir)
+        self.labels_dir = Path(labels_dir)
+        self.extensions = sorted(normalize_extensions({ext.lower() for ext in image_ext}))
+        self.path = Path(path) if path is not None else self.images_dir.parent / f".{self.images_dir.name}.manifest.json"
+
+        self._images_mtime: int | None = None
+        self._labels_mtime: int | None = None
+        self._entries: dict[str, ManifestEntry] = {}
+        self._loaded = False
+
+    def entries(self) -> list[ManifestEntry]:
+        """
+        Возвращает актуальные записи манифеста, обновляя его при изменении директорий.
+
+        :return: Записи изображений, отсортированные по имени.
+        :rtype: list[ManifestEntry]
+        """
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+
+        images_mtime = self.images_dir.stat().st_mtime_ns
+        labels_mtime = self.labels_dir.stat().st_mtime_ns if self.labels_dir.exists() else 0
+
+        images_changed = images_mtime != self._images_mtime
+        if images_changed or labels_mtime != self._labels_mtime:
+            self._refresh(images_changed)
+            self._images_mtime = self._trusted(images_mtime)
+            self._labels_mtime = self._trusted(labels_mtime)
+            self._save()
+
+        return list(self._entries.values())
+
+    def invalidate(self) -> None:
+        """Помечает манифест устаревшим: при следующем обращении директории будут просканированы."""
+        self._images_mtime = self._labels_mtime = None
+
+    def _refresh(self, images_changed: bool) -> None:
+        """
+        Сканирует директории сплита и обновляет записи.
+
+        :param images_changed: Изменилась ли директория изображений. Если нет,
+            обновляется только наличие меток.
+        :type images_changed: bool
+        """
+        labels = self._scan_labels()
+
+        if not images_changed:
+            self._entries = {
+                name: ManifestEntry(entry.name, entry.size, entry.mtime, os.path.splitext(name)[0] in labels)
+                for name, entry in self._entries.items()
+            }
+            return
+
+        entries: dict[str, ManifestEntry] = {}
+        with os.scandir(self.images_dir) as it:
+            for dir_entry in it:
+                if os.path.splitext(dir_entry.name)[1].lower() not in self.extensions:
+                    continue
+                if not dir_entry.is_file():
+                    continue
+
+                stat = dir_entry.stat()
+                labelled = os.path.splitext(dir_entry.name)[0] in labels
+                entries[dir_entry.name] = ManifestEntry(dir_entry.name, stat.st_size, stat.st_mtime_ns, labelled)
+
+        self._entries = dict(sorted(entries.items()))
+
+    def _scan_labels(self) -> set[str]:
+        """
+        Возвращает имена (без расширения) меток сплита.
+
+        :return: Множество имен файлов ``.txt`` в директории меток.
+        :rtype: set[str]
+        """
+        if not self.labels_dir.exists():
+            return set()
+
+        with os.scandir(self.labels_dir) as it:
+            return {
+                dir_entry.name[:-4]
+                for dir_entry in it
+                if dir_entry.name.endswith(".txt") and dir_entry.is_file()
+            }
+
+    def _load(self) -> None:
+        """Считывает манифест с диска. Отсутствующий, поврежденный или несовместимый манифест игнорируется."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != MANIFEST_VERSION or data.get("extensions") != self.extensions:
+            return
+
+        self._images_mtime = data["images_mtime"]
+        self._labels_mtime = data["labels_mtime"]
+        self._entries = {
+            name: ManifestEntry(name, size, mtime, labelled)
+            for name, size, mtime, labelled in zip(data["names"], data["sizes"], data["mtimes"], data["labelled"])
+        }
+
+    def _save(self) -> None:
+        """Атомарно записывает манифест на диск. Ошибка записи (например, только для чтения) игнорируется."""
+        entries = self._entries.values()
+        data = {
+            "version": MANIFEST_VERSION,
+            "extensions": self.extensions,
+            "images_mtime": self._images_mtime,
+            "labels_mtime": self._labels_mtime,
+            "names": [entry.name for entry in entries],
+            "sizes": [entry.size for entry in entries],
+            "mtimes": [entry.mtime for entry in entries],
+            "labelled": [entry.labelled for entry in entries],
+        }
+
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _trusted(mtime: int | None) -> int | None:
+        """
+        Возвращает время изменения директории, если ему можно доверять.
+
+        :param mtime: Время изменения директории (в наносекундах).
+        :type mtime: int | None
+        :return: ``mtime`` или ``None``, если директория изменена в пределах :data:`MTIME_GRACE`.
+        :rtype: int | None
+        """
+        if mtime is None or time.time_ns() - mtime < MTIME_GRACE * 1e9:
+            return None
+
+        return mtime
@@ -6,6 +6,7 @@ import fiftyone as fo
 
 from .label import YOLOLabel
 from ...utils import IMAGE_EXTENSIONS, LABEL_EXTENSIONS, PathLike
+from .manifest import ManifestEntry, SplitManifest
 
 
 @dataclass
@@ -30,6 +31,11 @@ class Split:
             self.labels_dir,
             self.labels_ext,
         )
+        self._manifest = SplitManifest(
+            self.images_dir,
+            self.labels_dir,
+            self.image_ext,
+        )
 
     @classmethod
     def from_dir(
@@ -65,10 +71,13 @@ class Split:
         """
         Итерируется по изображениям в сплите.
 
+        Изображения берутся из манифеста сплита (см. :meth:`get_manifest`).
+
         :return: Генератор путей до изображений.
         :rtype: Generator[pathlib.Path, None, None]
         """
-        yield from self._image_handler.iter_files()
+        for entry in self.get_manifest():
+            yield self.images_dir / entry.name
 
     def iter_labels(self) -> Generator[Path, None, None]:
         """
@@ -86,10 +95,35 @@ class Split:
         :return: Генератор путей до сэмплов (путь до изображения, путь до метки).
         :rtype: Generator[tuple[pathlib.Path, pathlib.Path], None, None]
         """
-        for image_path in self.iter_images():
-            label_path = self.get_label_path(image_path)
-            if label_path.exists():
-                yield image_path, label_path
+        for entry in self.get_manifest():
+            if entry.labelled:
+                image_path = self.images_dir / entry.name
+                yield image_path, self.get_label_path(image_path)
+
+    def iter_unlabeled_images(self) -> Generator[Path, None, None]:
+        """
+        Итерируется по изображениям без меток.
+
+        :return: Генератор путей до изображений.
+        :rtype: Generator[pathlib.Path, None, None]
+        """
+        for entry in self.get_manifest():
+            if not entry.labelled:
+                yield self.images_dir / entry.name
+
+    def get_manifest(self) -> list[ManifestEntry]:
+        """
+        Возвращает манифест сплита: имена, размеры и время изменения изображений и наличие меток.
+
+        Манифест сохраняется рядом с директорией изображений и обновляется только
+        при изменении директорий сплита, поэтому повторные обходы и подсчеты не
+        сканируют директории. Возвращаемый список не изменяется при последующем
+        изменении файлов сплита.
+
+        :return: Записи изображений, отсортированные по имени.
+        :rtype: list[ManifestEntry]
+        """
+        return self._manifest.entries()
 
     def exists(self) -> bool:
         """
@@ -108,7 +142,7 @@ class Split:
         :return: Количество изображений.
         :rtype: int
         """
-        return sum(1 for _ in self.iter_images())
+        return len(self.get_manifest())
 
     def count_labels(self) -> int:
         """
@@ -126,7 +160,7 @@ class Split:
         :return: Количество сэмплов.
         :rtype: int
         """
-        return sum(1 for _ in self.iter_samples())
+        return sum(entry.labelled for entry in self.get_manifest())
 
     def get_fiftyone_samples(self) -> list[fo.Sample]:
         """
@@ -67,7 +67,7 @@ class DatasetMerger:
         output_dir = Path(output_dir)
         merged_classes, merged_splits = self._get_base_dataset(output_dir)
 
-        # Подсчет общего количества сэмплов для прогресс-бара
+        # Подсчет общего количества сэмплов для прогресс-бара (по манифестам сплитов, без сканирования)
         total_samples = sum(sum(d.count_samples().values()) for d in self.datasets)
 
         # Объединение сплитов
@@ -237,7 +237,6 @@ class DatasetMerger:
             labels_dir.mkdir(parents=True, exist_ok=True)
 
             merged_splits[split_name] = Split(
-                name=split_name,
                 images_dir=images_dir,
                 labels_dir=labels_dir,
             )
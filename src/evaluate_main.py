@@ -0,0 +1,46 @@
+import argparse
+
+from src.app.parsers import parse_detector
+from src.app.bootstrap import load_config
+from src.app.factories import build_detector
+from src.dataset_tools.evaluation import DetectorEvaluator
+from src.dataset_tools.structures import YOLODataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Оценка точности и скорости детектора на сплите датасета")
+    parser.add_argument("--data", required=True, help="Путь к data.yaml датасета")
+    parser.add_argument("--split", default="val", help="Название сплита")
+    parser.add_argument("--batch-size", type=int, default=8, help="Количество изображений в батче детектора")
+    parser.add_argument("--workers", type=int, default=4, help="Количество потоков чтения изображений")
+    parser.add_argument("--iou", type=float, default=0.5, help="Минимальный IoU совпадения с разметкой")
+    args = parser.parse_args()
+
+    dataset = YOLODataset.from_yaml(args.data)
+    detector = build_detector(parse_detector(load_config("detector")))
+
+    evaluator = DetectorEvaluator(
+        detector,
+        dataset.class_names,
+        iou_threshold=args.iou,
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
+    report = evaluator.evaluate(dataset.get_split(args.split))
+
+    print(f"{'label':<24} {'support':>8} {'AP':>7} {'P':>7} {'R':>7}")
+    for metrics in report.classes:
+        print(
+            f"{metrics.label:<24} {metrics.support:>8} {metrics.ap:>7.3f} "
+            f"{metrics.precision:>7.3f} {metrics.recall:>7.3f}"
+        )
+    print(f"mAP@{args.iou}: {report.mean_ap:.3f}")
+    print(f"{report.images} images: {report.images_per_second:.1f} img/s, elapsed {report.elapsed:.1f} s")
+
+    print("confusion (rows - true, columns - predicted, last - background):")
+    for row in report.confusion:
+        print("  " + " ".join(f"{value:>6}" for value in row))
+
+
+if __name__ == "__main__":
+    main()
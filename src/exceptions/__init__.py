@@ -1,7 +1,10 @@
 from .camera import FrameSaveError, CameraOpenError, CameraReadError
+from .startup import ComponentStartError, ConfigValidationError
 
 __all__ = [
     "CameraOpenError",
     "CameraReadError",
     "FrameSaveError",
+    "ConfigValidationError",
+    "ComponentStartError",
 ]
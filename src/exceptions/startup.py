@@ -0,0 +1,6 @@
+class ConfigValidationError(ValueError):
+    pass
+
+
+class ComponentStartError(RuntimeError):
+    pass
@@ -1,7 +1,9 @@
+from .app.shutdown import install_signal_handlers
 from .app.bootstrap import bootstrap
 
 
 def main():
+    install_signal_handlers()
     pipeline = bootstrap()
 
     while True:
@@ -0,0 +1,47 @@
+import time
+import argparse
+from datetime import datetime
+
+from src.app.parsers import parse_pipeline
+from src.app.bootstrap import load_config
+from src.adapters.storage import OutcomeStore
+
+BUCKETS = {"hour": 3600.0, "day": 86400.0}
+
+
+def main():
+    pipeline_config = parse_pipeline(load_config("pipeline"))
+    default_path = pipeline_config.outcomes.path if pipeline_config.outcomes is not None else None
+
+    parser = argparse.ArgumentParser(description="Отчеты по итогам сессий проверки")
+    parser.add_argument("--db", default=default_path, required=default_path is None, help="Путь к базе итогов")
+    parser.add_argument("--days", type=float, default=7.0, help="Период отчета (в днях)")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("mismatch", help="Доля несоответствий по товарам")
+    latency = commands.add_parser("latency", help="Перцентили времени до решения по интервалам")
+    latency.add_argument("--bucket", choices=list(BUCKETS), default="hour", help="Длительность интервала")
+
+    args = parser.parse_args()
+
+    since = time.time() - args.days * 86400
+    store = OutcomeStore(args.db, retention_days=None)
+
+    try:
+        match args.command:
+            case "mismatch":
+                print(f"{'label':<24} {'total':>8} {'mismatch':>9} {'rate':>7}")
+                for rate in store.mismatch_rates(since):
+                    print(f"{rate.label:<24} {rate.total:>8} {rate.mismatches:>9} {rate.rate:>7.1%}")
+
+            case "latency":
+                print(f"{'start':<17} {'count':>7} {'p50, s':>8} {'p95, s':>8}")
+                for bucket in store.latency_buckets(BUCKETS[args.bucket], since):
+                    start = datetime.fromtimestamp(bucket.start).strftime("%Y-%m-%d %H:%M")
+                    print(f"{start:<17} {bucket.count:>7} {bucket.p50:>8.2f} {bucket.p95:>8.2f}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from .paths import normalize_to_paths, validate_paths_exist
 from .types import PathLike
 from .extensions import IMAGE_EXTENSIONS, LABEL_EXTENSIONS, normalize_extensions
-from .collections import normalize_class_mapping
+from .collections import deep_merge, normalize_class_mapping
+from .concurrency import prefetch_map
 
 __all__ = [
     "normalize_extensions",
@@ -11,4 +12,6 @@ __all__ = [
     "IMAGE_EXTENSIONS",
     "LABEL_EXTENSIONS",
     "normalize_class_mapping",
+    "deep_merge",
+    "prefetch_map",
 ]
@@ -1,3 +1,7 @@
+from typing import Any
+from collections.abc import Mapping
+
+
 def normalize_class_mapping(class_names: list[str] | dict[int, str]) -> dict[int, str]:
     """
     Приводит список или словарь классов к формату ``dict[int, str]``, где
@@ -18,3 +22,25 @@ def normalize_class_mapping(class_names: list[str] | dict[int, str]) -> dict[int
     raise TypeError(
         "class_names must be list[str] or dict[int, str]"
     )
+
+
+def deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Рекурсивно объединяет словари. Значения из ``override`` имеют приоритет,
+    вложенные словари объединяются по ключам.
+
+    :param base: Исходный словарь.
+    :type base: Mapping[str, Any]
+    :param override: Словарь с переопределяемыми значениями.
+    :type override: Mapping[str, Any]
+    :return: Новый объединенный словарь.
+    :rtype: dict[str, Any]
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+
+    return merged
@@ -0,0 +1,54 @@
+from typing import TypeVar
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+def prefetch_map(
+    fn: Callable[[ItemT], ResultT],
+    items: Iterable[ItemT],
+    workers: int = 4,
+    depth: int = 32,
+    thread_name_prefix: str = "prefetch",
+) -> Iterator[tuple[ItemT, ResultT]]:
+    """
+    Применяет функцию к элементам в пуле потоков с ограниченным упреждением.
+
+    В отличие от :meth:`ThreadPoolExecutor.map`, задачи ставятся не сразу для всех элементов,
+    а не более чем на ``depth`` элементов вперед, поэтому обработка большой директории
+    не держит в памяти все результаты.
+
+    :param fn: Функция обработки элемента (например, декодирование изображения).
+    :type fn: Callable[[ItemT], ResultT]
+    :param items: Элементы.
+    :type items: Iterable[ItemT]
+    :param workers: Количество потоков.
+    :type workers: int, optional
+    :param depth: Максимальное количество элементов, обрабатываемых с упреждением.
+    :type depth: int, optional
+    :param thread_name_prefix: Префикс имен потоков пула.
+    :type thread_name_prefix: str, optional
+    :return: Пары ``(элемент, результат)`` в порядке ``items``.
+    :rtype: Iterator[tuple[ItemT, ResultT]]
+    """
+    items = iter(items)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as pool:
+        pending: deque[tuple[ItemT, Future]] = deque()
+
+        for item in items:
+            pending.append((item, pool.submit(fn, item)))
+            if len(pending) >= depth:
+                break
+
+        while pending:
+            item, future = pending.popleft()
+
+            for next_item in items:
+                pending.append((next_item, pool.submit(fn, next_item)))
+                break
+
+            yield item, future.result()